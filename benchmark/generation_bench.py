@@ -0,0 +1,75 @@
+"""
+Temps de génération des différents algorithmes, sans animation (comme en
+mode sans affichage, cf main.py --headless), pour plusieurs tailles.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.generation_bench [largeur1 largeur2 ...]
+"""
+
+from environment.maze import Maze
+from environment.random_streams import RandomStreams
+
+import generation.binary_tree
+import generation.kruskal
+import generation.prim
+import generation.recursive_backtracker_gen
+import generation.recursive_division
+import generation.sidewinder
+
+import contextlib
+import os
+import sys
+import time
+
+GENERATIONS = (("Kruskal", generation.kruskal.Generation),
+               ("Backtracker", generation.recursive_backtracker_gen.Generation),
+               ("Prim", generation.prim.Generation),
+               ("Binary tree", generation.binary_tree.Generation),
+               ("Sidewinder", generation.sidewinder.Generation),
+               ("Division", generation.recursive_division.Generation))
+# Algorithmes comparés
+
+OPTIONS = {"slow": False, "start_in_corner": False, "end_in_corner": False, "wall_ratio": 100, "verbose": False, "streams": RandomStreams(0)}
+# Sans animation, sans lire settings.cfg, toujours avec la même graine
+
+def measure(Generation:type, width:int) -> float:
+    """
+    Fonction mesurant une génération, toujours avec la même graine.
+
+    INPUT :
+        Generation : classe de l'algorithme
+        width : int, largeur et hauteur du labyrinthe
+
+    OUTPUT :
+        float, temps en secondes
+    """
+
+    maze = Maze(width, width)
+    maze.recording = False
+    maze.adjacency
+    # La table des voisines n'est construite qu'une fois par taille
+
+    gen = Generation(**OPTIONS)
+
+    time_0 = time.perf_counter()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        gen.start(maze)
+        # Les statistiques de fin ne nous intéressent pas
+
+    return time.perf_counter() - time_0
+
+def main(widths:list) -> None:
+    print("{0:>6} {1:>14} {2:>12} {3:>16}".format("taille", "algorithme", "temps (s)", "par cellule (µs)"))
+
+    for width in widths:
+        for name, Generation in GENERATIONS:
+            duration = measure(Generation, width)
+
+            print("{0:>6} {1:>14} {2:>12.2f} {3:>16.2f}".format(width, name, duration, 10**6*duration/width**2))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main([100, 1000, 3000])
@@ -0,0 +1,123 @@
+"""
+Comparaison des politiques de choix du growing tree (cf
+generation/growing_tree.py) : temps de génération et aspect du labyrinthe
+obtenu.
+
+    - impasses : cellules avec une seule ouverture
+    - carrefours : cellules avec au moins 3 ouvertures
+    - tout droit : cellules traversées en ligne droite
+    - chemin : longueur du chemin entre deux coins opposés, en cellules
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.growing_tree_bench [largeur]
+"""
+
+from environment.maze import Maze
+from environment.random_streams import RandomStreams
+from generation.growing_tree import Generation
+
+from collections import deque
+import contextlib
+import os
+import sys
+import time
+
+VARIANTS = (("NEWEST", 75, 0),
+            ("NEWEST", 75, 50),
+            ("NEWEST", 75, 90),
+            ("OLDEST", 75, 0),
+            ("RANDOM", 75, 0),
+            ("MIXED", 75, 0),
+            ("MIXED", 25, 0))
+# Politique, pourcentage de NEWEST pour MIXED, biais (pourcentage de
+# chances de continuer tout droit)
+
+OPTIONS = {"slow": False, "start_in_corner": False, "end_in_corner": False, "wall_ratio": 100, "verbose": False, "streams": RandomStreams(0)}
+# Sans animation, sans lire settings.cfg, toujours avec la même graine
+
+def measure(width:int, policy:str, mix:float, straight_bias:float) -> (float, Maze):
+    """
+    Fonction mesurant une génération, toujours avec la même graine.
+
+    INPUT :
+        width : int, largeur et hauteur du labyrinthe
+        policy, mix, straight_bias : paramètres du growing tree
+
+    OUTPUT :
+        tuple (temps en secondes, labyrinthe obtenu)
+    """
+
+    maze = Maze(width, width)
+    maze.recording = False
+    maze.adjacency
+    # La table des voisines n'est construite qu'une fois par taille
+
+    gen = Generation(policy=policy, mix=mix, straight_bias=straight_bias, **OPTIONS)
+
+    time_0 = time.perf_counter()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        gen.start(maze)
+
+    return (time.perf_counter() - time_0, maze)
+
+def statistics(maze:Maze) -> tuple:
+    """
+    Fonction calculant l'aspect d'un labyrinthe
+
+    INPUT :
+        maze : Maze, labyrinthe parfait
+
+    OUTPUT :
+        tuple (pourcentage d'impasses, de carrefours, de cellules tout droit,
+        longueur du chemin entre les coins en haut à gauche et en bas à
+        droite)
+    """
+
+    neighbors = maze.adjacency.neighbors
+    walls = maze.adjacency.walls
+    cell_count = maze.width*maze.height
+
+    dead_ends = junctions = straights = 0
+    open_neighbors = []
+
+    for i in range(cell_count):
+        opened = [d for d in range(4) if neighbors[4*i + d] != -1 and maze.wallState(walls[4*i + d]) != Maze.WALL]
+        open_neighbors.append([neighbors[4*i + d] for d in opened])
+
+        if len(opened) == 1:
+            dead_ends += 1
+        elif len(opened) >= 3:
+            junctions += 1
+        elif opened[1] - opened[0] == 2:
+            straights += 1
+            # Directions opposées, cf environment/direction.py
+
+    distance = [-1]*cell_count
+    distance[0] = 0
+    cells = deque([0])
+
+    while cells:
+        i = cells.popleft()
+
+        for n in open_neighbors[i]:
+            if distance[n] == -1:
+                distance[n] = distance[i] + 1
+                cells.append(n)
+
+    return (100*dead_ends/cell_count, 100*junctions/cell_count, 100*straights/cell_count, distance[-1])
+
+def main(width:int) -> None:
+    print("Labyrinthe {0}x{0}".format(width))
+    print("{0:>8} {1:>5} {2:>11} {3:>10} {4:>10} {5:>12} {6:>12} {7:>8}".format(
+        "politique", "mix", "biais", "temps (s)", "impasses", "carrefours", "tout droit", "chemin"))
+
+    for policy, mix, straight_bias in VARIANTS:
+        duration, maze = measure(width, policy, mix, straight_bias)
+        dead_ends, junctions, straights, path_length = statistics(maze)
+
+        print("{0:>8} {1:>5} {2:>10}% {3:>10.2f} {4:>9.1f}% {5:>11.1f}% {6:>11.1f}% {7:>8}".format(
+            policy, mix if policy == "MIXED" else "", straight_bias, duration, dead_ends, junctions, straights, path_length))
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
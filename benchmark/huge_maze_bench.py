@@ -0,0 +1,85 @@
+"""
+Mémoire utilisée par la génération d'un labyrinthe en stockage BITPLANE (cf
+environment/storage.py), sans enregistrement pour l'affichage (comme en mode
+sans affichage) : la grille elle-même, puis le pic de mémoire de chaque
+algorithme, en octets par cellule, extrapolés à un labyrinthe 20000x20000.
+
+La grille ne prend qu'un quart d'octet par cellule, mais la plupart des
+algorithmes gardent des tableaux par cellule (cellules visitées, ensembles
+de Kruskal...) : c'est eux qui fixent la vraie limite. La mémoire d'Eller
+ne dépend que de la largeur : l'extrapolation la surestime.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.huge_maze_bench [largeur]
+"""
+
+from environment.maze import Maze
+from environment.random_streams import RandomStreams
+
+import generation.eller
+import generation.growing_tree
+import generation.kruskal
+import generation.prim
+import generation.recursive_backtracker_gen
+
+import contextlib
+import os
+import sys
+import tracemalloc
+
+GENERATIONS = (("Eller", generation.eller.Generation, {}),
+               ("Backtracker", generation.recursive_backtracker_gen.Generation, {}),
+               ("Prim", generation.prim.Generation, {}),
+               ("Growing tree", generation.growing_tree.Generation, {"policy": "NEWEST", "mix": 0, "straight_bias": 0}),
+               ("Kruskal", generation.kruskal.Generation, {}))
+# Algorithmes mesurés, avec leurs paramètres propres
+
+OPTIONS = {"slow": False, "start_in_corner": False, "end_in_corner": False, "wall_ratio": 100, "verbose": False, "streams": RandomStreams(0)}
+# Sans animation, sans lire settings.cfg, toujours avec la même graine
+
+TARGET = 20000
+# Taille de l'extrapolation
+
+def measure(Generation:type, options:dict, width:int) -> (float, float):
+    """
+    Fonction mesurant la mémoire d'une génération.
+
+    INPUT :
+        Generation : classe de l'algorithme
+        options : dict, paramètres propres à l'algorithme
+        width : int, largeur et hauteur du labyrinthe
+
+    OUTPUT :
+        tuple (octets par cellule de la grille, octets par cellule en plus
+        au pic de la génération)
+    """
+
+    tracemalloc.start()
+
+    maze = Maze(width, width, "BITPLANE")
+    maze.recording = False
+
+    grid_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+
+    gen = Generation(**options, **OPTIONS)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        gen.start(maze)
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (grid_size/width**2, (peak - grid_size)/width**2)
+
+def main(width:int) -> None:
+    print("Labyrinthe {0}x{0}, extrapolation à {1}x{1}".format(width, TARGET))
+    print("{0:>12} {1:>16} {2:>20} {3:>16}".format("algorithme", "grille (o/cell)", "génération (o/cell)", "total (Go)"))
+
+    for name, Generation, options in GENERATIONS:
+        grid, extra = measure(Generation, options, width)
+
+        print("{0:>12} {1:>16.2f} {2:>20.2f} {3:>16.2f}".format(name, grid, extra, (grid + extra)*TARGET**2/10**9))
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
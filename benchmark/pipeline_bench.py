@@ -0,0 +1,125 @@
+"""
+Temps avant la première frame et mémoire maximale de l'animation, selon que
+la génération et la résolution sont faites avant l'affichage ou dans un
+thread pendant l'affichage (cf environment/pipeline.py).
+
+L'affichage est simulé par un Player qui lit les frames aussi vite que
+possible, sans rien dessiner.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.pipeline_bench [largeur1 largeur2 ...]
+"""
+
+from environment.maze import Maze
+from environment.random_streams import RandomStreams
+from environment.pipeline import FrameQueue
+from environment.player import Player
+from generation.recursive_backtracker_gen import Generation
+from resolution.recursive_backtracker_res import Resolution
+
+import contextlib
+import os
+import sys
+import time
+import tracemalloc
+
+QUEUE_SIZE = 256
+# Nombre maximal de frames en attente (cf PIPELINE_SIZE dans settings.cfg)
+
+GEN_OPTIONS = {"slow": True, "start_in_corner": False, "end_in_corner": False, "wall_ratio": 100, "verbose": False, "streams": RandomStreams(0)}
+RES_OPTIONS = {"slow": True, "verbose": False, "streams": RandomStreams(0)}
+# Animation pas à pas, sans lire settings.cfg, toujours avec la même graine
+
+def buffered(width:int) -> (float, float):
+    """
+    Fonction calculant toute l'animation avant de la rejouer.
+
+    INPUT :
+        width : int, largeur et hauteur du labyrinthe
+
+    OUTPUT :
+        tuple (temps avant la première frame, temps total), en secondes
+    """
+
+    time_0 = time.perf_counter()
+
+    maze = Maze(width, width)
+    Generation(**GEN_OPTIONS).start(maze)
+    Resolution(**RES_OPTIONS).start(maze)
+    maze.resetForDisplay()
+
+    player = Player(maze)
+    player.stepForward()
+
+    first = time.perf_counter() - time_0
+
+    while player.stepForward():
+        pass
+
+    return (first, time.perf_counter() - time_0)
+
+def pipelined(width:int) -> (float, float):
+    """
+    Fonction rejouant l'animation pendant qu'elle est calculée.
+
+    Cf buffered
+    """
+
+    time_0 = time.perf_counter()
+
+    maze = Maze(width, width)
+    display_maze = Maze(width, width)
+
+    frames = FrameQueue(QUEUE_SIZE)
+    display_maze.modified_cells = frames
+    frames.start(maze, [Generation(**GEN_OPTIONS), Resolution(**RES_OPTIONS)])
+
+    player = Player(display_maze)
+
+    while not player.stepForward():
+        time.sleep(0)
+
+    first = time.perf_counter() - time_0
+
+    while not player.isFinished():
+        if not player.stepForward():
+            time.sleep(0)
+            # On laisse la main au producteur
+
+    frames.thread.join()
+
+    return (first, time.perf_counter() - time_0)
+
+def measure(run:'function', width:int) -> (float, float, float):
+    """
+    Fonction mesurant une exécution, toujours avec la même graine.
+
+    OUTPUT :
+        tuple (première frame en ms, total en ms, mémoire maximale en Mo)
+    """
+
+    tracemalloc.start()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        first, total = run(width)
+        # Les algorithmes affichent leurs statistiques
+
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (1000*first, 1000*total, peak/10**6)
+
+def main(widths:list) -> None:
+    print("{0:>6} {1:>10} {2:>16} {3:>12} {4:>14}".format("taille", "mode", "1re frame (ms)", "total (ms)", "mémoire (Mo)"))
+
+    for width in widths:
+        for name, run in (("avant", buffered), ("pipeline", pipelined)):
+            first, total, peak = measure(run, width)
+
+            print("{0:>6} {1:>10} {2:>16.1f} {3:>12.1f} {4:>14.2f}".format(width, name, first, total, peak))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main([50, 100])
@@ -0,0 +1,89 @@
+"""
+Micro-benchmarks de la classe Position (cf environment/position.py) :
+création, arithmétique, hash, égalité et mémoire occupée.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.position_bench [nombre de répétitions]
+"""
+
+from environment.position import Position
+from environment.direction import Direction
+
+import sys
+import timeit
+import tracemalloc
+
+def measure(name:str, statement:str, namespace:dict, number:int) -> None:
+    """
+    Procédure affichant le temps moyen d'une instruction.
+
+    INPUT :
+        name : str, nom affiché
+        statement : str, instruction à mesurer
+        namespace : dict, variables utilisées par l'instruction
+        number : int, nombre de répétitions
+    """
+
+    t = min(timeit.repeat(statement, globals=namespace, number=number, repeat=3))
+
+    print("{0:<28} {1:>8.1f} ns".format(name, 10**9*t/number))
+
+def measureMemory(name:str, create:'function', count:int) -> None:
+    """
+    Procédure affichant la mémoire occupée par count positions.
+
+    INPUT :
+        name : str, nom affiché
+        create : fonction, crée la position d'indice i
+        count : int, nombre de positions
+    """
+
+    tracemalloc.start()
+
+    positions = [create(i) for i in range(count)]
+
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print("{0:<28} {1:>8.1f} octets / position".format(name, size/count))
+
+    del positions
+
+def main(number:int) -> None:
+    namespace = {"Position"  : Position,
+                 "Direction" : Direction,
+                 "p"         : Position((3, 4)),
+                 "q"         : Position((3, 4)),
+                 "d"         : Direction.RIGHT,
+                 "t"         : (1, 1),
+                 "table"     : {Position((3, 4)): 0}}
+
+    print("Arithmétique")
+    measure("Position((x, y))", "Position((3, 4))", namespace, number)
+    measure("p + Direction", "p + d", namespace, number)
+    measure("p + tuple", "p + t", namespace, number)
+    measure("p * 2", "p * 2", namespace, number)
+    measure("p / 2", "p / 2", namespace, number)
+
+    print("\nHash et égalité")
+    measure("hash(p)", "hash(p)", namespace, number)
+    measure("p == q", "p == q", namespace, number)
+    measure("p == tuple", "p == (3, 4)", namespace, number)
+    measure("dict[p]", "table[p]", namespace, number)
+
+    print("\nCache")
+    Position.enableInterning(100, 100)
+    measure("Position.interned(x, y)", "Position.interned(3, 4)", namespace, number)
+
+    print("\nMémoire")
+    width = 300
+    measureMemory("Position((x, y))", lambda i: Position((i%width, i//width)), width*width)
+    measureMemory("Position.interned, 2 fois", lambda i: Position.interned(i%100, (i//100)%100), 2*100*100)
+
+    Position.disableInterning()
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main(int(sys.argv[1]))
+    else:
+        main(200000)
@@ -0,0 +1,139 @@
+"""
+Temps de rejeu et mémoire des modifications enregistrées (cf Maze.modifyCell
+et environment/change_log.py), pour plusieurs tailles de labyrinthe : le
+temps par modification doit rester constant, le rejeu complet étant linéaire
+en le nombre de modifications.
+
+Puis temps de rejeu en fusionnant plusieurs frames à la fois (cf
+Player.coalesceForward) : seule la dernière modification de chaque case est
+écrite.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.replay_bench [largeur1 largeur2 ...]
+"""
+
+from environment.maze import Maze
+from environment.player import Player
+
+import sys
+import time
+
+COALESCE = (1, 10, 100)
+# Nombre de frames fusionnées à la fois (cf Player.coalesceForward)
+
+FRAME_SIZES = (4, 0)
+# Nombre de cellules par frame : 4 comme une génération en mode lent, 0 pour
+# une seule frame contenant tout (comme Maze.resetAll)
+
+def record(maze:Maze, frame_size:int) -> int:
+    """
+    Fonction enregistrant deux modifications par cellule et une par mur
+    intérieur, regroupées par frames.
+
+    INPUT :
+        maze : Maze, labyrinthe où enregistrer
+        frame_size : int, nombre de cellules par frame, 0 pour une seule frame
+
+    OUTPUT :
+        int, nombre de modifications enregistrées
+    """
+
+    count = 0
+
+    for i in range(maze.width*maze.height):
+        maze.setCellState(i, Maze.ORANGE_CELL)
+        maze.setCellState(i, Maze.YELLOW_CELL)
+        count += 2
+        # Comme les générateurs en mode lent : orange puis jaune
+
+        if i%maze.width != maze.width-1:
+            maze.setWallRight(i, Maze.EMPTY)
+            count += 1
+
+        if i//maze.width != maze.height-1:
+            maze.setWallDown(i, Maze.EMPTY)
+            count += 1
+
+        if frame_size != 0 and i%frame_size == 0:
+            maze.syncModifiedCells()
+
+    maze.syncModifiedCells()
+
+    return count
+
+def replay(maze:Maze) -> float:
+    """
+    Fonction rejouant toutes les modifications enregistrées.
+
+    INPUT :
+        maze : Maze, labyrinthe à rejouer
+
+    OUTPUT :
+        float, temps en secondes
+    """
+
+    time_0 = time.perf_counter()
+
+    while maze.modifyCell():
+        pass
+
+    return time.perf_counter() - time_0
+
+def replayCoalesced(maze:Maze, count:int) -> (float, int):
+    """
+    Fonction rejouant toutes les modifications enregistrées, count frames à
+    la fois, comme l'affichage quand il est en retard.
+
+    INPUT :
+        maze : Maze, labyrinthe à rejouer
+        count : int, nombre de frames fusionnées à la fois
+
+    OUTPUT :
+        tuple (temps en secondes, nombre de cases écrites)
+    """
+
+    player = Player(maze)
+    written = 0
+
+    time_0 = time.perf_counter()
+
+    while True:
+        frames, _, n = player.coalesceForward(count)
+        written += n
+
+        if frames == 0:
+            break
+
+    return (time.perf_counter() - time_0, written)
+
+def main(widths:list) -> None:
+    print("{0:>6} {1:>8} {2:>12} {3:>12} {4:>16} {5:>16}".format("taille", "frame", "modifs", "rejeu (ms)", "par modif (ns)", "par modif (o)"))
+
+    for width in widths:
+        for frame_size in FRAME_SIZES:
+            maze = Maze(width, width)
+
+            count = record(maze, frame_size)
+            size = maze.modified_cells.memorySize()
+            duration = replay(maze)
+
+            print("{0:>6} {1:>8} {2:>12} {3:>12.1f} {4:>16.1f} {5:>16.1f}".format(width, frame_size or "unique", count, 1000*duration, 10**9*duration/count, size/count))
+
+    print()
+    print("{0:>6} {1:>8} {2:>12} {3:>12} {4:>12}".format("taille", "fusion", "modifs", "écritures", "rejeu (ms)"))
+
+    for width in widths:
+        maze = Maze(width, width)
+        count = record(maze, FRAME_SIZES[0])
+
+        for coalesce in COALESCE:
+            maze.resetForDisplay()
+            duration, written = replayCoalesced(maze, coalesce)
+
+            print("{0:>6} {1:>8} {2:>12} {3:>12} {4:>12.1f}".format(width, coalesce, count, written, 1000*duration))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main([50, 100, 200, 400])
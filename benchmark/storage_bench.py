@@ -0,0 +1,111 @@
+"""
+Comparaison des moteurs de stockage de la grille (cf environment/storage.py) :
+mémoire occupée et coût d'un accès, pour plusieurs tailles de labyrinthe.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.storage_bench [largeur1 largeur2 ...]
+"""
+
+from environment.storage import ALL_STORAGES, MmapStorage, createStorage
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+WALL = 31
+EMPTY = 21
+# Mêmes valeurs que Map.WALL et Map.EMPTY
+
+NB_ACCESS = 200000
+# Nombre d'accès mesurés par taille
+
+MMAP_PATH = os.path.join(tempfile.gettempdir(), "storage_bench.map")
+# Fichier temporaire du stockage MMAP
+
+def measureMemory(name:str, real_width:int, real_height:int) -> (object, int):
+    """
+    Fonction créant un stockage et mesurant la mémoire allouée pour celà.
+
+    INPUT :
+        name : str, nom du stockage
+        real_width : int, largeur réelle
+        real_height : int, hauteur réelle
+
+    OUTPUT :
+        tuple (stockage, taille en octets)
+    """
+
+    options = {}
+
+    if name == MmapStorage.STORAGE_NAME:
+        options["path"] = MMAP_PATH
+
+    tracemalloc.start()
+
+    storage = createStorage(name, real_width, real_height, WALL, EMPTY, **options)
+
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return storage, size
+
+def measureAccess(storage:object, coords:list) -> (float, float):
+    """
+    Fonction mesurant le temps moyen d'une lecture et d'une écriture.
+
+    INPUT :
+        storage : GenericStorage, stockage à tester
+        coords : list tuple, positions réelles (x, y) à lire et écrire
+
+    OUTPUT :
+        tuple (lecture en ns, écriture en ns)
+    """
+
+    get = storage.get
+    set = storage.set
+
+    time_0 = time.perf_counter()
+
+    for x, y in coords:
+        get(x, y)
+
+    time_1 = time.perf_counter()
+
+    for x, y in coords:
+        set(x, y, EMPTY)
+
+    time_2 = time.perf_counter()
+
+    return (10**9*(time_1-time_0)/len(coords), 10**9*(time_2-time_1)/len(coords))
+
+def main(widths:list) -> None:
+    random.seed(0)
+
+    print("{0:>6} {1:>8} {2:>12} {3:>12} {4:>12}".format("taille", "type", "mémoire (Mo)", "lecture (ns)", "écriture (ns)"))
+
+    for width in widths:
+        real_width = 2*width + 1
+        real_height = 2*width + 1
+
+        coords = [(random.randrange(real_width), random.randrange(real_height)) for _ in range(NB_ACCESS)]
+
+        for name in ALL_STORAGES:
+            storage, size = measureMemory(name, real_width, real_height)
+            t_get, t_set = measureAccess(storage, coords)
+
+            print("{0:>6} {1:>8} {2:>12.1f} {3:>12.1f} {4:>12.1f}".format(width, name, size/2**20, t_get, t_set))
+
+            storage.close()
+            del storage
+
+    if os.path.exists(MMAP_PATH):
+        os.remove(MMAP_PATH)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main([100, 500, 1000, 2000])
@@ -0,0 +1,69 @@
+"""
+Accélération de la génération par tuiles (cf generation/tiled.py) selon le
+nombre de processus, de 1 au nombre de processeurs.
+
+Le labyrinthe obtenu est le même quel que soit le nombre de processus, ce
+qui est aussi vérifié ici.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.tiled_bench [largeur [taille des tuiles]]
+"""
+
+from environment.maze import Maze
+from environment.random_streams import RandomStreams
+from generation.tiled import Generation
+
+import contextlib
+import os
+import sys
+import time
+
+OPTIONS = {"slow": False, "start_in_corner": False, "end_in_corner": False, "wall_ratio": 100, "verbose": False, "streams": RandomStreams(0)}
+# Sans animation, sans lire settings.cfg, toujours avec la même graine
+
+def measure(width:int, tile_size:int, workers:int) -> (float, bytes):
+    """
+    Fonction mesurant une génération, toujours avec la même graine.
+
+    INPUT :
+        width : int, largeur et hauteur du labyrinthe
+        tile_size : int, taille des tuiles
+        workers : int, nombre de processus
+
+    OUTPUT :
+        tuple (temps en secondes, grille obtenue)
+    """
+
+    maze = Maze(width, width)
+    maze.recording = False
+
+    gen = Generation(tile_size=tile_size, workers=workers, **OPTIONS)
+
+    time_0 = time.perf_counter()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        gen.start(maze)
+
+    return (time.perf_counter() - time_0, maze.map.snapshot())
+
+def main(width:int, tile_size:int) -> None:
+    print("Labyrinthe {0}x{0}, tuiles de {1}x{1}".format(width, tile_size))
+    print("{0:>10} {1:>12} {2:>14}".format("processus", "temps (s)", "accélération"))
+
+    reference = None
+
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        duration, grid = measure(width, tile_size, workers)
+
+        if reference is None:
+            reference = (duration, grid)
+
+        assert grid == reference[1], "Labyrinthe différent avec {0} processus".format(workers)
+
+        print("{0:>10} {1:>12.2f} {2:>14.2f}".format(workers, duration, reference[0]/duration))
+
+if __name__ == "__main__":
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    tile_size = int(sys.argv[2]) if len(sys.argv) > 2 else 256
+
+    main(width, tile_size)
@@ -0,0 +1,96 @@
+"""
+Passage à l'échelle des Union-Find (cf environment/union_find.py) : temps par
+union et par find, de 10^3 à 10^7 éléments.
+
+UnionFind (dictionnaire, find récursif, sans union par taille) n'est mesuré
+que jusqu'à DICT_MAX éléments : au-delà, il est trop lent, ou dépasse la
+limite de récursion.
+
+Utilisation, depuis la racine du projet :
+    python -m benchmark.union_find_bench [nombre d'éléments 1 ...]
+"""
+
+from environment.union_find import IntUnionFind, UnionFind
+
+import random
+import sys
+import time
+
+DICT_MAX = 10**5
+# Nombre maximal d'éléments pour UnionFind
+
+def randomPairs(size:int) -> list:
+    """
+    Fonction retournant size couples d'éléments aléatoires, toujours les mêmes
+    pour une taille donnée.
+
+    INPUT :
+        size : int, nombre d'éléments
+
+    OUTPUT :
+        list de tuples (i, j)
+    """
+
+    rng = random.Random(size)
+    elements = range(size)
+
+    return list(zip(rng.choices(elements, k=size), rng.choices(elements, k=size)))
+
+def measure(union_find:object, pairs:list, batch:bool) -> (float, float):
+    """
+    Fonction mesurant toutes les unions, puis un find par élément.
+
+    INPUT :
+        union_find : IntUnionFind ou UnionFind, structure vide
+        pairs : list, couples à unir
+        batch : bool, si unionMany et findMany doivent être utilisées
+
+    OUTPUT :
+        tuple (ns par union, ns par find)
+    """
+
+    time_0 = time.perf_counter()
+
+    if batch:
+        union_find.unionMany(pairs)
+    else:
+        for i, j in pairs:
+            union_find.union(i, j)
+
+    time_1 = time.perf_counter()
+
+    if batch:
+        union_find.findMany(range(len(pairs)))
+    else:
+        for i in range(len(pairs)):
+            union_find.find(i)
+
+    time_2 = time.perf_counter()
+
+    return (10**9*(time_1-time_0)/len(pairs), 10**9*(time_2-time_1)/len(pairs))
+
+def main(sizes:list) -> None:
+    print("{0:>10} {1:>14} {2:>16} {3:>16}".format("éléments", "structure", "union (ns)", "find (ns)"))
+
+    for size in sizes:
+        pairs = randomPairs(size)
+
+        for name, create, batch in (("dict", lambda: UnionFind(*range(size)), False),
+                                    ("array", lambda: IntUnionFind(size), False),
+                                    ("array, lots", lambda: IntUnionFind(size), True)):
+            if name == "dict" and size > DICT_MAX:
+                continue
+
+            try:
+                union_time, find_time = measure(create(), pairs, batch)
+            except RecursionError:
+                print("{0:>10} {1:>14} {2:>16}".format(size, name, "RecursionError"))
+                continue
+
+            print("{0:>10} {1:>14} {2:>16.1f} {3:>16.1f}".format(size, name, union_time, find_time))
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main([int(arg) for arg in sys.argv[1:]])
+    else:
+        main([10**3, 10**4, 10**5, 10**6, 10**7])
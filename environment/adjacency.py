@@ -0,0 +1,184 @@
+from array import array
+import functools
+
+class Adjacency:
+    """
+    Table des voisines d'un labyrinthe de taille donnée, calculée une seule
+    fois (cf getAdjacency) et partagée par tous les algorithmes.
+
+    Pour la cellule d'indice i et la direction d'indice d (cf Direction.id),
+    à la case 4*i + d :
+        neighbors : indice de la cellule voisine
+        walls : indice du mur entre les deux cellules (cf Maze.wallState)
+    Les voisines hors du plateau sont déjà retirées : elles valent -1 dans
+    les deux tables. Un pas d'algorithme n'est alors qu'une lecture de
+    tableau, sans calcul de coordonnées ni test de bord.
+    """
+
+    def __init__(self, width:int, height:int) -> None:
+        """
+        Construit les tables par tranches, sans boucle sur chaque cellule.
+
+        INPUT :
+            width : int, largeur du labyrinthe
+            height : int, hauteur du labyrinthe
+        """
+
+        self.width = width
+        self.height = height
+
+        size = width*height
+
+        neighbors = array('i', [-1])*(4*size)
+        walls = array('i', [-1])*(4*size)
+        border = array('i', [-1])*height
+        # Une valeur par ligne, pour retirer une colonne
+
+        neighbors[0::4] = array('i', range(1, size+1))
+        walls[0::4] = array('i', range(0, 2*size, 2))
+        neighbors[4*(width-1)::4*width] = border
+        walls[4*(width-1)::4*width] = border
+        # Droite : toutes les cellules sauf la dernière colonne
+
+        neighbors[2::4] = array('i', range(-1, size-1))
+        walls[2::4] = array('i', range(-2, 2*size-2, 2))
+        neighbors[2::4*width] = border
+        walls[2::4*width] = border
+        # Gauche : toutes les cellules sauf la première colonne
+
+        neighbors[1:4*(size-width):4] = array('i', range(width, size))
+        walls[1:4*(size-width):4] = array('i', range(1, 2*(size-width), 2))
+        # Bas : toutes les lignes sauf la dernière
+
+        neighbors[4*width+3::4] = array('i', range(0, size-width))
+        walls[4*width+3::4] = array('i', range(1, 2*(size-width), 2))
+        # Haut : toutes les lignes sauf la première
+
+        self.neighbors = neighbors
+        self.walls = walls
+
+    def neighborId(self, i:int, dir_id:int) -> int:
+        """
+        Fonction retournant l'indice de la voisine de i dans la direction
+        d'indice dir_id, ou -1 si elle est hors du plateau
+        """
+
+        return self.neighbors[4*i + dir_id]
+
+    def wallId(self, i:int, dir_id:int) -> int:
+        """
+        Fonction retournant l'indice du mur entre i et sa voisine dans la
+        direction d'indice dir_id, ou -1 si elle est hors du plateau
+        """
+
+        return self.walls[4*i + dir_id]
+
+class ComputedTable:
+    """
+    Table de ComputedAdjacency : chaque case est calculée à la lecture, à
+    partir de l'indice de la cellule. Se lit comme une table d'Adjacency
+    (indice ou tranche), sans aucune mémoire par cellule.
+    """
+
+    def __init__(self, width:int, height:int, walls:bool) -> None:
+        """
+        INPUT :
+            width : int, largeur du labyrinthe
+            height : int, hauteur du labyrinthe
+            walls : bool, True pour les indices des murs, False pour ceux des
+                    voisines
+        """
+
+        self.width = width
+        self.height = height
+        self.walls = walls
+
+    def __len__(self) -> int:
+        return 4*self.width*self.height
+
+    def __getitem__(self, index:(int, slice)) -> (int, list):
+        if isinstance(index, slice):
+            return [self[j] for j in range(*index.indices(len(self)))]
+
+        i, d = divmod(index, 4)
+        y, x = divmod(i, self.width)
+
+        if d == 0:
+            if x == self.width-1:
+                return -1
+            return 2*i if self.walls else i+1
+        elif d == 1:
+            if y == self.height-1:
+                return -1
+            return 2*i + 1 if self.walls else i + self.width
+        elif d == 2:
+            if x == 0:
+                return -1
+            return 2*(i-1) if self.walls else i-1
+        else:
+            if y == 0:
+                return -1
+            return 2*(i - self.width) + 1 if self.walls else i - self.width
+
+class ComputedAdjacency(Adjacency):
+    """
+    Même interface qu'Adjacency, mais sans tables : les voisines et les murs
+    sont recalculés à chaque lecture. Plus lent, utilisé pour les très grands
+    labyrinthes (cf BitPlaneStorage), où les tables prendraient 32 octets par
+    cellule.
+    """
+
+    def __init__(self, width:int, height:int) -> None:
+        self.width = width
+        self.height = height
+
+        self.neighbors = ComputedTable(width, height, False)
+        self.walls = ComputedTable(width, height, True)
+
+@functools.lru_cache(maxsize=8)
+def getAdjacency(width:int, height:int) -> Adjacency:
+    """
+    Fonction retournant la table des voisines pour une taille de labyrinthe.
+    Les dernières tables construites sont gardées en cache : tous les
+    labyrinthes de même taille partagent la même.
+
+    INPUT :
+        width : int, largeur du labyrinthe
+        height : int, hauteur du labyrinthe
+
+    OUTPUT :
+        Adjacency, la table
+    """
+
+    return Adjacency(width, height)
+
+if __name__ == "__main__":
+    deltas = ((1, 0), (0, 1), (-1, 0), (0, -1))
+    # Dans l'ordre de Direction.all_directions
+
+    for width, height in ((1, 1), (1, 3), (4, 1), (5, 3)):
+        adjacency = getAdjacency(width, height)
+
+        for y in range(height):
+            for x in range(width):
+                i = y*width + x
+
+                for d, (dx, dy) in enumerate(deltas):
+                    nx, ny = x+dx, y+dy
+
+                    if 0 <= nx < width and 0 <= ny < height:
+                        j = ny*width + nx
+
+                        assert adjacency.neighborId(i, d) == j
+                        assert adjacency.wallId(i, d) == 2*min(i, j) + (dy != 0)
+                    else:
+                        assert adjacency.neighborId(i, d) == -1
+                        assert adjacency.wallId(i, d) == -1
+
+        computed = ComputedAdjacency(width, height)
+
+        assert computed.neighbors[:] == list(adjacency.neighbors)
+        assert computed.walls[:] == list(adjacency.walls)
+        assert computed.neighbors[4 : 8] == list(adjacency.neighbors[4 : 8])
+
+    assert getAdjacency(5, 3) is getAdjacency(5, 3)
@@ -0,0 +1,332 @@
+from array import array
+import bisect
+
+class ChangeLog:
+    """
+    Journal compact des modifications de la grille, à rejouer pour
+    l'affichage (cf Maze.modifyCell et environment/player.py).
+
+    Chaque modification est un entier de 64 bits dans une array :
+        (indice réel k << 16) | (ancien état << 8) | nouvel état
+    chaque état tenant sur un octet. Une modification coûte donc 8 octets, au
+    lieu d'un tuple de 3 objets Python rangé dans une Queue. Garder l'ancien
+    état permet de rejouer à l'envers.
+
+    Les modifications sont regroupées en frames : frames contient, pour chaque
+    frame synchronisée, l'indice de fin de ses modifications dans records.
+    Les modifications faites depuis la dernière synchronisation ne sont pas
+    encore rejouables.
+
+    Toutes les keyframe_interval modifications environ, une copie complète de
+    la grille (keyframe) est gardée : on peut ainsi aller directement à
+    n'importe quelle frame sans rejouer tout ce qui précède.
+
+    Les frames peuvent aussi être écrites au fur et à mesure dans un fichier
+    de rejeu, sans être gardées en mémoire (cf ChangeLog.attach).
+    """
+
+    def __init__(self, keyframe_interval:int=0) -> None:
+        """
+        INPUT :
+            keyframe_interval : int, nombre de modifications entre deux
+                                keyframes, 0 pour ne pas en faire
+        """
+
+        self.records = array('Q')
+        # Modifications compactées
+
+        self.frames = array('Q')
+        # Fin de chaque frame dans records
+
+        self.grid = None
+        # Grille de départ du rejeu (cf GenericStorage.snapshot), None pour
+        # une grille vierge. Cf Maze.resetForDisplay
+
+        self.keyframe_interval = keyframe_interval
+        self.keyframe_frames = array('Q')
+        self.keyframe_grids = []
+        # Keyframes : numéro de la frame, et grille avant cette frame
+
+        self.frame_total = 0
+        # Nombre de frames synchronisées, y compris celles écrites dans le
+        # fichier de rejeu et plus gardées en mémoire
+
+        self._since_keyframe = 0
+        # Nombre de modifications depuis la dernière keyframe
+
+        self._next_frame = 0
+        # Indice de la prochaine frame à rejouer
+
+        self.writer = None
+        self.keep = True
+        # Cf ChangeLog.attach
+
+    def attach(self, writer:'ReplayWriter', keep:bool=False) -> None:
+        """
+        Procédure écrivant désormais chaque frame synchronisée dans un fichier
+        de rejeu (cf environment/replay.py). À appeler avant d'enregistrer la
+        première modification.
+
+        INPUT :
+            writer : ReplayWriter, fichier de rejeu
+            keep : bool, si les frames doivent aussi être gardées en mémoire
+                         pour être rejouées directement
+        """
+
+        self.writer = writer
+        self.keep = keep
+
+    def detach(self) -> None:
+        """
+        Procédure arrêtant l'écriture dans le fichier de rejeu
+        """
+
+        self.writer = None
+        self.keep = True
+
+    def add(self, k:int, old:int, state:int) -> None:
+        """
+        Procédure ajoutant une modification à la frame en cours
+
+        INPUT :
+            k : int, indice réel de la case dans la grille
+            old : int, état de la case avant la modification
+            state : int, nouvel état de la case
+        """
+
+        self.records.append(k << 16 | old << 8 | state)
+
+    def sync(self, grid:'GenericStorage'=None) -> None:
+        """
+        Procédure terminant la frame en cours, qui devient rejouable
+
+        INPUT :
+            grid : GenericStorage, grille après cette frame, pour les
+                   keyframes. None pour ne pas faire de keyframe
+        """
+
+        end = len(self.records)
+        start = self.frames[-1] if len(self.frames) != 0 else 0
+
+        self.frame_total += 1
+        self._since_keyframe += end - start
+
+        keyframe = None
+
+        if grid is not None and self.keyframe_interval != 0 and self._since_keyframe >= self.keyframe_interval:
+            keyframe = grid.snapshot()
+            self._since_keyframe = 0
+
+        if self.writer is not None:
+            self.writer.writeFrame(self.records, start, end)
+
+            if keyframe is not None:
+                self.writer.writeKeyframe(self.frame_total, keyframe)
+
+            if not self.keep:
+                del self.records[:]
+                return
+                # La frame n'existe plus que dans le fichier
+
+        self.frames.append(end)
+
+        if keyframe is not None:
+            self.keyframe_frames.append(self.frame_total)
+            self.keyframe_grids.append(keyframe)
+
+    def nextFrame(self) -> (range, None):
+        """
+        Fonction retournant les indices dans records des modifications de la
+        prochaine frame à rejouer, et passant à la suivante.
+
+        OUTPUT :
+            range, indices des modifications de la frame, ou None s'il n'y a
+            plus de frame à rejouer
+        """
+
+        n = self._next_frame
+
+        if n == len(self.frames):
+            return None
+
+        self._next_frame = n + 1
+
+        return range(self.frames[n-1] if n != 0 else 0, self.frames[n])
+
+    def frameRecords(self, n:int) -> (tuple, None):
+        """
+        Fonction donnant les modifications de la frame n, dans n'importe quel
+        ordre (cf Player)
+
+        INPUT :
+            n : int, numéro de la frame, à partir de 0
+
+        OUTPUT :
+            tuple (array des modifications, range des indices de la frame),
+            ou None si la frame n'existe pas
+        """
+
+        if n < 0 or n >= len(self.frames):
+            return None
+
+        return (self.records, range(self.frames[n-1] if n != 0 else 0, self.frames[n]))
+
+    def keyframeBefore(self, n:int) -> tuple:
+        """
+        Fonction retournant la dernière keyframe avant la frame n
+
+        INPUT :
+            n : int, numéro de la frame
+
+        OUTPUT :
+            tuple (numéro m <= n de la frame, grille avant la frame m). Sans
+            keyframe, (0, grille de départ)
+        """
+
+        i = bisect.bisect_right(self.keyframe_frames, n)
+
+        if i == 0:
+            return (0, self.grid)
+
+        return (self.keyframe_frames[i-1], self.keyframe_grids[i-1])
+
+    def rewind(self) -> None:
+        """
+        Procédure revenant à la première frame, pour tout rejouer
+        """
+
+        self._next_frame = 0
+
+    def clear(self) -> None:
+        """
+        Procédure vidant le journal
+        """
+
+        self.records = array('Q')
+        self.frames = array('Q')
+        self.keyframe_frames = array('Q')
+        self.keyframe_grids = []
+        self.frame_total = 0
+        self._since_keyframe = 0
+        self._next_frame = 0
+
+    def changeCount(self) -> int:
+        """
+        Fonction retournant le nombre total de modifications enregistrées
+        """
+
+        return len(self.records)
+
+    def frameCount(self) -> int:
+        """
+        Fonction retournant le nombre de frames synchronisées, rejouables
+        """
+
+        return len(self.frames)
+
+    def firstFrame(self) -> int:
+        """
+        Fonction retournant la première frame encore disponible, toujours 0
+        ici (cf FrameQueue.firstFrame)
+        """
+
+        return 0
+
+    def isComplete(self) -> bool:
+        """
+        Fonction retournant True si aucune autre frame ne peut arriver,
+        toujours le cas ici (cf FrameQueue.isComplete)
+        """
+
+        return True
+
+    def memorySize(self) -> int:
+        """
+        Fonction retournant la taille occupée par le journal, en octets
+        """
+
+        size = (len(self.records) + len(self.frames) + len(self.keyframe_frames)) * self.records.itemsize
+
+        return size + sum(len(grid) for grid in self.keyframe_grids)
+
+    def __len__(self) -> int:
+        """
+        Nombre de frames restant à rejouer, utilisé par la fonction len
+        """
+
+        return len(self.frames) - self._next_frame
+
+    @staticmethod
+    def decode(record:int) -> tuple:
+        """
+        Fonction décompactant une modification
+
+        INPUT :
+            record : int, modification compactée
+
+        OUTPUT :
+            tuple (indice réel, ancien état, nouvel état)
+        """
+
+        return (record >> 16, (record >> 8) & 0xFF, record & 0xFF)
+
+if __name__ == "__main__":
+    log = ChangeLog()
+
+    log.add(5, 31, 21)
+    log.add(10**9, 21, 31)
+    log.sync()
+    log.sync()
+    log.add(7, 21, 61)
+
+    assert len(log) == 2
+    assert [ChangeLog.decode(log.records[j]) for j in log.nextFrame()] == [(5, 31, 21), (10**9, 21, 31)]
+    assert len(log.nextFrame()) == 0
+    assert log.nextFrame() is None
+    # La dernière modification n'est pas synchronisée
+
+    log.sync()
+    assert [ChangeLog.decode(log.records[j]) for j in log.nextFrame()] == [(7, 21, 61)]
+
+    log.rewind()
+    assert len(log) == 3
+
+    records, frame = log.frameRecords(2)
+    assert [ChangeLog.decode(records[j]) for j in frame] == [(7, 21, 61)]
+    assert log.frameRecords(3) is None
+
+    class Grid:
+        def snapshot(self):
+            return b"grid"
+
+    log = ChangeLog(keyframe_interval=2)
+
+    for n in range(5):
+        log.add(n, 0, 1)
+        log.sync(Grid())
+
+    assert list(log.keyframe_frames) == [2, 4]
+    assert log.keyframeBefore(1) == (0, None)
+    assert log.keyframeBefore(3) == (2, b"grid")
+
+    class Writer:
+        def __init__(self):
+            self.frames = []
+
+        def writeFrame(self, records, start, end):
+            self.frames.append(list(records[start:end]))
+
+        def writeKeyframe(self, n, grid):
+            pass
+
+    log = ChangeLog()
+    log.attach(Writer())
+    log.add(1, 31, 21)
+    log.sync()
+    log.add(2, 31, 21)
+    log.add(3, 31, 21)
+    log.sync()
+
+    assert [len(frame) for frame in log.writer.frames] == [1, 2]
+    assert log.changeCount() == 0 and len(log) == 0
+    assert log.frame_total == 2
@@ -19,10 +19,13 @@ class Direction(Position):
     # Le tuple contenant toutes les directions. Est vide à l'origine
 
     @staticmethod
-    def getRandomDirectionList() -> list:
+    def getRandomDirectionList(rng:random.Random) -> list:
         """
         Fonction retournant la liste des directions, triée de façon aléatoire.
 
+        INPUT :
+            rng : random.Random, générateur aléatoire (cf RandomStreams)
+
         OUTPUT :
             dir_as_list : list Direction, liste des 4 directions
         """
@@ -30,11 +33,35 @@ class Direction(Position):
         dir_as_list = list(Direction.all_directions)
         # On fait une copie du tuple de base en liste (modifiable)
 
-        random.shuffle(dir_as_list)
+        rng.shuffle(dir_as_list)
         # On randomise la liste
 
         return dir_as_list
 
+    @staticmethod
+    def getRandomIdList(rng:random.Random) -> list:
+        """
+        Fonction retournant la liste des indices des directions (cf
+        Direction.id), triée de façon aléatoire. Consomme le générateur
+        aléatoire exactement comme Direction.getRandomDirectionList.
+
+        INPUT :
+            rng : random.Random, cf Direction.getRandomDirectionList
+
+        OUTPUT :
+            id_list : list int, liste des 4 indices
+        """
+
+        id_list = [0, 1, 2, 3]
+
+        rng.shuffle(id_list)
+
+        return id_list
+
+    def __new__(cls, pos:Position, str_direction:str) -> 'Direction':
+        return tuple.__new__(cls, pos)
+        # Une direction est une position : le tuple (x, y)
+
     def __init__(self, pos:Position, str_direction:str) -> None:
         """
         Fonction utilisée pour la création d'un objet direction.
@@ -44,14 +71,36 @@ class Direction(Position):
             str_direction : str, le nom de la direction
         """
 
-        super().__init__(pos)
-        # Constructeur de la classe mère
-
         self.str_direction = str_direction
 
+        self.id = len(Direction.all_directions)
+        # Indice de la direction dans all_directions, utilisé pour lire les
+        # tables de déplacement par indice (cf Maze.cell_deltas)
+
         Direction.all_directions = Direction.all_directions + (self,)
         # On ajoute cette direction au tuple de toutes les directions
 
+    @staticmethod
+    def fromId(id:int) -> 'Direction':
+        """
+        Fonction retournant une direction à partir de son indice
+
+        INPUT :
+            id : int, indice de la direction
+
+        OUTPUT :
+            Direction, la direction
+        """
+
+        return Direction.all_directions[id]
+
+    def __reduce__(self) -> tuple:
+        """
+        Méthode utilisée par pickle et copy : une direction reste unique
+        """
+
+        return (Direction.fromId, (self.id,))
+
     def __str__(self) -> str:
         return self.str_direction
 
@@ -64,3 +113,6 @@ if __name__ == "__main__":
     p = Position((1, 1))
 
     assert p+Direction.UP == (1, 0)
+
+    import pickle
+    assert pickle.loads(pickle.dumps(Direction.LEFT)) is Direction.LEFT
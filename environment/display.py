@@ -3,32 +3,50 @@ import tkinter as Tk
 
 try:
     from environment.map import Map
+    from environment.maze import Maze
     from environment.direction import Direction
     from environment.settings import Settings
     from environment.position import Position
+    from environment.player import Player
 except ImportError:
     from map import Map
+    from maze import Maze
     from direction import Direction
     from settings import Settings
     from position import Position
+    from player import Player
 
 import time
 
 class Display:
     """
     Classe s'occupant de l'affichage de la fenêtre.
+
+    Contrôles :
+        Espace : pause
+        Flèches gauche et droite : frame précédente ou suivante (met en pause)
+        Page précédente et page suivante : SEEK_STEP frames en arrière ou en avant
+        Début et Fin : première ou dernière frame
+        Échap : quitter
     """
 
+    SEEK_STEP = 100
+    # Nombre de frames sautées avec page précédente et page suivante
+
     @classmethod
-    def __init__(cls, gen_name:str, res_name:str) -> None:
+    def __init__(cls, gen_name:str, res_name:str, maze:Maze=None) -> None:
         """
         Procédure exécutée lors de l'initialisation de la classe.
 
         INPUT :
             gen_name : str, nom de l'algorithme de génération utilisé
             res_name : str, nom de l'algorithme de résolution utilisé
+            maze : Maze, labyrinthe à afficher. Par défaut, le labyrinthe
+                   courant Map.current
         """
 
+        cls.maze = Map.current if maze is None else maze
+
         ########################################################################
         # Définition des couleurs
 
@@ -44,16 +62,16 @@ class Display:
         cls.LIGHT_GRAY = cls.hsv_to_hex(  0,   0,  75)
         cls.WHITE      = "#ffffff"
 
-        cls.color_scheme = {Map.EMPTY         : cls.WHITE,
-                            Map.WALL          : cls.BLACK,
-                            Map.RED_WALL      : cls.RED,
-                            Map.START         : cls.RED,
-                            Map.GOAL          : cls.GREEN,
-                            Map.YELLOW_CELL   : cls.YELLOW,
-                            Map.ORANGE_CELL   : cls.ORANGE,
-                            Map.SOLUTION_PATH : cls.LIGHT_BLUE,
-                            Map.VISITED_PATH  : cls.LIGHT_RED,
-                            Map.NOT_VISITED   : cls.LIGHT_GRAY,}
+        cls.color_scheme = {Maze.EMPTY         : cls.WHITE,
+                            Maze.WALL          : cls.BLACK,
+                            Maze.RED_WALL      : cls.RED,
+                            Maze.START         : cls.RED,
+                            Maze.GOAL          : cls.GREEN,
+                            Maze.YELLOW_CELL   : cls.YELLOW,
+                            Maze.ORANGE_CELL   : cls.ORANGE,
+                            Maze.SOLUTION_PATH : cls.LIGHT_BLUE,
+                            Maze.VISITED_PATH  : cls.LIGHT_RED,
+                            Maze.NOT_VISITED   : cls.LIGHT_GRAY,}
         # On associe chaque type de case à une couleur
 
         ########################################################################
@@ -86,21 +104,29 @@ class Display:
 
         cls.skipped_frame = 0
 
+        cls.merged_changes = 0
+        cls.written_changes = 0
+        # Modifications des frames sautées, et cases réellement écrites
+
+        cls.player = Player(cls.maze)
+        # Lecture de l'animation, frame par frame ou directement à une frame
+
+        cls.paused = False
+        cls.need_redraw = False
+        cls.finished = False
+
         window_zoom = Settings.get("WINDOW_ZOOM", float)
 
         window_width = cls.window.winfo_screenwidth()*window_zoom/100
         # On récupère la largeur que doit avoir la fenêtre
 
-        width = Settings.get("WIDTH", int)
-        # On récupère le nombre de cellules en largeur
-
-        cell_size = window_width/width
+        cell_size = window_width/cls.maze.width
         # On calcule la taille d'une cellule
 
         cls.cell_size = int(cell_size)
 
-        cls.width = int(Map.width * cls.cell_size)
-        cls.height = int(Map.height * cls.cell_size)
+        cls.width = int(cls.maze.width * cls.cell_size)
+        cls.height = int(cls.maze.height * cls.cell_size)
         # Largeur et hauteur de la fenêtre
 
         cls.grille = Tk.Canvas(cls.window,
@@ -121,6 +147,15 @@ class Display:
         # Gestion des différents événements
         # (croix rouge pour fermer la fenêtre, touche Échap)
 
+        cls.window.bind("<space>", cls.togglePause)
+        cls.window.bind("<Left>",  lambda event: cls.seek(cls.player.frame - 1))
+        cls.window.bind("<Right>", lambda event: cls.seek(cls.player.frame + 1))
+        cls.window.bind("<Prior>", lambda event: cls.seek(cls.player.frame - cls.SEEK_STEP))
+        cls.window.bind("<Next>",  lambda event: cls.seek(cls.player.frame + cls.SEEK_STEP))
+        cls.window.bind("<Home>",  lambda event: cls.seek(0))
+        cls.window.bind("<End>",   lambda event: cls.seek(cls.player.frameCount()))
+        # Déplacement dans l'animation
+
         ws = cls.window.winfo_screenwidth()
         hs = cls.window.winfo_screenheight()
         w = cls.width + 3
@@ -141,21 +176,69 @@ class Display:
         """
 
         if cls.is_running:
-            while time.time()-cls.time_before_draw < cls.time_between_frame:
-                time.sleep(0.01)
+            if cls.paused:
+                can_display = cls.need_redraw
+            else:
+                while time.time()-cls.time_before_draw < cls.time_between_frame:
+                    time.sleep(0.01)
 
-            can_display = Map.modifyCell()
+                can_display = cls.player.stepForward()
 
-            for i in range(int(cls.draw_time/cls.time_between_frame)):
-                Map.modifyCell()
-                cls.skipped_frame += 1
+                late_frames = int(cls.draw_time/cls.time_between_frame)
+
+                if late_frames != 0:
+                    # L'affichage est en retard : les frames à sauter sont
+                    # fusionnées, chaque case n'est écrite qu'une fois
+
+                    frames, changes, written = cls.player.coalesceForward(late_frames)
+
+                    cls.skipped_frame += frames
+                    cls.merged_changes += changes
+                    cls.written_changes += written
+
+                if not can_display and not cls.finished and cls.player.isFinished():
+                    cls.finished = True
+                    print("Affichage final")
 
             if can_display:
                 cls.time_before_draw = time.time()
+                cls.need_redraw = False
 
                 cls.draw()
             else:
-                print("Affichage final")
+                cls.window.after(int(1000*cls.time_between_frame), cls.beforeDraw)
+                # Rien à afficher : on attend une touche, ou une frame du
+                # producteur (cf environment/pipeline.py)
+
+    @classmethod
+    def togglePause(cls, event=None) -> None:
+        """
+        Procédure mettant en pause ou relançant l'animation
+
+        INPUT :
+            event : événement tkinter, cf Display.quit
+        """
+
+        cls.paused = not cls.paused
+        cls.time_before_draw = time.time()
+
+        cls.updateTitle()
+
+    @classmethod
+    def seek(cls, frame:int) -> None:
+        """
+        Procédure allant directement à une frame, et mettant en pause
+
+        INPUT :
+            frame : int, frame à afficher, cf Player.seek
+        """
+
+        cls.paused = True
+        cls.finished = False
+
+        cls.player.seek(frame)
+
+        cls.need_redraw = True
 
     @classmethod
     def draw(cls) -> None:
@@ -181,63 +264,58 @@ class Display:
         # pour ne dessiner qu'un seul rectange plutot que plusieurs carrés.
         # tkinter supporte mal plusieurs centaines de formes à afficher
 
-        for y in range(Map.height):
-            first_p = Position((0, y))
-            old_p = Position(first_p)
+        maze = cls.maze
+        width = maze.width
+
+        for y in range(maze.height):
+            first_x = 0
+            first_etat = maze.cellState(y*width)
 
-            for x in range(Map.width):
-                new_p = Position((x, y))
+            for x in range(width):
+                etat = maze.cellState(y*width + x)
 
-                if Map.getCell(first_p) == Map.getCell(new_p):
-                    pass
-                else:
-                    cls.drawCell(first_p, old_p)
-                    first_p = Position(new_p)
+                if etat != first_etat:
+                    cls.drawCell(Position((first_x, y)), Position((x-1, y)))
 
-                old_p = Position(new_p)
+                    first_x = x
+                    first_etat = etat
 
-            cls.drawCell(first_p, old_p)
+            cls.drawCell(Position((first_x, y)), Position((width-1, y)))
 
         ########################################################################
         # On dessine les murs
 
         # Murs verticaux
-        for x in range(Map.width-1):
-            first_p = Position((x+0.5, 0))
-            old_p = Position(first_p)
+        for x in range(width-1):
+            first_y = 0
+            first_etat = maze.wallState(2*x)
 
-            for y in range(Map.height):
-                new_p = Position((x+0.5, y))
+            for y in range(maze.height):
+                etat = maze.wallState(2*(y*width + x))
 
-                if Map.getWall(first_p) == Map.getWall(new_p):
-                    pass
-                else:
-                    cls.drawWall(first_p, old_p, vertical=True)
+                if etat != first_etat:
+                    cls.drawWall(Position((x+0.5, first_y)), Position((x+0.5, y-1)), vertical=True)
 
-                    first_p = Position(new_p)
+                    first_y = y
+                    first_etat = etat
 
-                old_p = Position(new_p)
-
-            cls.drawWall(first_p, old_p, vertical=True)
+            cls.drawWall(Position((x+0.5, first_y)), Position((x+0.5, maze.height-1)), vertical=True)
 
         # Murs horizontaux
-        for y in range(Map.height-1):
-            first_p = Position((0, y+0.5))
-            old_p = Position(first_p)
-
-            for x in range(Map.width):
-                new_p = Position((x, y+0.5))
+        for y in range(maze.height-1):
+            first_x = 0
+            first_etat = maze.wallState(2*y*width + 1)
 
-                if Map.getWall(first_p) == Map.getWall(new_p):
-                    pass
-                else:
-                    cls.drawWall(first_p, old_p, horizontal=True)
+            for x in range(width):
+                etat = maze.wallState(2*(y*width + x) + 1)
 
-                    first_p = Position(new_p)
+                if etat != first_etat:
+                    cls.drawWall(Position((first_x, y+0.5)), Position((x-1, y+0.5)), horizontal=True)
 
-                old_p = Position(new_p)
+                    first_x = x
+                    first_etat = etat
 
-            cls.drawWall(first_p, old_p, horizontal=True)
+            cls.drawWall(Position((first_x, y+0.5)), Position((width-1, y+0.5)), horizontal=True)
 
         ########################################################################
         # On dessine les 4 murs extérieurs
@@ -246,7 +324,7 @@ class Display:
         cls.grille.create_line(3,
                                0,
                                3,
-                               Map.height*cls.cell_size,
+                               cls.maze.height*cls.cell_size,
                                fill=Display.BLACK,
                                width=cls.WALL_WIDTH)
 
@@ -254,23 +332,23 @@ class Display:
         cls.grille.create_line(cls.width,
                                0,
                                cls.width,
-                               Map.height*cls.cell_size,
+                               cls.maze.height*cls.cell_size,
                                fill=Display.BLACK,
                                width=cls.WALL_WIDTH)
 
         # Mur horizontal en haut
         cls.grille.create_line(0,
                                3,
-                               Map.width*cls.cell_size,
+                               cls.maze.width*cls.cell_size,
                                3,
                                fill=Display.BLACK,
                                width=cls.WALL_WIDTH)
 
         # Mur horizontal en bas
         cls.grille.create_line(0,
-                               Map.height*cls.cell_size,
-                               Map.width*cls.cell_size,
-                               Map.height*cls.cell_size,
+                               cls.maze.height*cls.cell_size,
+                               cls.maze.width*cls.cell_size,
+                               cls.maze.height*cls.cell_size,
                                fill=Display.BLACK,
                                width=cls.WALL_WIDTH)
 
@@ -305,16 +383,16 @@ class Display:
         if vertical:
             p1_screen = (p1+(0.5,0))*cls.cell_size
             p2_screen = (p2+(0.5,1))*cls.cell_size
-            etat = Map.getWall(p1)
+            etat = cls.maze.getWall(p1)
         else:
             p1_screen = (p1+(0,0.5))*cls.cell_size
             p2_screen = (p2+(1,0.5))*cls.cell_size
-            etat = Map.getWall(p1)
+            etat = cls.maze.getWall(p1)
 
-        if etat != Map.EMPTY:
+        if etat != Maze.EMPTY:
             width = cls.WALL_WIDTH
 
-            if etat == Map.RED_WALL:
+            if etat == Maze.RED_WALL:
                 # Si c'est un mur rouge, on le met en gras
 
                 width = 5
@@ -342,15 +420,15 @@ class Display:
             ValueError : si une cellule est en fait un mur
         """
 
-        etat = Map.getCell(p1)
+        etat = cls.maze.getCell(p1)
 
-        if etat != Map.EMPTY:
+        if etat != Maze.EMPTY:
             try:
                 color_in = cls.color_scheme[etat]
             except KeyError as e:
                 raise ValueError("Couleur inconnue : "+str(etat)) from e
 
-            if etat == Map.WALL:
+            if etat == Maze.WALL:
                 raise ValueError("Il y a un mur sur une case (!)")
 
             color_out = color_in
@@ -403,8 +481,10 @@ class Display:
 
         title = "Génération : " + cls.gen_name + sep \
               + "Résolution : " + cls.res_name + sep \
+              + "frame : " + str(cls.player.frame) + (" (pause)" if cls.paused else "") + sep \
               + "images écoulées : " + str(cls.frame_count) + sep \
-              + "images skippées : " + str(cls.skipped_frame) + sep \
+              + "images skippées : " + str(cls.skipped_frame) \
+              + " (" + str(cls.merged_changes) + " modifs fusionnées en " + str(cls.written_changes) + ")" + sep \
               + "vrai framerate : " + (str(int(1/cls.time_between_frame)) if cls.draw_time == 0 else str(int(100/cls.draw_time)/100)) + " fps"
 
         cls.window.title(title)
@@ -0,0 +1,1096 @@
+try:
+    from environment.direction import Direction
+    from environment.position import Position
+    from environment.settings import Settings
+    from environment.change_log import ChangeLog
+    from environment.replay import ReplayReader
+    from environment.storage import createStorage, MmapStorage
+    from environment.adjacency import ComputedAdjacency, getAdjacency
+except ImportError:
+    from direction import Direction
+    from position import Position
+    from settings import Settings
+    from change_log import ChangeLog
+    from replay import ReplayReader
+    from storage import createStorage, MmapStorage
+    from adjacency import ComputedAdjacency, getAdjacency
+
+import itertools
+
+class Dimensions:
+    """
+    Itérable paresseux sur toutes les composantes (x, y) de la map, x d'abord.
+    Contrairement à une liste, ne prend aucune place en mémoire, même pour un
+    labyrinthe immense.
+    """
+
+    def __init__(self, width:int, height:int) -> None:
+        self.width = width
+        self.height = height
+
+    def __iter__(self) -> 'iterator':
+        return itertools.product(range(self.width), range(self.height))
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+class Maze:
+    """
+    Classe représentant un labyrinthe / un plateau de jeu.
+    Chaque instance a sa propre grille, ses dimensions, son départ, son arrivée
+    et ses modifications à afficher : plusieurs labyrinthes peuvent exister en
+    même temps.
+
+    x x x x x x x x x x x
+    x O - O - O - O - O x
+    x | * | * | * | * | x
+    x O - O - A B O - O x
+    x | * | * C * | * | x
+    x O - O - O - O - O x
+    x | * | * | * | * | x
+    x O - O - O - O - O x
+    x | * | * | * | * | x
+    x O - O - O - O - O x
+    x x x x x x x x x x x
+
+    Les 'O' sont des cases vides
+    Les '─' et '|' sont des murs ou des portes
+    Les '*' sont des intersections, qui ne peuvent pas être supprimées
+    Les 'x' sont des murs extérieurs, qui ne peuvent pas non plus être supprimés
+
+    'A' a pour position absolue (5, 3) mais on considère qu'elle est (2, 1)
+    'B' a pour position absolue (6, 3) mais on considère qu'elle est (2.5, 1)
+    'C' a pour position absolue (5, 4) mais on considère qu'elle est (2, 1.5)
+
+    Chaque changement de cellule ou de mur est par défaut enregistré dans un
+    ChangeLog (cf environment/change_log.py) pour l'afficher a posteriori.
+    """
+
+    # Variables pour éviter l'utilisation de nombres magiques
+    # et ainsi augmenter la lisibilité
+
+    SET_TYPE_WALL = 11
+    SET_TYPE_CELL = 12
+    # Utilisé pour savoir si une case est modifiée comme mur ou cellule
+
+    EMPTY = 21
+    # Cellule ou mur vide
+
+    WALL = 31
+    RED_WALL = 32
+    # Murs pleins. Un mur rouge est un mur plus (+) visible
+
+    START = 41
+    GOAL = 42
+    # Repères pour savoir où sont le début et la fin du labyrinthe
+
+    YELLOW_CELL = 51
+    ORANGE_CELL = 52
+    # Repères visuels décoratifs
+
+    SOLUTION_PATH = 61
+    VISITED_PATH = 62
+    NOT_VISITED = 63
+    # Pour la résolution
+
+    def resetAll(self, save:bool) -> None:
+        """
+        Réinitialise la grille
+
+        INPUT :
+            save : bool, si cette réinitialisation doit être sauvegardée pour
+                         l'affichage
+        """
+
+        for x, y in self.dimensions:
+            i = y*self.width + x
+
+            if y != self.height-1:
+                self.setWallDown(i, self.WALL, save=save)
+
+            if x != self.width-1:
+                self.setWallRight(i, self.WALL, save=save)
+
+            self.setCellState(i, self.EMPTY, save=save)
+
+    def modifyCell(self) -> bool:
+        """
+        Permet d'appliquer les modifications faites lors de la génération et de
+        la résolution lors de l'affichage à l'écran
+
+        OUTPUT :
+            bool, si c'était la dernière modification ou non
+        """
+
+        frame = self.modified_cells.nextFrame()
+
+        if frame is None:
+            return False
+
+        records = self.modified_cells.records
+        grid = self._grid
+
+        for j in frame:
+            record = records[j]
+            grid[record >> 16] = record & 0xFF
+            # Cf ChangeLog pour le format d'une modification
+
+        return True
+
+    def __init__(self, width:int, height:int, storage:str="FLAT", debug:bool=False, **options) -> None:
+        """
+        Création d'un labyrinthe vierge : tous les murs sont pleins et toutes
+        les cellules sont vides.
+
+        INPUT :
+            width : int, nombre de cellules en largeur
+            height : int, nombre de cellules en hauteur
+            storage : str ou GenericStorage, nom du stockage de la grille
+                      (cf settings.cfg), ou grille déjà créée
+            debug : bool, si les accès rapides (cellState, wallRight...)
+                          doivent vérifier leurs indices
+            options : paramètres propres au stockage (path pour MMAP)
+        """
+
+        self.debug = debug
+
+        self.dimensions = Dimensions(width, height)
+        # Initialisation d'un itérable parcourant toutes les composantes (x, y),
+        # utile pour pouvoir parcourir facilement la map
+
+        self.real_width = width*2 + 1
+        self.real_height = height*2 + 1
+        # Taille réelle en prenant en compte les murs et les intersections
+
+        self.modified_cells = ChangeLog(keyframe_interval=self.real_width*self.real_height)
+        # Cellules à modifier pour l'affichage, regroupées par frames. Une
+        # keyframe toutes les "taille de la grille" modifications : les copies
+        # de la grille prennent au plus un huitième de la place du journal
+
+        self.recording = True
+        # Si False, aucune modification n'est enregistrée pour l'affichage,
+        # quel que soit le paramètre save des setters (mode sans affichage)
+
+        self.width = width
+        self.height = height
+
+        self.cell_deltas = tuple(dir.x + dir.y*width for dir in Direction.all_directions)
+        # Pour chaque direction (cf Direction.id), ce qu'il faut ajouter à
+        # l'indice d'une cellule pour obtenir celui de sa voisine
+
+        self.wall_deltas = tuple((0 if dir.x+dir.y > 0 else 2*delta) + (0 if dir.x != 0 else 1)
+                                 for dir, delta in zip(Direction.all_directions, self.cell_deltas))
+        # Pour chaque direction, ce qu'il faut ajouter à 2*i pour obtenir
+        # l'indice du mur entre la cellule i et sa voisine
+
+        if isinstance(storage, str):
+            storage = createStorage(storage,
+                                    self.real_width,
+                                    self.real_height,
+                                    self.WALL,
+                                    self.EMPTY,
+                                    **options)
+            # Les intersections et les murs sont pleins, les cellules vides
+
+        self.map = storage
+        # Grille à 2 dimensions, cf environment/storage.py
+
+        if not self.map.COMPACT:
+            Position.enableInterning(width, height)
+            # Maze.cellPos et Position.random retournent toujours la même
+            # instance pour une case (sauf pour les trop grandes grilles)
+
+        self.start_pos = None
+        self.goal_pos = None
+
+        self._adjacency = None
+        # Cf Maze.adjacency
+
+    @property
+    def map(self) -> 'GenericStorage':
+        """
+        Grille du labyrinthe, cf environment/storage.py
+        """
+
+        return self._map
+
+    @map.setter
+    def map(self, storage:'GenericStorage') -> None:
+        self._map = storage
+
+        self._grid = storage if storage.buffer is None else storage.buffer
+        # Ce qu'utilisent les accès rapides : directement le tampon de la
+        # grille quand c'est possible
+
+    @classmethod
+    def fromSettings(cls) -> 'Maze':
+        """
+        Fonction créant un labyrinthe vierge à partir du fichier settings.cfg
+
+        OUTPUT :
+            Maze, le labyrinthe
+        """
+
+        width = Settings.get("WIDTH", int)
+        ratio = Settings.get("WIDTH_RATIO", str)
+
+        ratio = ratio.split(':')
+
+        height = float(ratio[1])/float(ratio[0]) * width
+        height = round(height)
+
+        storage_name = Settings.get("STORAGE", str)
+        options = {}
+
+        if storage_name == MmapStorage.STORAGE_NAME:
+            options["path"] = Settings.get("STORAGE_FILE", str)
+
+        return cls(width, height, storage_name, debug=Settings.get("DEBUG", bool), **options)
+
+    @classmethod
+    def fromFile(cls, path:str) -> 'Maze':
+        """
+        Fonction chargeant un labyrinthe sauvegardé par le stockage MMAP.
+        Le fichier est projeté en mémoire, et n'est plus modifié (cf
+        Maze.protectStorage). Les états de cellules autres que le départ et
+        l'arrivée (chemins d'une ancienne résolution...) sont effacés.
+
+        INPUT :
+            path : str, chemin du fichier
+
+        OUTPUT :
+            Maze, le labyrinthe
+
+        EXCEPTION :
+            ValueError : si le fichier n'est pas un labyrinthe
+        """
+
+        storage = MmapStorage.open(path)
+
+        maze = cls(storage.real_width//2, storage.real_height//2, storage)
+
+        if storage.start_pos is not None:
+            maze.start_pos = Position(storage.start_pos)
+
+        if storage.goal_pos is not None:
+            maze.goal_pos = Position(storage.goal_pos)
+
+        maze.protectStorage()
+
+        kept = bytes(state if state in (cls.START, cls.GOAL) else cls.EMPTY for state in range(256))
+        # Table de traduction : tout état de cellule sauf START et GOAL devient EMPTY
+
+        grid = maze._grid
+        real_width = maze.real_width
+
+        for y in range(1, maze.real_height, 2):
+            cells = grid[y*real_width + 1 : (y+1)*real_width : 2]
+            cleaned = cells.tobytes().translate(kept)
+
+            if cleaned != cells:
+                grid[y*real_width + 1 : (y+1)*real_width : 2] = cleaned
+        # Une ligne de cellules à la fois, sans lire toute la grille d'un coup
+
+        return maze
+
+    @classmethod
+    def fromReplay(cls, path:str) -> 'Maze':
+        """
+        Fonction créant un labyrinthe prêt à rejouer un fichier de rejeu
+        (cf environment/replay.py), lu frame par frame pendant l'affichage.
+
+        INPUT :
+            path : str, chemin du fichier
+
+        OUTPUT :
+            Maze, le labyrinthe
+
+        EXCEPTION :
+            ValueError : si le fichier n'est pas un fichier de rejeu
+        """
+
+        reader = ReplayReader(path)
+
+        maze = cls(reader.width, reader.height)
+        maze.replayFrom(reader)
+
+        return maze
+
+    def flush(self) -> None:
+        """
+        Procédure sauvegardant la grille si le stockage est sur disque.
+        """
+
+        start_pos = None if self.start_pos is None else self.start_pos.toTuple()
+        goal_pos = None if self.goal_pos is None else self.goal_pos.toTuple()
+
+        self.map.flush(start_pos, goal_pos)
+
+    def protectStorage(self) -> None:
+        """
+        Procédure empêchant que les modifications suivantes de la grille
+        soient sauvegardées, si le stockage est sur disque : le fichier garde
+        le labyrinthe tel qu'il est maintenant (cf MmapStorage.makePrivate).
+        """
+
+        self.map.makePrivate()
+        self.map = self.map
+        # Le tampon de la grille a changé
+
+    def resetForDisplay(self, grid:bytes=None) -> None:
+        """
+        Procédure préparant la grille pour retracer l'affichage.
+
+        Un stockage sur disque est d'abord sauvegardé puis remplacé par un
+        stockage en mémoire, pour ne pas écraser le labyrinthe généré.
+
+        INPUT :
+            grid : bytes, grille de départ de l'affichage (cf storage.snapshot)
+                   None pour une grille vierge
+        """
+
+        if self.map.PERSISTENT:
+            self.flush()
+            self.map.close()
+
+            self.map = createStorage("FLAT", self.real_width, self.real_height, self.WALL, self.EMPTY)
+
+        if grid is None:
+            self.resetAll(save=False)
+        else:
+            self.map.restore(grid)
+
+        self.modified_cells.grid = grid
+        # Point de départ pour revenir en arrière, cf environment/player.py
+
+    def replayFrom(self, reader:ReplayReader) -> None:
+        """
+        Procédure préparant l'affichage d'un fichier de rejeu : la grille
+        repart de celle du fichier, et modifyCell lit les frames du fichier
+        au lieu de celles enregistrées en mémoire.
+
+        INPUT :
+            reader : ReplayReader, fichier de rejeu ouvert
+        """
+
+        self.resetForDisplay(reader.grid)
+
+        self.modified_cells = reader
+
+    def isCellPosValid(self, pos:Position) -> bool:
+        """
+        Fonction permettant de savoir si une position de case est valide.
+        Exemple de position de cellule valide   : (1  , 4)
+        Exemple de position de cellule invalide : (1.5, 4)
+        Exemple de position de cellule invalide : (-1 , 4)
+
+        INPUT :
+            pos : Position, position (x, y) entière positive
+
+        OUTPUT :
+            valid : bool, si la position est valide ou non
+        """
+
+        if isinstance(pos, tuple):
+            pos = Position(pos)
+
+        valid = True
+
+        if pos.x not in range(self.width):
+            # Si x < 0 ou x >= largeur
+            valid = False
+
+        if pos.y not in range(self.height):
+            # Si y < 0 ou y >= hauteur
+            valid = False
+
+        return valid
+
+    def getCell(self, pos:Position) -> int:
+        """
+        Fonction retournant la valeur d'une case
+
+        INPUT :
+            pos : Position, position (x, y) entière positive
+
+        OUTPUT :
+            etat : int, un type de cellule
+
+        EXCEPTION :
+            ValueError : si la position de la cellule est invalide
+        """
+
+        if isinstance(pos, tuple):
+            pos = Position(pos)
+
+        if not self.isCellPosValid(pos):
+            raise ValueError("Position de cellule invalide : pos=" + str(pos))
+
+        pos = self.truePos(pos)
+
+        etat = self.map.get(pos.x, pos.y)
+
+        return etat
+
+    def setCell(self, pos:Position, id:int, save:bool=True) -> None:
+        """
+        Fonction permettant de modifier la valeur d'une case
+
+        INPUT :
+            pos : Position, position (x, y) entière positive
+            id : int, un type de cellule
+            save : bool, s'il faut sauvegarder cette modification pour l'affichage
+
+        EXCEPTION :
+            ValueError : si la position est invalide
+        """
+
+        if isinstance(pos, tuple):
+            pos = Position(pos)
+
+        if not self.isCellPosValid(pos):
+            raise ValueError("Position de cellule invalide")
+
+        pos = self.truePos(pos)
+
+        if save and self.recording:
+            self.modified_cells.add(pos.y*self.real_width + pos.x, self.map.get(pos.x, pos.y), id)
+
+        self.map.set(pos.x, pos.y, id)
+
+    def syncModifiedCells(self) -> None:
+        """
+        Permet de synchroniser les modifications, pour par exemple modifier
+        plusieurs cellules par frame
+        """
+
+        if self.recording:
+            self.modified_cells.sync(None if self.map.COMPACT else self.map)
+            # Pas de keyframe pour un stockage compact : la copie de la grille
+            # prendrait plus de place que le stockage lui-même
+
+    def isWallPosValid(self, pos:Position) -> bool:
+        """
+        Fonction permettant de savoir si une position de mur est valide.
+
+        INPUT :
+            pos : Position, position (x, y) positive ayant pour partie
+                            flottante 0.5 en x ou (exclusif) en y
+                            Exemple : (0.5, 1) et (4, 5.5) sont valides, mais
+                            pas (9.5, 7.5), (7, 4) ou encore (-8, 0)
+
+        OUTPUT :
+            valid : bool, si la position est valide ou non
+        """
+
+        if isinstance(pos, tuple):
+            pos = Position(pos)
+
+        valid = (pos.x % 1 == 0.5) ^ (pos.y % 1 == 0.5)
+        # L'opérateur '^' est l'opérateur XOR
+        # On veur en effet que x = n+0.5 XOR y = n+0.5 (n entier)
+        # Une et une seule des 2 valeurs doit être entière
+        # En effet, si les 2 sont entières c'est une case,
+        # et si les 2 sont flottantes c'est une intersection (non modifiable)
+
+        pos = self.truePos(pos)
+
+        if pos.x not in range(1, self.real_width-1):
+            # On exclut les nombres négatifs et les positions hors du jeu
+            # On exclut aussi les murs extérieurs, non modifiables
+            # On exclut donc x <= 1 et x >= largeur-1
+            valid = False
+
+        if pos.y not in range(1, self.real_height-1):
+            valid = False
+
+        return valid
+
+    def getWall(self, pos:Position) -> int:
+        """
+        Fonction retournant la valeur d'un mur.
+
+        INPUT :
+            pos : Position, position (x, y) positive ayant pour partie
+                            flottante 0.5 en x ou (exclusif) en y
+                            Exemple : (0.5, 1) et (4, 5.5) sont valides, mais
+                            pas (9.5, 7.5), (7, 4) ou encore (-8, 0)
+
+        OUTPUT :
+            etat : int, un type de mur
+
+        EXCEPTION :
+            ValueError, si la position du mur n'est pas valide
+        """
+
+        if isinstance(pos, tuple):
+            pos = Position(pos)
+
+        if not self.isWallPosValid(pos):
+            raise ValueError("Position de mur invalide : pos=" + str(pos))
+
+        pos = self.truePos(pos)
+
+        etat = self.map.get(pos.x, pos.y)
+
+        return etat
+
+    def setWall(self, pos:Position, id:int, save:bool=True) -> None:
+        """
+        Fonction permettant de modifier la valeur d'un mur.
+
+        INPUT :
+            pos : Position, position (x, y) positive ayant pour partie
+                            flottante 0.5 en x ou (exclusif) en y
+                            Exemple : (0.5, 1) et (4, 5.5) sont valides, mais
+                            pas (9.5, 7.5), (7, 4) ou encore (-8, 0)
+            id : int, un type de mur
+            save : bool,  s'il faut sauvegarder cette modification pour l'affichage
+
+        OUTPUT :
+            None
+
+        EXCEPTION :
+            ValueError, si la position du mur n'est pas valide
+        """
+
+        if isinstance(pos, tuple):
+            pos = Position(pos)
+
+        if not self.isWallPosValid(pos):
+            raise ValueError("Position de mur invalide")
+
+        pos = self.truePos(pos)
+
+        if save and self.recording:
+            self.modified_cells.add(pos.y*self.real_width + pos.x, self.map.get(pos.x, pos.y), id)
+
+        self.map.set(pos.x, pos.y, id)
+
+    def truePos(self, pos:Position) -> Position:
+        """
+        Fonction permettant d'avoir de vraies coordonnées à partir des
+        coordonnées que le reste du programme voit.
+
+        Exemple : la case (2  , 1) a pour position réelle (5, 3)
+                          (2.5, 1) a pour position réelle (6, 3)
+                          (0  , 0) a pour position réelle (1, 1)
+
+        INPUT :
+            pos : objet Position, position (x, y) positive
+        """
+
+        pos = Position(pos)
+
+        pos = pos*2 + (1, 1)
+
+        return Position((round(pos.x), round(pos.y)))
+
+    ############################################################################
+    # Accès rapides par indice entier, pour les boucles des algorithmes.
+    #
+    # Une cellule (x, y) a pour indice i = y*width + x. On y accède sans
+    # conversion en Position ni vérification : un indice invalide donne un
+    # résultat faux ou une IndexError. Avec debug = True, les indices sont
+    # vérifiés et une ValueError est levée, comme pour getCell et getWall.
+    #
+    # Un mur a pour indice w = 2*i + o, avec i l'indice de la cellule à sa
+    # gauche ou au dessus de lui, et o = 0 pour un mur vertical (à droite de
+    # la cellule), o = 1 pour un mur horizontal (en dessous de la cellule).
+    #
+    # Les murs extérieurs peuvent être lus (wallRight de la dernière colonne,
+    # wallDown de la dernière ligne) : ils sont toujours pleins.
+    ############################################################################
+
+    def cellId(self, pos:Position) -> int:
+        """
+        Fonction retournant l'indice d'une cellule
+
+        INPUT :
+            pos : Position ou tuple, position (x, y) de la cellule
+
+        OUTPUT :
+            int, indice y*width + x
+        """
+
+        if isinstance(pos, tuple):
+            return pos[1]*self.width + pos[0]
+
+        return pos.y*self.width + pos.x
+
+    def cellPos(self, i:int) -> Position:
+        """
+        Fonction retournant la position d'une cellule à partir de son indice
+
+        INPUT :
+            i : int, indice de la cellule
+
+        OUTPUT :
+            Position, position (x, y) de la cellule
+        """
+
+        y, x = divmod(i, self.width)
+
+        return Position.interned(x, y)
+
+    def checkCellId(self, i:int, right:bool=False, down:bool=False) -> None:
+        """
+        Procédure vérifiant un indice de cellule, utilisée en mode debug.
+
+        INPUT :
+            i : int, indice de la cellule
+            right : bool, s'il faut aussi que le mur de droite soit modifiable
+            down : bool, s'il faut aussi que le mur du bas soit modifiable
+
+        EXCEPTION :
+            ValueError : si l'indice est invalide
+        """
+
+        if not isinstance(i, int) or i not in range(self.width*self.height):
+            raise ValueError("Indice de cellule invalide : i=" + str(i))
+
+        if right and i%self.width == self.width-1:
+            raise ValueError("Mur extérieur non modifiable : i=" + str(i))
+
+        if down and i//self.width == self.height-1:
+            raise ValueError("Mur extérieur non modifiable : i=" + str(i))
+
+    def cellState(self, i:int) -> int:
+        """
+        Fonction retournant l'état de la cellule d'indice i, sans vérification
+        """
+
+        if self.debug:
+            self.checkCellId(i)
+
+        y, x = divmod(i, self.width)
+
+        return self._grid[(2*y+1)*self.real_width + 2*x+1]
+
+    def setCellState(self, i:int, id:int, save:bool=True) -> None:
+        """
+        Procédure modifiant l'état de la cellule d'indice i, sans vérification
+
+        INPUT :
+            i : int, indice de la cellule
+            id : int, un type de cellule
+            save : bool, s'il faut sauvegarder cette modification pour l'affichage
+        """
+
+        if self.debug:
+            self.checkCellId(i)
+
+        y, x = divmod(i, self.width)
+        k = (2*y+1)*self.real_width + 2*x+1
+
+        if save and self.recording:
+            self.modified_cells.add(k, self._grid[k], id)
+
+        self._grid[k] = id
+
+    def wallRight(self, i:int) -> int:
+        """
+        Fonction retournant l'état du mur à droite de la cellule d'indice i,
+        sans vérification
+        """
+
+        if self.debug:
+            self.checkCellId(i)
+
+        y, x = divmod(i, self.width)
+
+        return self._grid[(2*y+1)*self.real_width + 2*x+2]
+
+    def wallDown(self, i:int) -> int:
+        """
+        Fonction retournant l'état du mur en dessous de la cellule d'indice i,
+        sans vérification
+        """
+
+        if self.debug:
+            self.checkCellId(i)
+
+        y, x = divmod(i, self.width)
+
+        return self._grid[(2*y+2)*self.real_width + 2*x+1]
+
+    def setWallRight(self, i:int, id:int, save:bool=True) -> None:
+        """
+        Procédure modifiant le mur à droite de la cellule d'indice i, sans
+        vérification
+
+        INPUT :
+            i : int, indice de la cellule
+            id : int, un type de mur
+            save : bool, s'il faut sauvegarder cette modification pour l'affichage
+        """
+
+        if self.debug:
+            self.checkCellId(i, right=True)
+
+        y, x = divmod(i, self.width)
+        k = (2*y+1)*self.real_width + 2*x+2
+
+        if save and self.recording:
+            self.modified_cells.add(k, self._grid[k], id)
+
+        self._grid[k] = id
+
+    def setWallDown(self, i:int, id:int, save:bool=True) -> None:
+        """
+        Procédure modifiant le mur en dessous de la cellule d'indice i, sans
+        vérification
+
+        Cf Maze.setWallRight
+        """
+
+        if self.debug:
+            self.checkCellId(i, down=True)
+
+        y, x = divmod(i, self.width)
+        k = (2*y+2)*self.real_width + 2*x+1
+
+        if save and self.recording:
+            self.modified_cells.add(k, self._grid[k], id)
+
+        self._grid[k] = id
+
+    def neighborId(self, i:int, dir:Direction) -> int:
+        """
+        Fonction retournant l'indice de la cellule voisine de i dans la
+        direction dir
+
+        INPUT :
+            i : int, indice de la cellule
+            dir : Direction, direction de la voisine
+
+        OUTPUT :
+            int, indice de la voisine, ou -1 si elle est hors du plateau
+        """
+
+        if dir.x != 0:
+            x = i%self.width + dir.x
+
+            if x < 0 or x >= self.width:
+                return -1
+        else:
+            y = i//self.width + dir.y
+
+            if y < 0 or y >= self.height:
+                return -1
+
+        return i + self.cell_deltas[dir.id]
+
+    def wallId(self, i:int, dir:Direction) -> int:
+        """
+        Fonction retournant l'indice du mur entre la cellule i et sa voisine
+        dans la direction dir
+
+        INPUT :
+            i : int, indice de la cellule
+            dir : Direction, direction du mur
+
+        OUTPUT :
+            int, indice du mur
+        """
+
+        return 2*i + self.wall_deltas[dir.id]
+
+    def wallPos(self, w:int) -> Position:
+        """
+        Fonction retournant la position d'un mur à partir de son indice.
+        Exemple : le mur à droite de (2, 1) a pour position (2.5, 1)
+
+        INPUT :
+            w : int, indice du mur
+
+        OUTPUT :
+            Position, position du mur
+        """
+
+        y, x = divmod(w >> 1, self.width)
+
+        if w & 1:
+            return Position((x, y+0.5))
+        else:
+            return Position((x+0.5, y))
+
+    def checkWallId(self, w:int, write:bool=False) -> None:
+        """
+        Procédure vérifiant un indice de mur, utilisée en mode debug.
+
+        INPUT :
+            w : int, indice du mur
+            write : bool, s'il faut aussi que le mur soit modifiable
+
+        EXCEPTION :
+            ValueError : si l'indice est invalide
+        """
+
+        if not isinstance(w, int) or w not in range(2*self.width*self.height):
+            raise ValueError("Indice de mur invalide : w=" + str(w))
+
+        self.checkCellId(w >> 1, right=write and w & 1 == 0, down=write and w & 1 == 1)
+
+    def wallState(self, w:int) -> int:
+        """
+        Fonction retournant l'état du mur d'indice w, sans vérification
+        """
+
+        if self.debug:
+            self.checkWallId(w)
+
+        y, x = divmod(w >> 1, self.width)
+
+        if w & 1:
+            return self._grid[(2*y+2)*self.real_width + 2*x+1]
+        else:
+            return self._grid[(2*y+1)*self.real_width + 2*x+2]
+
+    def setWallState(self, w:int, id:int, save:bool=True) -> None:
+        """
+        Procédure modifiant l'état du mur d'indice w, sans vérification
+
+        INPUT :
+            w : int, indice du mur
+            id : int, un type de mur
+            save : bool, s'il faut sauvegarder cette modification pour l'affichage
+        """
+
+        if self.debug:
+            self.checkWallId(w, write=True)
+
+        y, x = divmod(w >> 1, self.width)
+
+        if w & 1:
+            k = (2*y+2)*self.real_width + 2*x+1
+        else:
+            k = (2*y+1)*self.real_width + 2*x+2
+
+        if save and self.recording:
+            self.modified_cells.add(k, self._grid[k], id)
+
+        self._grid[k] = id
+
+    def wallToward(self, i:int, dir:Direction) -> int:
+        """
+        Fonction retournant l'état du mur entre la cellule d'indice i et sa
+        voisine dans la direction dir, sans vérification
+
+        INPUT :
+            i : int, indice de la cellule
+            dir : Direction, direction du mur
+
+        OUTPUT :
+            int, un type de mur
+        """
+
+        return self.wallState(2*i + self.wall_deltas[dir.id])
+
+    def setWallToward(self, i:int, dir:Direction, id:int, save:bool=True) -> None:
+        """
+        Procédure modifiant le mur entre la cellule d'indice i et sa voisine
+        dans la direction dir, sans vérification
+
+        Cf Maze.wallToward et Maze.setWallRight
+        """
+
+        self.setWallState(2*i + self.wall_deltas[dir.id], id, save)
+
+    def setWallLine(self, i:int, count:int, down:bool, id:int, save:bool=True) -> None:
+        """
+        Procédure modifiant une ligne droite de murs d'un seul coup, sans
+        vérification, cf Maze.setWallLineStates
+
+        INPUT :
+            i : int, indice de la première cellule
+            count : int, nombre de murs
+            down : bool, True pour les murs en dessous des cellules i à
+                   i+count-1 (ligne horizontale), False pour les murs à
+                   droite des cellules i, i+width... (ligne verticale)
+            id : int, un type de mur
+            save : bool, s'il faut sauvegarder cette modification pour l'affichage
+        """
+
+        self.setWallLineStates(i, bytes([id])*count, down, save)
+
+    def setWallLineStates(self, i:int, states:bytes, down:bool, save:bool=True) -> None:
+        """
+        Procédure modifiant une ligne droite de murs, chacun avec son propre
+        type, sans vérification : une seule affectation de tranche quand le
+        stockage a un tampon contigu (cf GenericStorage.buffer)
+
+        INPUT :
+            i : int, indice de la première cellule
+            states : bytes, type de chaque mur, cf Maze.setWallLine pour
+                     l'ordre des murs
+            down : bool, sens de la ligne, cf Maze.setWallLine
+            save : bool, s'il faut sauvegarder cette modification pour
+                   l'affichage. Seuls les murs qui changent sont sauvegardés
+        """
+
+        count = len(states)
+
+        if count == 0:
+            return
+
+        y, x = divmod(i, self.width)
+
+        if down:
+            first_k = (2*y+2)*self.real_width + 2*x+1
+            step = 2
+        else:
+            first_k = (2*y+1)*self.real_width + 2*x+2
+            step = 2*self.real_width
+
+        if self.debug:
+            self.checkCellId(i, right=not down, down=down)
+            self.checkCellId(i + (count-1)*(1 if down else self.width), right=not down, down=down)
+
+        stop_k = first_k + step*(count-1) + 1
+        grid = self._grid
+
+        if save and self.recording:
+            for k, id in zip(range(first_k, stop_k, step), states):
+                if grid[k] != id:
+                    self.modified_cells.add(k, grid[k], id)
+
+        if self._map.buffer is None:
+            for k, id in zip(range(first_k, stop_k, step), states):
+                grid[k] = id
+        else:
+            grid[first_k:stop_k:step] = states
+
+    @property
+    def adjacency(self) -> 'Adjacency':
+        """
+        Table des voisines et des murs de chaque cellule, construite à la
+        première utilisation et partagée par tous les labyrinthes de même
+        taille (cf environment/adjacency.py). Pour un stockage compact (cf
+        GenericStorage.COMPACT), les voisines sont calculées à la demande.
+        La taille ne change jamais : la table est gardée par le labyrinthe
+        """
+
+        if self._adjacency is None:
+            if self.map.COMPACT:
+                self._adjacency = ComputedAdjacency(self.width, self.height)
+            else:
+                self._adjacency = getAdjacency(self.width, self.height)
+
+        return self._adjacency
+
+    def displayAsText(self) -> None:
+        """
+        Fonction affichant la map dans la console Python.
+        """
+
+        print('\n'*30)
+
+        for y in range(self.real_height):
+            for x in range(self.real_width):
+                etat = self.map.get(x, y)
+
+                dico = {self.EMPTY        :' ',
+                        self.WALL         :'█',
+                        self.RED_WALL     :'▓',
+                        self.START        :'«',
+                        self.GOAL         :'»',
+                        self.YELLOW_CELL  :'*',
+                        self.ORANGE_CELL  :'×',
+                        self.VISITED_PATH :'*',
+                        self.SOLUTION_PATH:'$',
+                        self.NOT_VISITED  :'-'}
+
+                try:
+                    s = dico[etat]
+                except KeyError:
+                    s = '?'
+
+                print(s, end='')
+                # On affiche chaque caractère sans retour à la ligne
+
+            print() # Retour à la ligne
+
+    def rangeDimension(self) -> Dimensions:
+        """
+        Fonction permettant juste de compresser
+
+        for x in range(width):
+            for y in range(height):
+                ...
+
+        en
+
+        for x, y in rangeDimension():
+            ...
+
+        INPUT :
+            self : instance de Maze, paramètre geré automatiquement par Python
+
+        OUTPUT :
+            Dimensions, itérable de coordonnées (x, y)
+        """
+
+        return self.dimensions
+
+if __name__ == "__main__":
+    import contextlib
+    import os
+    import sys
+    import tempfile
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    from environment.maze import Maze
+    from environment.random_streams import RandomStreams
+    from generation.recursive_backtracker_gen import Generation
+    from resolution.recursive_backtracker_res import Resolution
+    # Les algorithmes utilisent environment.maze, il faut la même classe
+
+    def solve(maze:Maze) -> int:
+        """
+        Fonction résolvant le labyrinthe, et retournant la taille du chemin
+        de solution
+        """
+
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            Resolution(slow=False, verbose=False, streams=RandomStreams(1)).start(maze)
+
+        return sum(maze.cellState(i) == Maze.SOLUTION_PATH for i in range(maze.width*maze.height))
+
+    tmp_dir = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp_dir.name, "test.map")
+
+    maze = Maze(12, 9, "MMAP", path=path)
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        Generation(slow=False, start_in_corner=False, end_in_corner=False, wall_ratio=100, verbose=False,
+                   streams=RandomStreams(1)).start(maze)
+
+    generated = maze.map.snapshot()
+    length = solve(maze)
+    assert length > 0
+    maze.map.close()
+
+    storage = MmapStorage.open(path)
+    assert storage.snapshot() == generated
+    storage.close()
+    # La résolution n'a pas été sauvegardée
+
+    maze = Maze.fromFile(path)
+    assert solve(maze) == length
+    maze.map.close()
+
+    storage = MmapStorage.open(path)
+    storage[storage.real_width + 3] = Maze.VISITED_PATH
+    storage.flush(storage.start_pos, storage.goal_pos)
+    storage.close()
+    # Fichier sauvegardé avec un chemin (cellule (1, 0), jamais le départ ni
+    # l'arrivée), par une ancienne version
+
+    maze = Maze.fromFile(path)
+    assert maze.map.snapshot() == generated
+    assert solve(maze) == length
+    maze.map.close()
+
+    tmp_dir.cleanup()
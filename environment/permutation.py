@@ -0,0 +1,82 @@
+from array import array
+import random
+
+class RandomPermutation:
+    """
+    Permutation aléatoire des entiers de 0 à size-1, tirée au fur et à mesure
+
+    C'est un mélange de Fisher-Yates fait à la demande : chaque pop tire un
+    entier parmi ceux pas encore sortis, en O(1), sans créer d'objet. Les
+    entiers sont rangés dans une array, à 4 octets chacun. On ne paie
+    l'aléatoire que pour les éléments réellement sortis.
+
+    Tout tirer donne le même résultat que random.shuffle sur la liste des
+    entiers, lue à l'envers, avec la même graine.
+    """
+
+    def __init__(self, size:int, rng:random.Random) -> None:
+        """
+        INPUT :
+            size : int, nombre d'entiers
+            rng : random.Random, générateur à utiliser (cf RandomStreams)
+        """
+
+        self._values = array('i', range(size))
+
+        self._randrange = rng.randrange
+
+        self._remaining = size
+        # Les entiers pas encore sortis sont dans _values[:_remaining]
+
+    def pop(self) -> int:
+        """
+        Sors un entier au hasard parmi ceux restants
+
+        OUTPUT :
+            int, entier sorti
+
+        EXCEPTION :
+            ValueError : si tous les entiers sont sortis
+        """
+
+        i = self._remaining - 1
+
+        if i < 0:
+            raise ValueError("Permutation vide")
+
+        values = self._values
+
+        if i != 0:
+            j = self._randrange(i + 1)
+            values[i], values[j] = values[j], values[i]
+            # Même tirage que random.shuffle pour cette case
+
+        self._remaining = i
+
+        return values[i]
+
+    def __len__(self) -> int:
+        """
+        Nombre d'entiers restants, utilisé par la fonction len
+        """
+
+        return self._remaining
+
+if __name__ == "__main__":
+    values = list(range(1000))
+    random.Random(4).shuffle(values)
+
+    permutation = RandomPermutation(1000, random.Random(4))
+    drawn = [permutation.pop() for _ in range(1000)]
+
+    assert drawn == values[::-1]
+    assert len(permutation) == 0
+
+    try:
+        permutation.pop()
+        assert False
+    except ValueError:
+        pass
+
+    permutation = RandomPermutation(10, random.Random(1))
+    assert sorted(permutation.pop() for _ in range(10)) == list(range(10))
@@ -0,0 +1,201 @@
+from array import array
+from collections import deque
+import threading
+
+class FrameQueue:
+    """
+    File bornée de frames entre la génération et la résolution, lancées dans
+    un thread (producteur), et l'affichage (consommateur).
+
+    Côté producteur, elle s'utilise comme un fichier de rejeu (cf
+    ChangeLog.attach) : chaque frame synchronisée y est copiée puis oubliée
+    par le journal. Quand la file est pleine, le producteur attend que
+    l'affichage la vide : la mémoire occupée reste bornée.
+
+    Côté affichage, elle remplace Maze.modified_cells et se lit frame par
+    frame comme un ChangeLog (cf Player). Les frames lues ne sont pas
+    gardées : on ne peut pas revenir en arrière.
+
+    Utilisation :
+        frames = FrameQueue(256)
+        frames.start(maze, [gen, res])
+        display_maze.modified_cells = frames
+    """
+
+    def __init__(self, maxsize:int) -> None:
+        """
+        INPUT :
+            maxsize : int, nombre maximal de frames en attente d'affichage
+        """
+
+        self.pending = deque()
+        # Frames en attente d'affichage, None une fois le producteur terminé
+
+        self.free_slots = threading.Semaphore(maxsize)
+        # Places libres dans la file. Le module queue n'est pas utilisé : il
+        # est masqué par environment/queue.py quand on lance ce fichier
+
+        self.grid = None
+        # Cf ChangeLog.grid
+
+        self.received = 0
+        # Nombre de frames produites
+
+        self.consumed = 0
+        # Nombre de frames lues par l'affichage
+
+        self.complete = False
+        # Si le producteur a terminé et que toutes ses frames ont été lues
+
+        self.thread = None
+
+    def start(self, maze:'Maze', algorithms:list) -> None:
+        """
+        Procédure lançant les algorithmes les uns après les autres dans un
+        thread, leurs frames arrivant dans la file au fur et à mesure
+
+        INPUT :
+            maze : Maze, labyrinthe sur lequel travaillent les algorithmes,
+                   différent de celui affiché
+            algorithms : list, algorithmes à lancer (cf GenericGeneration et
+                         GenericResolution)
+        """
+
+        maze.modified_cells.keyframe_interval = 0
+        maze.modified_cells.attach(self)
+        # Les keyframes ne servent à rien, on ne peut pas revenir en arrière
+
+        self.thread = threading.Thread(target=self._produce, args=(maze, algorithms), daemon=True)
+        self.thread.start()
+        # Thread démon : fermer la fenêtre arrête aussi le producteur
+
+    def _produce(self, maze:'Maze', algorithms:list) -> None:
+        """
+        Procédure exécutée par le thread producteur
+        """
+
+        try:
+            for algorithm in algorithms:
+                algorithm.start(maze)
+        finally:
+            self.close()
+            # Même en cas d'erreur, l'affichage doit savoir que c'est fini
+
+    def writeFrame(self, records:array, start:int, end:int) -> None:
+        """
+        Procédure ajoutant une frame à la file, en attendant qu'il y ait de
+        la place. Cf ReplayWriter.writeFrame
+        """
+
+        self.free_slots.acquire()
+
+        self.pending.append(records[start:end])
+        self.received += 1
+
+    def writeKeyframe(self, n:int, grid:bytes) -> None:
+        """
+        Procédure ignorant les keyframes, cf ReplayWriter.writeKeyframe
+        """
+
+        pass
+
+    def close(self) -> None:
+        """
+        Procédure signalant que le producteur a terminé
+        """
+
+        self.pending.append(None)
+
+    def frameRecords(self, n:int) -> (tuple, None):
+        """
+        Fonction retirant de la file la frame n, seulement si c'est la
+        suivante, sans attendre. Cf ChangeLog.frameRecords
+
+        OUTPUT :
+            tuple (array des modifications, range des indices de la frame),
+            ou None si la frame n'est pas (ou plus) disponible
+        """
+
+        if n != self.consumed or self.complete:
+            return None
+
+        try:
+            records = self.pending.popleft()
+        except IndexError:
+            return None
+            # Le producteur n'a pas encore fini cette frame
+
+        if records is None:
+            self.complete = True
+            return None
+
+        self.consumed += 1
+        self.free_slots.release()
+
+        return (records, range(len(records)))
+
+    def keyframeBefore(self, n:int) -> tuple:
+        """
+        Fonction retournant la frame courante : les frames lues sont
+        oubliées. Cf ChangeLog.keyframeBefore
+        """
+
+        return (self.consumed, None)
+
+    def firstFrame(self) -> int:
+        """
+        Fonction retournant la première frame encore disponible
+        """
+
+        return self.consumed
+
+    def frameCount(self) -> int:
+        """
+        Fonction retournant le nombre de frames produites jusqu'ici
+        """
+
+        return self.received
+
+    def isComplete(self) -> bool:
+        """
+        Fonction retournant True si le producteur a terminé et que toutes
+        ses frames ont été lues
+        """
+
+        return self.complete
+
+if __name__ == "__main__":
+    from maze import Maze
+    import time
+
+    class Writer:
+        def start(self, maze):
+            for i in range(maze.width*maze.height):
+                maze.setCellState(i, Maze.YELLOW_CELL)
+                maze.syncModifiedCells()
+
+    producer = Maze(8, 8)
+    frames = FrameQueue(4)
+    frames.start(producer, [Writer()])
+
+    time.sleep(0.1)
+    assert frames.received == 4
+    # Le producteur attend que la file se vide
+
+    consumer = Maze(8, 8)
+    consumer.modified_cells = frames
+
+    while not frames.isComplete():
+        data = frames.frameRecords(frames.consumed)
+
+        if data is not None:
+            records, frame = data
+
+            for j in frame:
+                consumer._grid[records[j] >> 16] = records[j] & 0xFF
+
+    frames.thread.join()
+
+    assert frames.consumed == 64
+    assert consumer.map.snapshot() == producer.map.snapshot()
+    assert frames.frameRecords(0) is None
@@ -0,0 +1,210 @@
+from array import array
+
+class Player:
+    """
+    Lecteur de l'animation enregistrée d'un labyrinthe : avance, recule et va
+    directement à n'importe quelle frame.
+
+    Les frames viennent de Maze.modified_cells, en mémoire (ChangeLog), dans
+    un fichier de rejeu (ReplayReader) ou d'une génération en cours
+    (FrameQueue, sans retour en arrière possible). Chaque modification garde
+    l'ancien état de sa case : reculer d'une frame revient à la défaire. Pour
+    aller loin, on repart de la dernière keyframe avant la frame voulue, ce
+    qui coûte au plus l'intervalle entre deux keyframes.
+
+    Utilisable sans affichage :
+        player = Player(maze)
+        player.seek(1000)
+        player.stepBackward()
+    """
+
+    def __init__(self, maze:'Maze') -> None:
+        """
+        INPUT :
+            maze : Maze, labyrinthe dont la grille a été préparée pour
+                   l'affichage (cf Maze.resetForDisplay et Maze.replayFrom)
+        """
+
+        self.maze = maze
+
+        self.frame = 0
+        # Nombre de frames appliquées à la grille
+
+    def frameCount(self) -> int:
+        """
+        Fonction retournant le nombre de frames de l'animation
+        """
+
+        return self.maze.modified_cells.frameCount()
+
+    def isFinished(self) -> bool:
+        """
+        Fonction retournant True si toute l'animation a été jouée et
+        qu'aucune frame ne peut plus arriver
+        """
+
+        source = self.maze.modified_cells
+
+        return source.isComplete() and self.frame == source.frameCount()
+
+    def stepForward(self) -> bool:
+        """
+        Fonction appliquant la frame suivante
+
+        OUTPUT :
+            bool, False s'il n'y a pas de frame suivante (pour l'instant)
+        """
+
+        data = self.maze.modified_cells.frameRecords(self.frame)
+
+        if data is None:
+            return False
+
+        records, frame = data
+        grid = self.maze._grid
+
+        for j in frame:
+            record = records[j]
+            grid[record >> 16] = record & 0xFF
+            # Cf ChangeLog pour le format d'une modification
+
+        self.frame += 1
+
+        return True
+
+    def coalesceForward(self, count:int) -> tuple:
+        """
+        Fonction appliquant les count frames suivantes en une seule fois :
+        seul le dernier état de chaque case touchée est écrit dans la grille.
+        Utilisé par l'affichage pour rattraper son retard.
+
+        INPUT :
+            count : int, nombre de frames à appliquer
+
+        OUTPUT :
+            tuple (frames appliquées, modifications lues, cases écrites)
+        """
+
+        source = self.maze.modified_cells
+        pending = array('Q')
+        frames = 0
+
+        while frames < count:
+            data = source.frameRecords(self.frame + frames)
+
+            if data is None:
+                break
+
+            records, frame = data
+            pending.extend(records[frame.start:frame.stop])
+
+            frames += 1
+
+        merged = {record >> 16: record & 0xFF for record in pending}
+        # La dernière modification d'une case l'emporte
+
+        grid = self.maze._grid
+
+        for k, state in merged.items():
+            grid[k] = state
+
+        self.frame += frames
+
+        return (frames, len(pending), len(merged))
+
+    def stepBackward(self) -> bool:
+        """
+        Fonction défaisant la dernière frame appliquée
+
+        OUTPUT :
+            bool, False si on était déjà au début
+        """
+
+        if self.frame == self.maze.modified_cells.firstFrame():
+            return False
+            # Début de l'animation, ou frames déjà oubliées (cf FrameQueue)
+
+        records, frame = self.maze.modified_cells.frameRecords(self.frame - 1)
+        grid = self.maze._grid
+
+        for j in reversed(frame):
+            record = records[j]
+            grid[record >> 16] = (record >> 8) & 0xFF
+            # On remet l'ancien état, dans l'ordre inverse
+
+        self.frame -= 1
+
+        return True
+
+    def seek(self, target:int) -> int:
+        """
+        Fonction allant directement à une frame
+
+        INPUT :
+            target : int, nombre de frames à avoir appliqué
+
+        OUTPUT :
+            int, frame atteinte, limitée aux frames disponibles
+        """
+
+        target = max(self.maze.modified_cells.firstFrame(), min(target, self.frameCount()))
+
+        keyframe, grid = self.maze.modified_cells.keyframeBefore(target)
+
+        if target < self.frame and self.frame - target <= target - keyframe:
+            # Plus proche en reculant depuis la frame courante
+
+            while self.frame > target:
+                self.stepBackward()
+        else:
+            if target < self.frame or keyframe > self.frame:
+                # On repart de la keyframe, plus proche que la frame courante
+
+                if grid is None:
+                    self.maze.resetAll(save=False)
+                else:
+                    self.maze.map.restore(grid)
+
+                self.frame = keyframe
+
+            while self.frame < target:
+                self.stepForward()
+
+        return self.frame
+
+if __name__ == "__main__":
+    from maze import Maze
+    import random
+
+    maze = Maze(6, 4)
+    maze.modified_cells.keyframe_interval = 10
+    states = []
+
+    for n in range(50):
+        states.append(maze.map.snapshot())
+
+        for _ in range(3):
+            maze.setCellState(random.randrange(24), random.choice((Maze.YELLOW_CELL, Maze.ORANGE_CELL, Maze.EMPTY)))
+            maze.setWallRight(random.randrange(4)*6 + random.randrange(5), random.choice((Maze.WALL, Maze.EMPTY)))
+
+        maze.syncModifiedCells()
+
+    states.append(maze.map.snapshot())
+
+    maze.resetForDisplay()
+    player = Player(maze)
+
+    for target in (50, 0, 37, 36, 12, 49, 3, 60):
+        frame = player.seek(target)
+        assert maze.map.snapshot() == states[frame]
+
+    player.seek(0)
+    frames, changes, written = player.coalesceForward(20)
+    assert (frames, changes) == (20, 120) and written < changes
+    assert maze.map.snapshot() == states[20]
+    assert player.coalesceForward(100)[0] == 30
+
+    while player.stepBackward():
+        pass
+
+    assert maze.map.snapshot() == states[0]
@@ -1,103 +1,155 @@
 import random
+from operator import itemgetter
 
-class Position:
+class Position(tuple):
     """
     Classe servant à mieux gérer les positions.
     On réunit les composantes x et y en un seul objet.
 
+    Une position est un tuple (x, y), créée par Position((x, y)) ou
+    Position(p) : elle n'est pas modifiable, toutes les opérations créent une
+    nouvelle position. On peut donc partager une même instance sans risque,
+    cf Position.interned.
+    La création, le hash et l'égalité sont ceux du tuple, faits directement
+    en C.
+
     NOTE : dans l'aide des fonctions, il est marqué 'Position' au lieu de
            Position car Python ne comprend pas l'utilisation de la classe
            Position à l'intérieur d'elle-même.
     """
 
-    def __init__(self, value:(tuple, 'Position')) -> None:
+    __slots__ = ()
+    # Pas de dictionnaire par instance : une position prend la place d'un tuple
+
+    MAX_INTERNED = 2**22
+    # Nombre maximal de positions gardées en cache par Position.interned
+
+    _interned = None
+    _interned_width = 0
+    _interned_height = 0
+    # Cache des positions entières, cf Position.enableInterning
+
+    x = property(itemgetter(0))
+    y = property(itemgetter(1))
+    # Coordonnées, en lecture seule
+
+    def __new__(cls, value:(tuple, 'Position')) -> 'Position':
         """
-        Initialisation de l'instance.
+        Création d'une position.
 
         INPUT :
-            self : instance de Position
             value : tuple (x, y) ou Position, valeur à affecter
 
         OUTPUT :
-            None
+            Position, la position
+
+        EXCEPTION :
+            ValueError : si value n'est pas un couple (x, y)
         """
 
-        if isinstance(value, tuple):
-            self.x, self.y = value
-        elif isinstance(value, Position):
-            self.x, self.y = value.x, value.y
-        else:
-            raise ValueError("Type inconnu. Type : "+str(type(other)))
+        if not isinstance(value, tuple):
+            raise ValueError("Type inconnu. Type : " + str(type(value)))
+
+        if len(value) != 2:
+            raise ValueError("Une position a 2 composantes : " + str(value))
+
+        return _new(cls, value)
+
+    def __reduce__(self) -> tuple:
+        """
+        Méthode utilisée par pickle et copy.
+        """
+
+        return (Position, (tuple(self),))
 
     @staticmethod
-    def random(p_min:('Position', tuple), p_max:('Position', tuple)) -> 'Position':
+    def enableInterning(width:int, height:int) -> None:
         """
-        Fonction permettant de créer une position aléatoire
-        entre (x_min, y_min) et (x_max, y_max)
+        Procédure activant le cache de Position.interned pour toutes les
+        positions entières de (0, 0) à (width-1, height-1).
+        Ne fait rien si la grille dépasse Position.MAX_INTERNED positions.
 
         INPUT :
-            p_min : objet Position, x et y minimal
-                    si tuple, couple (x, y)
-            p_max : objet Position, x et y maximal
-                    si tuple, couple (x, y)
-
-        OUTPUT :
-            Position, position aléatoire
+            width : int, largeur de la grille
+            height : int, hauteur de la grille
         """
 
-        p_min = Position(p_min)
-        p_max = Position(p_max)
+        if width*height > Position.MAX_INTERNED:
+            return
 
-        x = random.randint(p_min.x, p_max.x)
-        y = random.randint(p_min.y, p_max.y)
+        if Position._interned is not None:
+            if width <= Position._interned_width and height <= Position._interned_height:
+                return
+                # Le cache couvre déjà cette grille
 
-        return Position((x, y))
+        Position._interned = [None]*(width*height)
+        Position._interned_width = width
+        Position._interned_height = height
 
-    def _basicOperation(self, other:('Position', tuple, int, float), name:str, operation:'function', input_type:tuple) -> 'Position':
+    @staticmethod
+    def disableInterning() -> None:
         """
-        Fonction exécutée lors d'une opération mathématique ou logique avec une
-        position, par exeple 'p1 + p2' ou 'p1 == p2'.
+        Procédure désactivant et vidant le cache de Position.interned
+        """
+
+        Position._interned = None
+        Position._interned_width = 0
+        Position._interned_height = 0
 
-        Note : dans les commentaires, 'o' représente l'opération.
+    @staticmethod
+    def interned(x:int, y:int) -> 'Position':
+        """
+        Fonction retournant la position (x, y). Si le cache est activé (cf
+        Position.enableInterning) et que (x, y) est dans la grille, c'est
+        toujours la même instance qui est retournée : des millions de
+        références à une même case ne coûtent qu'un seul objet.
 
         INPUT :
-            self : objet Position
-            other : Position ou tuple ou int ou float, autre membre de l'opération
-            name : str, nom de l'opération
-            opération : func, fonction à exécuter sur les membres
-            input_type : tuple, type des entrées possibles
+            x : int, abscisse
+            y : int, ordonnée
 
         OUTPUT :
-            p : Position, nouvelle position
+            Position, la position
         """
 
-        if Position in input_type and isinstance(other, Position):
-            # On récupère le type de la variable 'other'
-            # pour savoir s'il s'agit d'un nombre, d'une position, etc...
+        table = Position._interned
+
+        if table is not None and 0 <= x < Position._interned_width and 0 <= y < Position._interned_height:
+            i = y*Position._interned_width + x
+            p = table[i]
+
+            if p is None:
+                p = _new(Position, (x, y))
+                table[i] = p
+
+            return p
 
-            # Si Position o Position
-            coords = (operation(self.x, other.x), operation(self.y, other.y))
-        elif Position in input_type and isinstance(other, tuple):
-            # Si Position o (x, y)
+        return _new(Position, (x, y))
 
-            coords = (operation(self.x, other[0]), operation(self.y, other[1]))
-        elif int in input_type and isinstance(other, int):
-            # Si Position o k avec k entier
+    @staticmethod
+    def random(p_min:('Position', tuple), p_max:('Position', tuple), rng:'random.Random') -> 'Position':
+        """
+        Fonction permettant de créer une position aléatoire
+        entre (x_min, y_min) et (x_max, y_max)
 
-            coords = (operation(self.x, other), operation(self.y, other))
-        elif float in input_type and isinstance(other, float):
-            # Si Position o k avec k flottant
+        INPUT :
+            p_min : objet Position, x et y minimal
+                    si tuple, couple (x, y)
+            p_max : objet Position, x et y maximal
+                    si tuple, couple (x, y)
+            rng : random.Random, générateur aléatoire (cf RandomStreams)
 
-            coords = (operation(self.x, other), operation(self.y, other))
-        else:
-            # Si c'est une opération par un autre type
+        OUTPUT :
+            Position, position aléatoire
+        """
 
-            raise ValueError(name + " inconnue, mauvais type. Type : "+str(type(other)))
+        p_min = Position(p_min)
+        p_max = Position(p_max)
 
-        p = Position(coords)
-        # On crée une nouvelle position
+        x = rng.randint(p_min.x, p_max.x)
+        y = rng.randint(p_min.y, p_max.y)
 
-        return p
+        return Position.interned(x, y)
 
     def __str__(self) -> str:
         """
@@ -110,84 +162,66 @@ class Position:
             s : str, description de l'objet
         """
 
-        s = "Position object at (x:{0}, y:{1})".format(self.x, self.y)
-
         return 'P:' + self.strPos()
 
     def __repr__(self) -> tuple:
         return self.__str__()
 
-    def __mul__(self, other:(int, float, tuple, 'Position')) -> 'Position':
+    def __mul__(self, other:(int, float)) -> 'Position':
         """
         Fonction exécutée par python lorsque l'objet est multiplié.
-        Cf Position._basicOperation(self, other, name, operation)
 
         Utilisé pour p*2 ou p*-1 .
 
         INPUT :
             self : instance de Position
-            other : int ou float ou tuple ou Position, ce qui va être multiplié
+            other : int ou float, ce qui va être multiplié
 
         OUTPUT :
             p : Position, nouvelle position
-        """
-
-        return self._basicOperation(other, "Multiplication", lambda a, b : a*b, (int, float))
 
-    def __add__(self, other:(int, float, tuple, 'Position')) -> 'Position':
+        EXCEPTION :
+            ValueError : si other n'est pas un nombre
         """
-        Fonction exécutée par python lorsque l'objet est additionné.
 
-        Utilisé pour p1+p2 .
+        if isinstance(other, (int, float)):
+            return _new(Position, (self[0]*other, self[1]*other))
 
-        Cf Position.__mul__(self, other)
-        """
+        raise ValueError("Multiplication inconnue, mauvais type. Type : "+str(type(other)))
 
-        return self._basicOperation(other, "Addition", lambda a, b : a+b, (Position, ))
+    __rmul__ = __mul__
+    # 2*p et non pas la répétition du tuple
 
-    def __truediv__(self, other:(int, float, tuple, 'Position')) -> 'Position':
+    def __add__(self, other:(tuple, 'Position')) -> 'Position':
         """
-        Fonction exécutée par python lorsque l'objet est divisé ('/').
+        Fonction exécutée par python lorsque l'objet est additionné.
 
-        Utilisé pour p/2 pour avoir des flottants pour les murs.
+        Utilisé pour p1+p2 ou p+(x, y) .
 
         Cf Position.__mul__(self, other)
         """
 
-        return self._basicOperation(other, "Division", lambda a, b : a/b, (int, ))
-
-    def __eq__(self, other:('Position', tuple)) -> bool:
-        """
-        Fonction exécutée par python lors d'un test d'égalité ('==').
+        if isinstance(other, tuple):
+            return _new(Position, (self[0]+other[0], self[1]+other[1]))
 
-        Cf Position.__mul__(self, other)
-        """
+        raise ValueError("Addition inconnue, mauvais type. Type : "+str(type(other)))
 
-        if isinstance(other, Position):
-            return self.x == other.x and self.y == other.y
-        elif isinstance(other, tuple):
-            return self.x == other[0] and self.y == other[1]
-        else:
-            raise ValueError("Égalité inconnue, mauvais type. Type : "+str(type(other)))
+    __radd__ = __add__
+    # (x, y)+p et non pas la concaténation des tuples
 
-    def __ne__(self, other:'Position') -> bool:
+    def __truediv__(self, other:int) -> 'Position':
         """
-        Fonction exécutée par python lors d'un test de différence ('!=').
+        Fonction exécutée par python lorsque l'objet est divisé ('/').
+
+        Utilisé pour p/2 pour avoir des flottants pour les murs.
 
         Cf Position.__mul__(self, other)
         """
 
-        return not self.__eq__(other)
-
-    def __hash__(self) -> hash:
-        """
-        Méthode utilisée par Python pour les dictionnaires et les sets.
-        On veut obtenir le hash de notre Position.
-        Pour celà, on utilise le hash du tuple équivalent, qui est déjà
-        implémenté par Python.
-        """
+        if isinstance(other, int):
+            return _new(Position, (self[0]/other, self[1]/other))
 
-        return self.toTuple().__hash__()
+        raise ValueError("Division inconnue, mauvais type. Type : "+str(type(other)))
 
     def strPos(self, format_nb:int=0) -> str:
         """
@@ -203,4 +237,39 @@ class Position:
         return s
 
     def toTuple(self) -> tuple:
-        return (self.x, self.y)
+        return tuple(self)
+
+_new = tuple.__new__
+# Création d'une position sans vérification, pour les opérations
+
+if __name__ == "__main__":
+    p = Position((1, 2))
+
+    assert p + (1, 1) == (2, 3)
+    assert p + Position((1, 1)) == Position((2, 3))
+    assert (1, 1) + p == (2, 3)
+    assert p*2 == 2*p == (2, 4)
+    assert p/2 == (0.5, 1)
+    assert hash(p) == hash((1, 2))
+    assert {p: 0}[(1, 2)] == 0
+
+    try:
+        p.x = 0
+        raise AssertionError("Une Position ne doit pas être modifiable")
+    except AttributeError:
+        pass
+
+    for value in ([1, 2], "12", (1, 2, 3)):
+        try:
+            Position(value)
+            raise AssertionError("Position invalide acceptée : " + repr(value))
+        except ValueError:
+            pass
+
+    Position.enableInterning(4, 4)
+    assert Position.interned(1, 2) is Position.interned(1, 2)
+    assert Position.interned(9, 9) is not Position.interned(9, 9)
+    Position.disableInterning()
+
+    import pickle
+    assert pickle.loads(pickle.dumps(p)) == p
@@ -1,4 +1,10 @@
+from collections import deque
+
 class Queue:
+    """
+    File basée sur une deque : ajout et retrait en O(1)
+    """
+
     def __init__(self, *args):
         """
         Crée une file
@@ -8,13 +14,28 @@ class Queue:
 
         INPUT :
             *args : arguments donnés
-                    Utiliser Queue(*[a, b, c]) pour exécuter Queue(a, b, c)
+                    Utiliser Queue.fromList([a, b, c]) pour beaucoup d'éléments
+        """
+
+        self._content = deque(reversed(args))
+
+    @classmethod
+    def fromList(cls, values:list) -> 'Queue':
+        """
+        Crée une file en une seule fois, équivalent à Queue(*values) sans
+        passer tous les éléments en arguments
+
+        INPUT :
+            values : list, éléments, le premier sera le dernier à sortir
+
+        OUTPUT :
+            Queue, la file
         """
 
-        self._content = []
+        queue = cls()
+        queue._content = deque(reversed(values))
 
-        for i in range(len(args)-1, -1, -1):
-            self.enqueue(args[i])
+        return queue
 
     def enqueue(self, value:object) -> None:
         """
@@ -29,6 +50,19 @@ class Queue:
 
         self._content.append(value)
 
+    def extend(self, values:'iterable') -> None:
+        """
+        Ajoute plusieurs éléments à la file, dans l'ordre
+
+        INPUT :
+            values : itérable, éléments à ajouter
+
+        OUTPUT :
+            None
+        """
+
+        self._content.extend(values)
+
     def dequeue(self) -> object:
         """
         Sors le premier élément de la pile
@@ -43,14 +77,10 @@ class Queue:
             ValueError : si la file est vide
         """
 
-        if len(self._content) == 0:
+        if not self._content:
             raise ValueError("File vide")
 
-        value = self._content[0]
-
-        del self._content[0]
-
-        return value
+        return self._content.popleft()
 
     def __str__(self) -> str:
         """
@@ -74,7 +104,7 @@ class Queue:
         return len(self._content)
 
     def get(self) -> list:
-        return self._content[::-1]
+        return list(reversed(self._content))
 
 if __name__ == "__main__":
     q = Queue(1, 2, 3)
@@ -86,3 +116,8 @@ if __name__ == "__main__":
     n = q.dequeue()
     assert n == 3
     assert q.get() == [4, 1, 2]
+
+    assert Queue.fromList([1, 2, 3]).get() == Queue(1, 2, 3).get()
+
+    q.extend([5, 6])
+    assert q.get() == [6, 5, 4, 1, 2]
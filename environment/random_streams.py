@@ -0,0 +1,79 @@
+import random
+
+class RandomStreams:
+    """
+    Flux aléatoires indépendants, tirés d'une graine principale
+
+    Chaque partie du programme (algorithme de génération, destruction des
+    murs, placement du départ et de l'arrivée, chaque tuile...) demande son
+    propre générateur avec un nom. Un même nom donne toujours les mêmes
+    nombres, quel que soit l'ordre d'exécution des autres parties : on peut
+    paralléliser ou réordonner le travail sans changer le labyrinthe.
+
+    Utilisation :
+        streams = RandomStreams(graine)
+        rng = streams.stream("generation")
+        rng_tuile = streams.stream("tile", 3, 4)
+    """
+
+    def __init__(self, seed:(int, str)) -> None:
+        """
+        INPUT :
+            seed : int ou str, graine principale
+        """
+
+        self.seed = seed
+
+    def seedFor(self, *names) -> str:
+        """
+        Fonction retournant la graine d'un flux. Elle peut être envoyée à un
+        autre processus, qui recréera le même flux avec random.Random
+
+        INPUT :
+            names : str ou int, nom du flux, par exemple ("tile", 3, 4)
+
+        OUTPUT :
+            str, graine du flux
+        """
+
+        return "{0}/{1}".format(self.seed, '/'.join(str(name) for name in names))
+        # Une graine texte est hachée par random.Random (SHA-512) : les flux
+        # de noms proches sont sans rapport, et identiques d'une exécution
+        # et d'une machine à l'autre
+
+    def stream(self, *names) -> random.Random:
+        """
+        Fonction créant un générateur aléatoire, toujours le même pour un nom
+
+        INPUT :
+            names : str ou int, nom du flux, cf RandomStreams.seedFor
+
+        OUTPUT :
+            random.Random, générateur
+        """
+
+        return random.Random(self.seedFor(*names))
+
+    def child(self, *names) -> 'RandomStreams':
+        """
+        Fonction créant des sous-flux, par exemple pour un processus
+
+        INPUT :
+            names : str ou int, nom des sous-flux
+
+        OUTPUT :
+            RandomStreams, sous-flux
+        """
+
+        return RandomStreams(self.seedFor(*names))
+
+if __name__ == "__main__":
+    streams = RandomStreams(42)
+
+    a = [streams.stream("generation").random() for _ in range(3)]
+    b = [RandomStreams(42).stream("generation").random() for _ in range(3)]
+
+    assert a == b
+    assert streams.stream("generation").random() != streams.stream("walls").random()
+    assert streams.stream("tile", 1, 23).random() != streams.stream("tile", 12, 3).random()
+    assert streams.child("tiles").stream(0).random() == random.Random(streams.child("tiles").seedFor(0)).random()
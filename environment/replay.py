@@ -0,0 +1,453 @@
+from array import array
+import bisect
+import struct
+import sys
+
+class Replay:
+    """
+    Format des fichiers de rejeu : l'animation d'une génération et d'une
+    résolution, enregistrée frame par frame (cf ReplayWriter) pour être
+    rejouée plus tard, ailleurs, sans tout garder en mémoire (cf ReplayReader).
+
+    Format du fichier, en petit-boutiste :
+        - un en-tête (cf HEADER_FORMAT) : identifiant, version, options,
+          largeur et hauteur du labyrinthe
+        - le nom de l'algorithme de génération puis celui de résolution, en
+          UTF-8, chacun précédé de sa taille sur 2 octets
+        - si l'option FLAG_GRID est présente, la grille réelle de départ, un
+          octet par case (cf GenericStorage.snapshot). Sinon l'affichage part
+          d'une grille vierge
+        - des blocs les uns après les autres, commençant par un octet de type :
+            - TAG_FRAME, une frame : son nombre de modifications sur 4 octets,
+              puis les modifications sur 8 octets chacune, au format de
+              ChangeLog
+            - TAG_KEYFRAME, une keyframe : le numéro de la frame qui la suit
+              sur 8 octets, puis la grille réelle complète
+    """
+
+    MAGIC = b"LABR"
+    VERSION = 2
+
+    HEADER_FORMAT = "<4sHHii"
+    # Identifiant, version, options, largeur, hauteur
+
+    FLAG_GRID = 1
+    # Option : la grille de départ est enregistrée
+
+    TAG_FRAME = b'F'
+    TAG_KEYFRAME = b'K'
+
+    FRAME_FORMAT = "<cI"
+    # Type, nombre de modifications d'une frame
+
+    KEYFRAME_FORMAT = "<cQ"
+    # Type, numéro de la frame suivante
+
+    SWAP_BYTES = sys.byteorder == "big"
+    # Les modifications sont écrites directement depuis une array, dont
+    # l'ordre des octets est celui de la machine
+
+class ReplayWriter(Replay):
+    """
+    Écriture d'un fichier de rejeu. S'attache à un ChangeLog (cf
+    ChangeLog.attach) : chaque frame synchronisée est écrite aussitôt.
+    """
+
+    def __init__(self, path:str, width:int, height:int, gen_name:str="", res_name:str="", grid:bytes=None) -> None:
+        """
+        Création du fichier et écriture de l'en-tête.
+
+        INPUT :
+            path : str, chemin du fichier
+            width : int, largeur du labyrinthe
+            height : int, hauteur du labyrinthe
+            gen_name : str, nom de l'algorithme de génération
+            res_name : str, nom de l'algorithme de résolution
+            grid : bytes, grille réelle de départ, None pour une grille vierge
+        """
+
+        self.path = path
+        self.frame_count = 0
+
+        self._file = open(path, "wb")
+
+        flags = 0 if grid is None else self.FLAG_GRID
+
+        self._file.write(struct.pack(self.HEADER_FORMAT, self.MAGIC, self.VERSION, flags, width, height))
+
+        for name in (gen_name, res_name):
+            data = name.encode("utf-8")
+            self._file.write(struct.pack("<H", len(data)) + data)
+
+        if grid is not None:
+            self._file.write(grid)
+
+    def writeFrame(self, records:array, start:int, end:int) -> None:
+        """
+        Procédure écrivant une frame.
+
+        INPUT :
+            records : array, modifications compactées (cf ChangeLog)
+            start : int, indice de la première modification de la frame
+            end : int, indice de fin des modifications de la frame
+        """
+
+        frame = records[start:end]
+
+        if self.SWAP_BYTES:
+            frame.byteswap()
+
+        self._file.write(struct.pack(self.FRAME_FORMAT, self.TAG_FRAME, end-start))
+        frame.tofile(self._file)
+
+        self.frame_count += 1
+
+    def writeKeyframe(self, n:int, grid:bytes) -> None:
+        """
+        Procédure écrivant une keyframe.
+
+        INPUT :
+            n : int, numéro de la frame qui suit la keyframe
+            grid : bytes, grille réelle complète
+        """
+
+        self._file.write(struct.pack(self.KEYFRAME_FORMAT, self.TAG_KEYFRAME, n))
+        self._file.write(grid)
+
+    def close(self) -> None:
+        """
+        Procédure terminant l'écriture du fichier
+        """
+
+        self._file.close()
+
+class ReplayReader(Replay):
+    """
+    Lecture d'un fichier de rejeu.
+
+    A la même interface que ChangeLog pour le rejeu (nextFrame, frameRecords,
+    keyframeBefore...) : il peut remplacer Maze.modified_cells, cf
+    Maze.replayFrom. Seule la frame en cours est en mémoire.
+
+    Lu dans l'ordre, le fichier n'est parcouru qu'une fois. Au premier accès
+    dans le désordre (cf Player.seek), la position de chaque bloc est relevée,
+    sans lire les modifications.
+    """
+
+    def __init__(self, path:str) -> None:
+        """
+        Ouverture du fichier et lecture de l'en-tête.
+
+        INPUT :
+            path : str, chemin du fichier
+
+        EXCEPTION :
+            ValueError : si le fichier n'est pas un fichier de rejeu
+        """
+
+        self.path = path
+
+        self._file = open(path, "rb")
+
+        try:
+            magic, version, flags, self.width, self.height = self._read(self.HEADER_FORMAT)
+
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError("Pas un fichier de rejeu : " + path)
+
+            self.gen_name = self._readName()
+            self.res_name = self._readName()
+
+            self.grid_size = (2*self.width + 1) * (2*self.height + 1)
+
+            self.grid = None
+            # Grille réelle de départ, None pour une grille vierge
+
+            if flags & self.FLAG_GRID:
+                self.grid = self._file.read(self.grid_size)
+
+                if len(self.grid) != self.grid_size:
+                    raise ValueError("Fichier de rejeu tronqué : " + path)
+        except (struct.error, UnicodeDecodeError) as e:
+            self._file.close()
+            raise ValueError("En-tête de rejeu invalide : " + path) from e
+        except ValueError:
+            self._file.close()
+            raise
+
+        self.records = array('Q')
+        # Modifications de la frame en cours
+
+        self._next_frame = 0
+        self._next_offset = self._file.tell()
+        # Frame suivante et position de son bloc, pour la lecture dans l'ordre
+
+        self._frame_offsets = None
+        self._keyframe_frames = None
+        self._keyframe_offsets = None
+        # Index des blocs, cf ReplayReader._buildIndex
+
+    def _read(self, format:str) -> tuple:
+        """
+        Fonction lisant une structure dans le fichier.
+
+        EXCEPTION :
+            struct.error : si le fichier est terminé
+        """
+
+        return struct.unpack(format, self._file.read(struct.calcsize(format)))
+
+    def _readName(self) -> str:
+        """
+        Fonction lisant un nom d'algorithme.
+        """
+
+        size, = self._read("<H")
+
+        return self._file.read(size).decode("utf-8")
+
+    def _readFrameAt(self, offset:int) -> (int, None):
+        """
+        Fonction lisant dans records la première frame à partir de offset,
+        en passant les keyframes.
+
+        INPUT :
+            offset : int, position d'un bloc dans le fichier
+
+        OUTPUT :
+            int, position du bloc suivant la frame, ou None si le fichier est
+            terminé (ou la dernière frame tronquée)
+        """
+
+        self._file.seek(offset)
+
+        while True:
+            tag = self._file.read(1)
+
+            if tag == self.TAG_KEYFRAME:
+                self._file.seek(struct.calcsize(self.KEYFRAME_FORMAT) - 1 + self.grid_size, 1)
+            elif tag == self.TAG_FRAME:
+                break
+            else:
+                return None
+
+        records = array('Q')
+
+        try:
+            count, = struct.unpack("<I", self._file.read(4))
+            records.fromfile(self._file, count)
+        except (struct.error, EOFError):
+            return None
+
+        if self.SWAP_BYTES:
+            records.byteswap()
+
+        self.records = records
+
+        return self._file.tell()
+
+    def _buildIndex(self) -> None:
+        """
+        Procédure relevant la position de chaque frame et de chaque keyframe
+        dans le fichier, en sautant par dessus leur contenu.
+        """
+
+        if self._frame_offsets is not None:
+            return
+
+        frame_offsets = array('Q')
+        keyframe_frames = array('Q')
+        keyframe_offsets = array('Q')
+
+        size = self._file.seek(0, 2)
+        # Taille du fichier, pour ignorer une dernière frame tronquée
+
+        frame_header = struct.calcsize(self.FRAME_FORMAT)
+        keyframe_header = struct.calcsize(self.KEYFRAME_FORMAT)
+
+        offset = self._file.seek(self._headerSize())
+
+        while True:
+            data = self._file.read(frame_header)
+
+            if len(data) < 1:
+                break
+
+            if data[:1] == self.TAG_FRAME and len(data) == frame_header:
+                _, count = struct.unpack(self.FRAME_FORMAT, data)
+                end = offset + frame_header + 8*count
+
+                if end > size:
+                    break
+
+                frame_offsets.append(offset)
+            elif data[:1] == self.TAG_KEYFRAME:
+                self._file.seek(offset)
+                data = self._file.read(keyframe_header)
+
+                if len(data) != keyframe_header:
+                    break
+
+                _, n = struct.unpack(self.KEYFRAME_FORMAT, data)
+                end = offset + keyframe_header + self.grid_size
+
+                if end > size:
+                    break
+
+                keyframe_frames.append(n)
+                keyframe_offsets.append(offset + keyframe_header)
+            else:
+                break
+
+            offset = self._file.seek(end)
+
+        self._frame_offsets = frame_offsets
+        self._keyframe_frames = keyframe_frames
+        self._keyframe_offsets = keyframe_offsets
+
+    def _headerSize(self) -> int:
+        """
+        Fonction retournant la position du premier bloc dans le fichier.
+        """
+
+        self._file.seek(struct.calcsize(self.HEADER_FORMAT))
+
+        for _ in range(2):
+            size, = self._read("<H")
+            self._file.seek(size, 1)
+
+        return self._file.tell() + (0 if self.grid is None else self.grid_size)
+
+    def nextFrame(self) -> (range, None):
+        """
+        Fonction lisant la frame suivante dans records.
+
+        OUTPUT :
+            range, indices des modifications de la frame dans records, ou None
+            si le fichier est terminé
+        """
+
+        data = self.frameRecords(self._next_frame)
+
+        if data is None:
+            return None
+
+        return data[1]
+
+    def frameRecords(self, n:int) -> (tuple, None):
+        """
+        Fonction lisant les modifications de la frame n. Cf ChangeLog.frameRecords
+        """
+
+        if n < 0:
+            return None
+
+        if n == self._next_frame and self._next_offset is not None:
+            offset = self._next_offset
+            # Lecture dans l'ordre, sans index
+        else:
+            self._buildIndex()
+
+            if n >= len(self._frame_offsets):
+                return None
+
+            offset = self._frame_offsets[n]
+
+        next_offset = self._readFrameAt(offset)
+
+        if next_offset is None:
+            self._next_offset = None
+            return None
+
+        self._next_frame = n + 1
+        self._next_offset = next_offset
+
+        return (self.records, range(len(self.records)))
+
+    def keyframeBefore(self, n:int) -> tuple:
+        """
+        Fonction lisant la dernière keyframe avant la frame n. Cf
+        ChangeLog.keyframeBefore
+        """
+
+        self._buildIndex()
+
+        i = bisect.bisect_right(self._keyframe_frames, n)
+
+        if i == 0:
+            return (0, self.grid)
+
+        self._file.seek(self._keyframe_offsets[i-1])
+
+        return (self._keyframe_frames[i-1], self._file.read(self.grid_size))
+
+    def frameCount(self) -> int:
+        """
+        Fonction retournant le nombre de frames du fichier
+        """
+
+        self._buildIndex()
+
+        return len(self._frame_offsets)
+
+    def firstFrame(self) -> int:
+        """
+        Cf ChangeLog.firstFrame
+        """
+
+        return 0
+
+    def isComplete(self) -> bool:
+        """
+        Cf ChangeLog.isComplete
+        """
+
+        return True
+
+    def close(self) -> None:
+        """
+        Procédure fermant le fichier
+        """
+
+        self._file.close()
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    path = os.path.join(tempfile.gettempdir(), "replay_test.replay")
+
+    writer = ReplayWriter(path, 2, 1, "Gen", "Rés", grid=bytes(15))
+    records = array('Q', [1, 2, 3])
+    writer.writeFrame(records, 0, 2)
+    writer.writeKeyframe(1, bytes(range(15)))
+    writer.writeFrame(records, 2, 2)
+    writer.writeFrame(records, 2, 3)
+    writer.close()
+
+    reader = ReplayReader(path)
+    assert (reader.width, reader.height, reader.gen_name, reader.res_name) == (2, 1, "Gen", "Rés")
+    assert reader.grid == bytes(15)
+    assert list(reader.records[j] for j in reader.nextFrame()) == [1, 2]
+    assert len(reader.nextFrame()) == 0
+    assert list(reader.records[j] for j in reader.nextFrame()) == [3]
+    assert reader.nextFrame() is None
+    assert reader.nextFrame() is None
+
+    assert reader.frameCount() == 3
+    records, frame = reader.frameRecords(0)
+    assert list(records[j] for j in frame) == [1, 2]
+    assert reader.keyframeBefore(0) == (0, bytes(15))
+    assert reader.keyframeBefore(2) == (1, bytes(range(15)))
+    reader.close()
+
+    with open(path, "ab") as file:
+        file.write(b'F\x05\x00\x00\x00\x01')
+        # Dernière frame tronquée
+
+    reader = ReplayReader(path)
+    assert reader.frameCount() == 3
+    assert reader.frameRecords(3) is None
+    reader.close()
+
+    os.remove(path)
@@ -1,4 +1,8 @@
 class Stack:
+    """
+    Pile basée sur une liste : ajout et retrait en O(1) amorti
+    """
+
     def __init__(self, *args):
         """
         Crée une pile
@@ -8,13 +12,28 @@ class Stack:
 
         INPUT :
             *args : arguments donnés
-                    Utiliser Stack(*[a, b, c]) pour exécuter Stack(a, b, c)
+                    Utiliser Stack.fromList([a, b, c]) pour beaucoup d'éléments
         """
 
-        self._content = []
+        self._content = list(reversed(args))
+
+    @classmethod
+    def fromList(cls, values:list) -> 'Stack':
+        """
+        Crée une pile en une seule fois, équivalent à Stack(*values) sans
+        passer tous les éléments en arguments
 
-        for i in range(len(args)-1, -1, -1):
-            self.push(args[i])
+        INPUT :
+            values : list, éléments, le premier sera le premier à sortir
+
+        OUTPUT :
+            Stack, la pile
+        """
+
+        stack = cls()
+        stack._content = values[::-1]
+
+        return stack
 
     def push(self, value:object) -> None:
         """
@@ -43,14 +62,10 @@ class Stack:
             ValueError : si la pile est vide
         """
 
-        if len(self._content) == 0:
+        if not self._content:
             raise ValueError("Pile vide")
 
-        value = self._content[-1]
-
-        del self._content[-1]
-
-        return value
+        return self._content.pop()
 
     def __str__(self):
         """
@@ -80,9 +95,15 @@ if __name__ == "__main__":
     q = Stack(3, 2, 1)
     assert q.get() == [3, 2, 1]
 
+    assert Stack.fromList([3, 2, 1]).get() == Stack(3, 2, 1).get()
+
     q.push(4)
     assert q.get() == [4, 3, 2, 1]
 
     n = q.pop()
     assert n == 4
     assert q.get() == [3, 2, 1]
+
+    q = Stack.fromList([3, 2, 1])
+    assert [q.pop(), q.pop(), q.pop()] == [3, 2, 1]
+    assert len(Stack.fromList([])) == 0
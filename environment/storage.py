@@ -0,0 +1,682 @@
+"""
+Moteurs de stockage de la grille du labyrinthe.
+
+La grille "réelle" (cf Map) fait (2*largeur+1) x (2*hauteur+1) cases : les
+cellules, les murs, les intersections et les murs extérieurs.
+Chaque case contient un état (Map.EMPTY, Map.WALL...), toujours inférieur à 256.
+
+Les cases sont numérotées ligne par ligne : k = y*real_width + x
+"""
+
+from abc import ABC, abstractmethod
+# Module pour avoir des méthodes abstraites
+
+import mmap
+import os
+import struct
+import sys
+
+class GenericStorage(ABC):
+    """
+    Classe mère de tous les moteurs de stockage.
+
+    Les sous-classes doivent au minimum implémenter __getitem__ et __setitem__
+    sur l'indice k, get et set sont alors déduits automatiquement.
+    """
+
+    STORAGE_NAME = None
+
+    PERSISTENT = False
+    # Si la grille est sauvegardée ailleurs qu'en mémoire vive
+
+    COMPACT = False
+    # Si la grille est faite pour les labyrinthes immenses : le labyrinthe ne
+    # garde alors ni table des voisines (cf Maze.adjacency) ni copie complète
+    # de la grille dans son journal (cf Maze.syncModifiedCells)
+
+    def __init__(self, real_width:int, real_height:int) -> None:
+        """
+        Initialisation du stockage.
+
+        INPUT :
+            real_width : int, largeur réelle de la grille (murs compris)
+            real_height : int, hauteur réelle de la grille (murs compris)
+        """
+
+        self.real_width = real_width
+        self.real_height = real_height
+
+        self.buffer = None
+        # Tampon contigu de la grille, indexable directement par k, ou None si
+        # le stockage n'en a pas. Permet d'éviter un appel de méthode par accès
+
+    @abstractmethod
+    def __getitem__(self, k:int) -> int:
+        pass
+
+    @abstractmethod
+    def __setitem__(self, k:int, value:int) -> None:
+        pass
+
+    def __len__(self) -> int:
+        """
+        Nombre de cases de la grille réelle
+        """
+
+        return self.real_width * self.real_height
+
+    def get(self, x:int, y:int) -> int:
+        """
+        Fonction retournant l'état de la case réelle (x, y)
+
+        INPUT :
+            x : int, abscisse réelle
+            y : int, ordonnée réelle
+
+        OUTPUT :
+            int, état de la case
+        """
+
+        return self[y*self.real_width + x]
+
+    def set(self, x:int, y:int, value:int) -> None:
+        """
+        Procédure modifiant l'état de la case réelle (x, y)
+
+        INPUT :
+            x : int, abscisse réelle
+            y : int, ordonnée réelle
+            value : int, nouvel état
+        """
+
+        self[y*self.real_width + x] = value
+
+    @abstractmethod
+    def memorySize(self) -> int:
+        """
+        Fonction retournant la taille mémoire approximative du stockage.
+
+        OUTPUT :
+            int, taille en octets
+        """
+
+        pass
+
+    def snapshot(self) -> bytes:
+        """
+        Fonction retournant une copie de toute la grille réelle, un octet par
+        case, ligne par ligne.
+
+        OUTPUT :
+            bytes, la grille
+        """
+
+        return bytes(self[k] for k in range(len(self)))
+
+    def restore(self, grid:bytes) -> None:
+        """
+        Procédure remplaçant toute la grille par une copie obtenue avec
+        snapshot.
+
+        INPUT :
+            grid : bytes, la grille
+        """
+
+        for k in range(len(self)):
+            self[k] = grid[k]
+
+    def flush(self, start_pos:tuple=None, goal_pos:tuple=None) -> None:
+        """
+        Procédure sauvegardant la grille ainsi que les positions de départ et
+        d'arrivée. Ne fait rien pour un stockage en mémoire vive.
+
+        INPUT :
+            start_pos : tuple (x, y) ou None, position de départ
+            goal_pos : tuple (x, y) ou None, position d'arrivée
+        """
+
+        pass
+
+    def makePrivate(self) -> None:
+        """
+        Procédure faisant que les modifications suivantes de la grille ne
+        sont plus sauvegardées. Ne fait rien pour un stockage en mémoire vive.
+        """
+
+        pass
+
+    def close(self) -> None:
+        """
+        Procédure libérant les ressources du stockage.
+        """
+
+        pass
+
+    @staticmethod
+    def initialRow(real_width:int, odd:bool, wall:int, empty:int) -> bytes:
+        """
+        Fonction retournant une ligne de la grille vierge : que des murs pour
+        une ligne paire, une alternance mur / cellule vide pour une ligne
+        impaire.
+
+        INPUT :
+            real_width : int, largeur réelle de la grille
+            odd : bool, si la ligne est impaire
+            wall : int, état d'un mur
+            empty : int, état d'une cellule vide
+
+        OUTPUT :
+            bytes, la ligne
+        """
+
+        if odd:
+            return bytes([wall, empty]*(real_width//2) + [wall])
+        else:
+            return bytes([wall])*real_width
+
+class ListStorage(GenericStorage):
+    """
+    Stockage historique : une liste de listes, indexée par [x][y].
+    Simple mais coûteux en mémoire (8 octets par case, plus les listes).
+    """
+
+    STORAGE_NAME = "LIST"
+
+    def __init__(self, real_width:int, real_height:int, wall:int, empty:int) -> None:
+        super().__init__(real_width, real_height)
+
+        self._content = []
+        # Grille à 2 dimensions
+
+        for x in range(real_width):
+            if x%2 == 0:
+                line = [wall]*real_height
+            else:
+                line = list(self.initialRow(real_height, True, wall, empty))
+
+            self._content.append(line)
+
+    def __getitem__(self, k:int) -> int:
+        y, x = divmod(k, self.real_width)
+
+        return self._content[x][y]
+
+    def __setitem__(self, k:int, value:int) -> None:
+        y, x = divmod(k, self.real_width)
+
+        self._content[x][y] = value
+
+    def get(self, x:int, y:int) -> int:
+        return self._content[x][y]
+
+    def set(self, x:int, y:int, value:int) -> None:
+        self._content[x][y] = value
+
+    def memorySize(self) -> int:
+        size = sys.getsizeof(self._content)
+
+        for line in self._content:
+            size += sys.getsizeof(line)
+
+        return size
+
+class FlatStorage(GenericStorage):
+    """
+    Stockage contigu : un unique bytearray, un octet par case, ligne par ligne.
+    """
+
+    STORAGE_NAME = "FLAT"
+
+    def __init__(self, real_width:int, real_height:int, wall:int, empty:int) -> None:
+        super().__init__(real_width, real_height)
+
+        even_row = self.initialRow(real_width, False, wall, empty)
+        odd_row = self.initialRow(real_width, True, wall, empty)
+
+        self._content = bytearray((even_row + odd_row)*(real_height//2) + even_row)
+
+        self.buffer = self._content
+
+    def __getitem__(self, k:int) -> int:
+        return self._content[k]
+
+    def __setitem__(self, k:int, value:int) -> None:
+        self._content[k] = value
+
+    def get(self, x:int, y:int) -> int:
+        return self._content[y*self.real_width + x]
+
+    def set(self, x:int, y:int, value:int) -> None:
+        self._content[y*self.real_width + x] = value
+
+    def snapshot(self) -> bytes:
+        return bytes(self._content)
+
+    def restore(self, grid:bytes) -> None:
+        self._content[:] = grid
+
+    def memorySize(self) -> int:
+        return sys.getsizeof(self._content)
+
+class BitPlaneStorage(GenericStorage):
+    """
+    Stockage compact pour les très grands labyrinthes parfaits.
+
+    Les intersections et les murs extérieurs ne changent jamais, et une
+    cellule est presque toujours vide. On ne stocke donc que 2 plans de bits,
+    un bit par cellule :
+        - le mur à droite de la cellule est-il plein ?
+        - le mur en dessous de la cellule est-il plein ?
+    Les états plus rares (mur rouge, cellule jaune, chemin...) sont rangés dans
+    un dictionnaire annexe, indexé par k.
+
+    La grille ne prend qu'un quart d'octet par cellule (100 Mo en 20000x20000),
+    mais c'est l'algorithme qui fixe la vraie limite (cf
+    benchmark/huge_maze_bench.py, sans affichage) : Eller n'ajoute presque
+    rien, le recursive backtracker environ 2,5 octets par cellule (1 Go en
+    20000x20000), Prim 1,5 et Kruskal 16,5 (7 Go). Le labyrinthe ne garde ni
+    table des voisines ni keyframes, cf GenericStorage.COMPACT.
+    """
+
+    STORAGE_NAME = "BITPLANE"
+
+    COMPACT = True
+
+    def __init__(self, real_width:int, real_height:int, wall:int, empty:int) -> None:
+        super().__init__(real_width, real_height)
+
+        self._wall = wall
+        self._empty = empty
+
+        self._width = real_width//2
+        self._height = real_height//2
+        # Nombre de cellules en largeur et en hauteur
+
+        nb_bytes = (self._width*self._height + 7)//8
+
+        self._right = bytearray(b'\xff')*nb_bytes
+        self._down = bytearray(b'\xff')*nb_bytes
+        # Tous les murs sont pleins au départ
+
+        self._extra = {}
+        # États rares, k -> état
+
+    def _locate(self, x:int, y:int) -> (bytearray, int):
+        """
+        Fonction retournant le plan de bits et l'indice du bit associés à la
+        case réelle (x, y), ou (None, -1) si la case n'est pas un mur
+        modifiable.
+        """
+
+        if x%2 == 1 and y%2 == 1:
+            return (None, -1)
+        elif x == 0 or y == 0 or x == self.real_width-1 or y == self.real_height-1:
+            return (None, -1)
+        elif x%2 == 0 and y%2 == 1:
+            # Mur vertical, à droite de la cellule ((x-2)/2, (y-1)/2)
+            return (self._right, (y//2)*self._width + x//2 - 1)
+        elif x%2 == 1 and y%2 == 0:
+            # Mur horizontal, en dessous de la cellule ((x-1)/2, (y-2)/2)
+            return (self._down, (y//2 - 1)*self._width + x//2)
+        else:
+            return (None, -1)
+
+    def get(self, x:int, y:int) -> int:
+        if self._extra:
+            etat = self._extra.get(y*self.real_width + x)
+
+            if etat is not None:
+                return etat
+
+        plane, i = self._locate(x, y)
+
+        if plane is None:
+            if x%2 == 1 and y%2 == 1:
+                return self._empty
+            else:
+                return self._wall
+        elif plane[i >> 3] & (1 << (i & 7)):
+            return self._wall
+        else:
+            return self._empty
+
+    def set(self, x:int, y:int, value:int) -> None:
+        k = y*self.real_width + x
+        plane, i = self._locate(x, y)
+
+        if plane is None:
+            if x%2 == 1 and y%2 == 1:
+                default = self._empty
+            else:
+                default = self._wall
+
+            if value == default:
+                self._extra.pop(k, None)
+            else:
+                self._extra[k] = value
+        else:
+            if value == self._empty:
+                plane[i >> 3] &= ~(1 << (i & 7))
+            else:
+                plane[i >> 3] |= 1 << (i & 7)
+                # Les états décoratifs d'un mur restent des murs
+
+            if value in (self._wall, self._empty):
+                self._extra.pop(k, None)
+            else:
+                self._extra[k] = value
+
+    def __getitem__(self, k:int) -> int:
+        y, x = divmod(k, self.real_width)
+
+        return self.get(x, y)
+
+    def __setitem__(self, k:int, value:int) -> None:
+        y, x = divmod(k, self.real_width)
+
+        self.set(x, y, value)
+
+    def memorySize(self) -> int:
+        size = sys.getsizeof(self._right) + sys.getsizeof(self._down)
+        size += sys.getsizeof(self._extra) + 28*len(self._extra)
+        # 28 octets : taille d'une clé entière du dictionnaire
+
+        return size
+
+class MmapStorage(GenericStorage):
+    """
+    Stockage sur disque, pour les labyrinthes plus grands que la mémoire.
+
+    La grille est gardée dans un fichier projeté en mémoire avec mmap : le
+    système ne charge que les pages utilisées, et le résultat est déjà
+    sauvegardé à la fin de la génération.
+
+    Format du fichier :
+        - un en-tête de HEADER_SIZE octets (cf HEADER_FORMAT) :
+          identifiant, version, largeur, hauteur, départ et arrivée
+          (-1 si non définis)
+        - la grille réelle, un octet par case, ligne par ligne, comme FlatStorage
+
+    Ouvrir un fichier existant ne copie ni ne lit la grille.
+
+    Après makePrivate, la projection est en copie sur écriture : les pages
+    modifiées (par exemple les chemins de la résolution) sont copiées en
+    mémoire vive et le fichier n'est plus jamais modifié.
+    """
+
+    STORAGE_NAME = "MMAP"
+
+    PERSISTENT = True
+
+    MAGIC = b"LABY"
+    VERSION = 1
+
+    HEADER_FORMAT = "<4sHxxiiiiii"
+    # Identifiant, version, largeur, hauteur, départ (x, y), arrivée (x, y)
+
+    HEADER_SIZE = 32
+
+    def __init__(self, real_width:int, real_height:int, wall:int, empty:int, path:str, create:bool=True) -> None:
+        """
+        Création ou ouverture du fichier.
+
+        INPUT :
+            real_width, real_height, wall, empty : cf GenericStorage
+            path : str, chemin du fichier
+            create : bool, s'il faut créer un nouveau fichier (une grille
+                           vierge) ou ouvrir un fichier existant
+        """
+
+        super().__init__(real_width, real_height)
+
+        self.path = path
+
+        if create:
+            self._createFile(wall, empty)
+
+        self._file = open(path, "r+b")
+
+        self.private = False
+        # Si les modifications ne vont plus dans le fichier, cf makePrivate
+
+        self._map(mmap.ACCESS_WRITE)
+
+        if len(self._content) != len(self):
+            self.close()
+            raise ValueError("Fichier de labyrinthe corrompu : " + path)
+
+    @classmethod
+    def open(cls, path:str) -> 'MmapStorage':
+        """
+        Fonction ouvrant un labyrinthe déjà sauvegardé.
+
+        INPUT :
+            path : str, chemin du fichier
+
+        OUTPUT :
+            MmapStorage, le stockage. Les attributs start_pos et goal_pos
+            contiennent les positions de départ et d'arrivée (ou None)
+
+        EXCEPTION :
+            ValueError : si le fichier n'est pas un labyrinthe
+        """
+
+        header = cls.readHeader(path)
+
+        storage = cls(2*header["width"] + 1, 2*header["height"] + 1, None, None, path, create=False)
+
+        storage.start_pos = header["start_pos"]
+        storage.goal_pos = header["goal_pos"]
+
+        return storage
+
+    @classmethod
+    def readHeader(cls, path:str) -> dict:
+        """
+        Fonction lisant l'en-tête d'un fichier de labyrinthe.
+
+        INPUT :
+            path : str, chemin du fichier
+
+        OUTPUT :
+            dict, avec les clés width, height, start_pos et goal_pos
+
+        EXCEPTION :
+            ValueError : si le fichier n'est pas un labyrinthe
+        """
+
+        with open(path, "rb") as file:
+            data = file.read(cls.HEADER_SIZE)
+
+        try:
+            magic, version, width, height, sx, sy, gx, gy = struct.unpack_from(cls.HEADER_FORMAT, data)
+        except struct.error as e:
+            raise ValueError("En-tête de labyrinthe invalide : " + path) from e
+
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("Pas un fichier de labyrinthe : " + path)
+
+        return {"width"    : width,
+                "height"   : height,
+                "start_pos": None if sx == -1 else (sx, sy),
+                "goal_pos" : None if gx == -1 else (gx, gy)}
+
+    def _createFile(self, wall:int, empty:int) -> None:
+        """
+        Procédure créant le fichier avec une grille vierge, ligne par ligne
+        pour ne jamais avoir toute la grille en mémoire.
+        """
+
+        even_row = self.initialRow(self.real_width, False, wall, empty)
+        odd_row = self.initialRow(self.real_width, True, wall, empty)
+
+        with open(self.path, "wb") as file:
+            file.write(self._packHeader(None, None))
+
+            for _ in range(self.real_height//2):
+                file.write(even_row)
+                file.write(odd_row)
+
+            file.write(even_row)
+
+    def _packHeader(self, start_pos:tuple, goal_pos:tuple) -> bytes:
+        """
+        Fonction retournant l'en-tête du fichier.
+        """
+
+        sx, sy = (-1, -1) if start_pos is None else start_pos
+        gx, gy = (-1, -1) if goal_pos is None else goal_pos
+
+        header = struct.pack(self.HEADER_FORMAT, self.MAGIC, self.VERSION,
+                             self.real_width//2, self.real_height//2,
+                             int(sx), int(sy), int(gx), int(gy))
+
+        return header.ljust(self.HEADER_SIZE, b'\x00')
+
+    def _map(self, access:int) -> None:
+        """
+        Procédure projetant le fichier en mémoire.
+
+        INPUT :
+            access : int, mmap.ACCESS_WRITE ou mmap.ACCESS_COPY
+        """
+
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+
+        self._content = memoryview(self._mmap)[self.HEADER_SIZE:]
+        # Vue sur la grille, sans copie
+
+        self.buffer = self._content
+
+    def __getitem__(self, k:int) -> int:
+        return self._content[k]
+
+    def __setitem__(self, k:int, value:int) -> None:
+        self._content[k] = value
+
+    def get(self, x:int, y:int) -> int:
+        return self._content[y*self.real_width + x]
+
+    def set(self, x:int, y:int, value:int) -> None:
+        self._content[y*self.real_width + x] = value
+
+    def snapshot(self) -> bytes:
+        return self._content.tobytes()
+
+    def restore(self, grid:bytes) -> None:
+        self._content[:] = grid
+
+    def flush(self, start_pos:tuple=None, goal_pos:tuple=None) -> None:
+        if self.private:
+            return
+
+        self._mmap[:self.HEADER_SIZE] = self._packHeader(start_pos, goal_pos)
+        self._mmap.flush()
+
+    def makePrivate(self) -> None:
+        if self.private:
+            return
+
+        self._unmap()
+        self._map(mmap.ACCESS_COPY)
+
+        self.private = True
+
+    def _unmap(self) -> None:
+        """
+        Procédure fermant la projection du fichier.
+        """
+
+        self.buffer = None
+        self._content.release()
+        # Une vue encore active empêcherait de fermer le mmap
+
+        self._mmap.close()
+
+    def close(self) -> None:
+        if self._mmap.closed:
+            return
+
+        self._unmap()
+        self._file.close()
+
+    def memorySize(self) -> int:
+        return sys.getsizeof(self._mmap)
+        # La grille elle-même est dans le cache disque, pas dans le tas Python
+
+ALL_STORAGES = {storage.STORAGE_NAME: storage for storage in (ListStorage, FlatStorage, BitPlaneStorage, MmapStorage)}
+# Moteurs de stockage disponibles, par nom
+
+def createStorage(name:str, real_width:int, real_height:int, wall:int, empty:int, **options) -> GenericStorage:
+    """
+    Fonction créant un moteur de stockage à partir de son nom.
+
+    INPUT :
+        name : str, nom du moteur (cf settings.cfg)
+        real_width : int, largeur réelle de la grille
+        real_height : int, hauteur réelle de la grille
+        wall : int, état d'un mur
+        empty : int, état d'une cellule vide
+        options : paramètres propres au moteur (path pour MMAP)
+
+    OUTPUT :
+        GenericStorage, le stockage initialisé
+
+    EXCEPTION :
+        ValueError : si le moteur est inconnu
+    """
+
+    try:
+        storage_class = ALL_STORAGES[name]
+    except KeyError as e:
+        raise ValueError("Stockage non reconnu : " + str(name)) from e
+
+    return storage_class(real_width, real_height, wall, empty, **options)
+
+if __name__ == "__main__":
+    import tempfile
+
+    tmp_dir = tempfile.TemporaryDirectory()
+    path = os.path.join(tmp_dir.name, "test.map")
+
+    for name in ALL_STORAGES:
+        if name == MmapStorage.STORAGE_NAME:
+            s = createStorage(name, 7, 5, 31, 21, path=path)
+        else:
+            s = createStorage(name, 7, 5, 31, 21)
+
+        assert s.get(0, 0) == 31
+        assert s.get(1, 1) == 21
+        assert s.get(2, 1) == 31
+        assert s.get(1, 2) == 31
+
+        s.set(3, 1, 62)
+        assert s.get(3, 1) == 62
+        assert s[1*7 + 3] == 62
+        assert len(s) == 35
+
+        grid = s.snapshot()
+        s.set(3, 1, 21)
+        s.restore(grid)
+        assert s.get(3, 1) == 62
+
+    s.flush((0, 1), (2, 1))
+    s.close()
+
+    s = MmapStorage.open(path)
+    assert s.get(3, 1) == 62
+    assert s.start_pos == (0, 1) and s.goal_pos == (2, 1)
+
+    s.makePrivate()
+    s.set(3, 1, 21)
+    assert s.get(3, 1) == 21
+    s.flush((0, 3), (2, 3))
+    s.close()
+
+    s = MmapStorage.open(path)
+    assert s.get(3, 1) == 62
+    assert s.start_pos == (0, 1)
+    # Rien n'a été écrit après makePrivate
+    s.close()
+
+    tmp_dir.cleanup()
@@ -1,3 +1,5 @@
+from array import array
+
 class UnionFind:
     """
     Union–Find
@@ -68,6 +70,150 @@ class UnionFind:
 
         return s[:-2]
 
+class IntUnionFind:
+    """
+    Union–Find sur des entiers de 0 à size-1, par exemple des indices de
+    cellules (cf Maze.cellId)
+
+    Les représentants et les tailles des ensembles sont rangés dans des
+    array d'entiers, plutôt qu'un dictionnaire de Python. L'union se fait
+    par taille : le plus petit ensemble est rattaché au plus grand, les
+    chemins restent donc courts. Le find est itératif, avec division de
+    chemin par deux (chaque élément parcouru pointe vers son grand-parent) :
+    aucune récursion, quelle que soit la longueur du chemin.
+
+    Les indices ne sont pas vérifiés.
+    """
+
+    def __init__(self, size:int) -> None:
+        """
+        Création de size ensembles d'un seul élément
+
+        INPUT :
+            size : int, nombre d'éléments
+        """
+
+        self._parent = array('i', range(size))
+        self._size = array('i', [1]) * size
+
+        self.count = size
+        # Nombre d'ensembles
+
+    def find(self, i:int) -> int:
+        """
+        Trouve le représentant de i
+
+        INPUT :
+            i : int, élément
+
+        OUTPUT :
+            int, représentant
+        """
+
+        parent = self._parent
+
+        while parent[i] != i:
+            parent[i] = i = parent[parent[i]]
+
+        return i
+
+    def union(self, i:int, j:int) -> bool:
+        """
+        Réunit l'ensemble contenant i et celui contenant j
+
+        INPUT :
+            i : int, élément à unir
+            j : int, élément à unir
+
+        OUTPUT :
+            bool, False si i et j étaient déjà dans le même ensemble
+        """
+
+        i = self.find(i)
+        j = self.find(j)
+
+        if i == j:
+            return False
+
+        size = self._size
+
+        if size[i] < size[j]:
+            i, j = j, i
+
+        self._parent[j] = i
+        size[i] += size[j]
+
+        self.count -= 1
+
+        return True
+
+    def findMany(self, elements:'iterable') -> array:
+        """
+        Trouve les représentants de plusieurs éléments, en un seul appel
+
+        INPUT :
+            elements : itérable d'int, éléments
+
+        OUTPUT :
+            array d'int, représentant de chaque élément
+        """
+
+        parent = self._parent
+        result = array('i')
+
+        for i in elements:
+            while parent[i] != i:
+                parent[i] = i = parent[parent[i]]
+
+            result.append(i)
+
+        return result
+
+    def unionMany(self, pairs:'iterable') -> bytearray:
+        """
+        Réunit plusieurs couples d'ensembles, dans l'ordre, en un seul appel
+
+        INPUT :
+            pairs : itérable de tuples (i, j), éléments à unir
+
+        OUTPUT :
+            bytearray, pour chaque couple 1 si une union a eu lieu, 0 si les
+            éléments étaient déjà dans le même ensemble
+        """
+
+        parent = self._parent
+        size = self._size
+        result = bytearray()
+
+        for i, j in pairs:
+            while parent[i] != i:
+                parent[i] = i = parent[parent[i]]
+
+            while parent[j] != j:
+                parent[j] = j = parent[parent[j]]
+
+            if i == j:
+                result.append(0)
+            else:
+                if size[i] < size[j]:
+                    i, j = j, i
+
+                parent[j] = i
+                size[i] += size[j]
+
+                result.append(1)
+
+        self.count -= sum(result)
+
+        return result
+
+    def __len__(self) -> int:
+        """
+        Nombre d'éléments, utilisé par la fonction len
+        """
+
+        return len(self._parent)
+
 if __name__ == "__main__":
     t = [i for i in range(10)]
 
@@ -81,3 +227,30 @@ if __name__ == "__main__":
 
     assert u.find(1) == u.find(2) == u.find(3) != u.find(4)
     assert u.find(0) == 0
+
+    u = IntUnionFind(10)
+
+    assert u.union(1, 2) and not u.union(2, 1)
+    assert u.union(3, 1)
+    assert u.find(1) == u.find(2) == u.find(3) != u.find(4)
+    assert u.find(0) == 0 and u.count == 8
+
+    assert list(u.unionMany([(4, 5), (5, 4), (6, 7), (4, 7)])) == [1, 0, 1, 1]
+    assert len(set(u.findMany([4, 5, 6, 7]))) == 1
+    assert u.count == 5 and len(u) == 10
+
+    n = 10**5
+    u = IntUnionFind(n)
+
+    for i in range(n-1):
+        u._parent[i] = i+1
+        # Chaîne de n éléments, trop longue pour un find récursif
+
+    assert u.find(0) == n-1
+    assert u.find(0) == n-1
+
+    u = IntUnionFind(n)
+
+    u.unionMany((i, i+1) for i in range(n-1))
+    assert u.count == 1
+    assert set(u.findMany(range(n))) == {u.find(0)}
@@ -0,0 +1,63 @@
+"""
+Algorithme "Binary tree" (arbre binaire).
+
+Chaque cellule ouvre soit son mur de droite, soit son mur du bas, au hasard.
+Très rapide mais biaisé : la dernière ligne et la dernière colonne sont des
+couloirs droits. Cf generation/plane_generation.py
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from generation.plane_generation import PlaneGeneration
+
+BITS = bytes.maketrans(b"01", b"\x00\x01")
+NOT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+# Tables de conversion pour bytes.translate
+
+class Generation(PlaneGeneration):
+    def __init__(self, **options):
+        super().__init__("Binary tree", **options)
+
+    def carveNumpy(self, rng):
+        width = self.maze.width
+        height = self.maze.height
+
+        to_right = rng.integers(0, 2, size=(height, width), dtype=bool)
+        # Pour chaque cellule, True pour ouvrir à droite, False en bas
+
+        right = to_right[:, :-1].copy()
+        right[-1, :] = True
+        # La dernière ligne ne peut aller qu'à droite
+
+        down = ~to_right[:-1, :]
+        down[:, -1] = True
+        # La dernière colonne ne peut aller qu'en bas
+
+        return (right, down)
+
+    def carvePython(self, rng):
+        width = self.maze.width
+        height = self.maze.height
+
+        right = []
+        down = []
+
+        for y in range(height):
+            if y == height-1:
+                right.append(bytearray([1])*(width-1))
+                break
+                # La dernière ligne ne peut aller qu'à droite
+
+            bits = format(rng.getrandbits(width), "0{0}b".format(width)).encode()[::-1].translate(BITS)
+            # Un octet 0 ou 1 par cellule, 1 pour ouvrir à droite
+
+            right.append(bytearray(bits[:-1]))
+
+            row = bytearray(bits.translate(NOT))
+            row[-1] = 1
+            # La dernière colonne ne peut aller qu'en bas
+
+            down.append(row)
+
+        return (right, down)
@@ -0,0 +1,166 @@
+"""
+Algorithme d'Eller (génération ligne par ligne).
+
+Le labyrinthe est construit une ligne après l'autre, en ne gardant que
+l'ensemble de chaque cellule de la ligne courante : la mémoire utilisée ne
+dépend que de la largeur. generateRows donne les lignes terminées une par
+une, sans grille, pour les écrire dans un fichier ou les envoyer ailleurs :
+    with open("labyrinthe.txt", 'w') as f:
+        for line in rowsToText(10**4, generateRows(10**4, 10**7, random.Random(graine))):
+            f.write(line + '\n')
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from environment.maze import Maze
+from environment.union_find import IntUnionFind
+
+from generation.generic_generation import GenericGeneration
+
+from array import array
+import random
+
+def generateRows(width:int, height:int, rng:random.Random) -> 'generator':
+    """
+    Générateur donnant les lignes d'un labyrinthe parfait, de haut en bas.
+
+    INPUT :
+        width : int, nombre de cellules en largeur
+        height : int, nombre de cellules en hauteur
+        rng : random.Random, générateur aléatoire (cf RandomStreams)
+
+    OUTPUT :
+        générateur de tuples (right, down) de bytearray : right[x] vaut 1 si
+        le mur à droite de la cellule x est ouvert (width-1 éléments),
+        down[x] si le mur en dessous est ouvert (width éléments, tous à 0
+        pour la dernière ligne)
+    """
+
+    getrandbits = rng.getrandbits
+
+    labels = array('i', range(width))
+    # Ensemble de chaque cellule de la ligne courante. Il y a au plus width
+    # ensembles par ligne, numérotés de 0 à width-1
+
+    for y in range(height):
+        last_row = y == height-1
+
+        sets = IntUnionFind(width)
+        # Fusions des ensembles pendant cette ligne
+
+        right = bytearray(width-1)
+
+        for x in range(width-1):
+            if last_row or getrandbits(1):
+                # La dernière ligne relie tous les ensembles restants
+
+                if sets.union(labels[x], labels[x+1]):
+                    right[x] = 1
+
+        down = bytearray(width)
+
+        if last_row:
+            yield (right, down)
+            return
+
+        roots = sets.findMany(labels)
+
+        last_cell = array('i', [0]) * width
+
+        for x in range(width):
+            last_cell[roots[x]] = x
+        # Dernière cellule de chaque ensemble dans la ligne
+
+        has_down = bytearray(width)
+
+        for x in range(width):
+            root = roots[x]
+
+            if getrandbits(1) or (last_cell[root] == x and not has_down[root]):
+                # Chaque ensemble descend au moins une fois, sinon il
+                # serait coupé du reste du labyrinthe
+
+                down[x] = 1
+                has_down[root] = 1
+
+        yield (right, down)
+
+        new_labels = array('i', [-1]) * width
+        next_label = 0
+
+        for x in range(width):
+            if down[x]:
+                root = roots[x]
+
+                if new_labels[root] == -1:
+                    new_labels[root] = next_label
+                    next_label += 1
+
+                labels[x] = new_labels[root]
+            else:
+                labels[x] = -1
+                # Cellule sans mur ouvert au-dessus : nouvel ensemble
+
+        for x in range(width):
+            if labels[x] == -1:
+                labels[x] = next_label
+                next_label += 1
+        # Renumérotation de 0 à width-1 pour la ligne suivante
+
+def rowsToText(width:int, rows:'iterable') -> 'generator':
+    """
+    Générateur donnant le labyrinthe sous forme de texte, deux lignes de texte
+    par ligne de cellules (cf Maze.displayAsText)
+
+    INPUT :
+        width : int, nombre de cellules en largeur
+        rows : itérable de lignes, cf generateRows
+
+    OUTPUT :
+        générateur de str, lignes de texte sans retour à la ligne
+    """
+
+    yield '█' * (2*width + 1)
+
+    for right, down in rows:
+        yield '█ ' + ''.join('  ' if opened else '█ ' for opened in right) + '█'
+        yield '█' + ''.join(' █' if opened else '██' for opened in down)
+
+class Generation(GenericGeneration):
+    """
+    Chaque tour ajoute une ligne entière au labyrinthe, cf generateRows
+    """
+
+    def __init__(self, **options):
+        super().__init__("Eller's algorithm", **options)
+
+    def init(self):
+        self.rows = generateRows(self.maze.width, self.maze.height, self.rng)
+        self.y = 0
+
+    def applyAlgorith(self):
+        right, down = next(self.rows)
+
+        first_i = self.y*self.maze.width
+
+        for x, opened in enumerate(right):
+            if opened:
+                self.maze.setWallState(2*(first_i + x), Maze.EMPTY)
+
+        for x, opened in enumerate(down):
+            if opened:
+                self.maze.setWallState(2*(first_i + x) + 1, Maze.EMPTY)
+
+        self.edited_wall_count += sum(right) + sum(down)
+        # Le labyrinthe est parfait : la génération s'arrête après la
+        # dernière ligne, quand width*height - 1 murs ont été ouverts
+
+        self.y += 1
+
+    def drawPath(self):
+        if self.slow:
+            first_i = (self.y-1)*self.maze.width
+
+            for i in range(first_i, first_i + self.maze.width):
+                self.maze.setCellState(i, Maze.YELLOW_CELL)
@@ -1,24 +1,43 @@
 from abc import ABC, abstractmethod
 # Module pour avoir des méthodes abstraites
 
-from environment.map import *
-from environment.direction import *
-from environment.settings import *
-from environment.position import *
+from environment.map import Map
+from environment.maze import Maze
+from environment.settings import Settings
+from environment.position import Position
 
-import random
 import time
 
 class GenericGeneration(ABC):
-    def __init__(self, ALGORITHM_NAME):
+    def __init__(self, ALGORITHM_NAME, **options):
+        """
+        INPUT :
+            ALGORITHM_NAME : str, nom de l'algorithme
+            options : paramètres à utiliser à la place de ceux de settings.cfg
+                      (slow, start_in_corner, end_in_corner, wall_ratio,
+                      verbose), plus streams, obligatoire
+
+        EXCEPTION :
+            ValueError : si les flux aléatoires (streams) ne sont pas donnés
+        """
+
         super().__init__()
 
-        self.slow            = Settings.get("gen.slow", bool)
-        self.start_in_corner = Settings.get("gen.start_in_corner", bool)
-        self.end_in_corner   = Settings.get("gen.end_in_corner", bool)
-        self.wall_ratio      = Settings.get("WALL_RATIO", float)
+        self.slow            = options["slow"]            if "slow"            in options else Settings.get("gen.slow", bool)
+        self.start_in_corner = options["start_in_corner"] if "start_in_corner" in options else Settings.get("gen.start_in_corner", bool)
+        self.end_in_corner   = options["end_in_corner"]   if "end_in_corner"   in options else Settings.get("gen.end_in_corner", bool)
+        self.wall_ratio      = options["wall_ratio"]      if "wall_ratio"      in options else Settings.get("WALL_RATIO", float)
+        self.verbose         = options["verbose"]         if "verbose"         in options else True
+        # Si False, seules les statistiques et le temps sont affichés
+
+        if "streams" not in options:
+            raise ValueError("Flux aléatoires manquants (option streams)")
+
+        self.streams = options["streams"]
+        # Flux aléatoires, cf environment/random_streams.py
 
         self.ALGORITHM_NAME = ALGORITHM_NAME
+        self.maze = None
 
     @abstractmethod
     def init(self):
@@ -32,15 +51,29 @@ class GenericGeneration(ABC):
     def drawPath(self):
         pass
 
-    def start(self):
-        print("Début de la génération :", self.ALGORITHM_NAME)
+    def start(self, maze:Maze=None):
+        """
+        Lance la génération
+
+        INPUT :
+            maze : Maze, labyrinthe à générer. Par défaut, le labyrinthe
+                   courant Map.current
+        """
+
+        self.maze = Map.current if maze is None else maze
+
+        if self.verbose:
+            print("Début de la génération :", self.ALGORITHM_NAME)
 
         self.finished = False
         self.edited_wall_count = 0
         self.total_frame_count = 0
 
+        self.rng = self.streams.stream("generation")
+        # Générateur aléatoire de l'algorithme
+
         self.init()
-        Map.syncModifiedCells()
+        self.maze.syncModifiedCells()
 
         time_0 = time.time()
 
@@ -49,7 +82,7 @@ class GenericGeneration(ABC):
         while not self.finished:
             self.applyAlgorith()
 
-            if self.edited_wall_count == Map.width*Map.height - 1:
+            if self.edited_wall_count == self.maze.width*self.maze.height - 1:
                 self.finished = True
 
             self.drawPath()
@@ -57,72 +90,81 @@ class GenericGeneration(ABC):
             self.total_frame_count += 1
 
             if self.slow:
-                Map.syncModifiedCells()
+                self.maze.syncModifiedCells()
 
-            pourcentage = 100*self.edited_wall_count/(Map.width*Map.height - 1)
-            pourcentage = int(10*pourcentage)/10
+            if self.verbose:
+                pourcentage = 100*self.edited_wall_count/(self.maze.width*self.maze.height - 1)
+                pourcentage = int(10*pourcentage)/10
 
-            print("Généré à {0}%".format(pourcentage), end='\r')
+                print("Généré à {0}%".format(pourcentage), end='\r')
 
         if not self.slow:
-            Map.syncModifiedCells()
+            self.maze.syncModifiedCells()
 
         ########################################################################
 
-        for x, y in Map.dimensions:
-            # YELLOW_CELL
-            Map.setCell((x, y), Map.EMPTY)
+        if self.slow:
+            for i in range(self.maze.width*self.maze.height):
+                # YELLOW_CELL, seulement écrites en mode lent
+                self.maze.setCellState(i, Maze.EMPTY)
+
+        positions_rng = self.streams.stream("positions")
 
-        Map.start_pos = Position.random((0, 0), (0, Map.height-1))
+        self.maze.start_pos = Position.random((0, 0), (0, self.maze.height-1), positions_rng)
         # Permet d'utiliser un random dans tous les cas, et ainsi de ne pas
         # altérer l'aspect du labyrinthe, quelle que soit la position de départ
 
         if self.start_in_corner:
-            Map.start_pos = Position((0, 0))
+            self.maze.start_pos = Position((0, 0))
 
-        Map.goal_pos = Position.random((Map.width-1, 0), (Map.width-1, Map.height-1))
+        self.maze.goal_pos = Position.random((self.maze.width-1, 0), (self.maze.width-1, self.maze.height-1), positions_rng)
 
         if self.end_in_corner:
-            Map.goal_pos = Position((Map.width-1, Map.height-1))
+            self.maze.goal_pos = Position((self.maze.width-1, self.maze.height-1))
 
-        Map.setCell(Map.start_pos, Map.START)
-        Map.setCell(Map.goal_pos, Map.GOAL)
+        self.maze.setCell(self.maze.start_pos, Maze.START)
+        self.maze.setCell(self.maze.goal_pos, Maze.GOAL)
 
         ########################################################################
 
+        walls_to_destroy = round(((self.maze.width-1)*(self.maze.height-1))*(100-self.wall_ratio)/100)
         all_walls = []
 
-        for x, y in Map.dimensions:
-            p_horiz  = Position((x    , y+0.5))
-            p_vertic = Position((x+0.5, y    ))
-
-            if Map.isWallPosValid(p_horiz):
-                if Map.getWall(p_horiz) == Map.WALL:
-                    all_walls.append(p_horiz)
+        if walls_to_destroy != 0:
+            # Sinon, inutile de parcourir toute la grille
+            for x, y in self.maze.dimensions:
+                i = y*self.maze.width + x
 
-            if Map.isWallPosValid(p_vertic):
-                if Map.getWall(p_vertic) == Map.WALL:
-                    all_walls.append(p_vertic)
+                if y != self.maze.height-1:
+                    if self.maze.wallState(2*i + 1) == Maze.WALL:
+                        all_walls.append(2*i + 1)
 
-        random.shuffle(all_walls)
+                if x != self.maze.width-1:
+                    if self.maze.wallState(2*i) == Maze.WALL:
+                        all_walls.append(2*i)
 
-        walls_to_destroy = round(((Map.width-1)*(Map.height-1))*(100-self.wall_ratio)/100)
-        all_walls = all_walls[:walls_to_destroy]
+            self.streams.stream("walls").shuffle(all_walls)
+            all_walls = all_walls[:walls_to_destroy]
 
-        for p in all_walls:
-            Map.setWall(p, Map.EMPTY)
+        for w in all_walls:
+            self.maze.setWallState(w, Maze.EMPTY)
 
             if self.slow:
-                Map.syncModifiedCells()
+                self.maze.syncModifiedCells()
 
-        if not self.slow:
-            Map.syncModifiedCells()
+        self.maze.syncModifiedCells()
+        # Toujours, même en mode lent : l'effacement des cellules jaunes, le
+        # départ et l'arrivée doivent faire partie d'une frame
 
         ########################################################################
 
-        print("Génération terminée correctement")
+        self.maze.flush()
+        # Si la grille est sur disque, le labyrinthe est maintenant sauvegardé
+
+        if self.verbose:
+            print("Génération terminée correctement")
 
-        print("Nombre de tours théorique :", Map.width*Map.height - 1)
+        print("Nombre de tours théorique :", self.maze.width*self.maze.height - 1)
         print("Nombre de tours réel :", self.total_frame_count)
 
         try:
@@ -135,4 +177,5 @@ class GenericGeneration(ABC):
         delta_t = int(10 * 1000 * (time.time()-time_0))/10
         print("Temps :", delta_t, "ms")
 
-        print("Fin de la génération :", self.ALGORITHM_NAME)
+        if self.verbose:
+            print("Fin de la génération :", self.ALGORITHM_NAME)
@@ -0,0 +1,249 @@
+"""
+Algorithme "Growing tree" (arbre grandissant).
+
+On garde un ensemble de cellules actives, qui commence avec une cellule
+aléatoire. À chaque étape, une cellule active est choisie : si elle a une
+voisine pas encore visitée, on brise le mur entre les deux et la voisine
+devient active, sinon la cellule est retirée de l'ensemble.
+
+Le choix de la cellule active donne des labyrinthes très différents :
+    - NEWEST : la plus récente, c'est le recursive backtracker (longs couloirs)
+    - OLDEST : la plus ancienne (couloirs droits partant de l'origine)
+    - RANDOM : au hasard, proche de Prim (beaucoup d'impasses courtes)
+    - MIXED : la plus récente avec une probabilité mix, sinon au hasard
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from environment.maze import Maze
+from environment.position import Position
+from environment.settings import Settings
+
+from generation.generic_generation import GenericGeneration
+
+from array import array
+import random
+
+class ActiveCells:
+    """
+    Ensemble des cellules actives, dans l'ordre d'ajout.
+
+    Les cellules retirées au milieu sont seulement marquées à -1, et sautées
+    plus tard : toutes les opérations sont en O(1) amorti, sans perdre
+    l'ordre. Le tableau est compacté dès que la moitié de sa partie utile est
+    marquée, un tirage au hasard tombe donc sur une cellule active au moins
+    une fois sur deux.
+    """
+
+    REMOVED = -1
+
+    def __init__(self) -> None:
+        self.cells = array('i')
+
+        self.head = 0
+        # Les cases avant head sont toutes retirées
+
+        self.removed_count = 0
+        # Nombre de cases marquées après head
+
+    def __len__(self) -> int:
+        return len(self.cells) - self.head - self.removed_count
+
+    def add(self, i:int) -> None:
+        """
+        Procédure ajoutant une cellule, qui devient la plus récente
+
+        INPUT :
+            i : int, indice de la cellule
+        """
+
+        self.cells.append(i)
+
+    def newest(self) -> int:
+        """
+        Fonction retournant la position de la cellule la plus récente. Ne
+        doit pas être appelée si l'ensemble est vide
+
+        OUTPUT :
+            int, position dans self.cells
+        """
+
+        cells = self.cells
+
+        while cells[-1] == self.REMOVED:
+            cells.pop()
+            self.removed_count -= 1
+
+        return len(cells) - 1
+
+    def oldest(self) -> int:
+        """
+        Fonction retournant la position de la cellule la plus ancienne, cf
+        ActiveCells.newest
+        """
+
+        cells = self.cells
+
+        while cells[self.head] == self.REMOVED:
+            self.head += 1
+            self.removed_count -= 1
+
+        return self.head
+
+    def random(self, rng:random.Random) -> int:
+        """
+        Fonction retournant la position d'une cellule au hasard, cf
+        ActiveCells.newest
+
+        INPUT :
+            rng : random.Random, générateur aléatoire
+        """
+
+        cells = self.cells
+        head = self.head
+        span = len(cells) - head
+
+        while True:
+            j = head + rng.randrange(span)
+
+            if cells[j] != self.REMOVED:
+                return j
+
+    def remove(self, j:int) -> None:
+        """
+        Procédure retirant une cellule
+
+        INPUT :
+            j : int, position de la cellule dans self.cells
+        """
+
+        cells = self.cells
+
+        if j == len(cells) - 1:
+            cells.pop()
+        elif j == self.head:
+            self.head += 1
+        else:
+            cells[j] = self.REMOVED
+            self.removed_count += 1
+
+        if 2*(self.head + self.removed_count) > len(cells):
+            self.cells = array('i', [i for i in cells[self.head:] if i != self.REMOVED])
+            self.head = 0
+            self.removed_count = 0
+            # Chaque case recopiée a été payée par une case retirée
+
+class Generation(GenericGeneration):
+    """
+    Chaque tour brise exactement un mur : les cellules sans voisine libre
+    sont retirées dans le même tour.
+    """
+
+    POLICIES = ("NEWEST", "OLDEST", "RANDOM", "MIXED")
+
+    NO_DIRECTION = 255
+    # Direction d'arrivée de la cellule d'origine, cf self.came_from
+
+    def __init__(self, **options):
+        """
+        INPUT :
+            options : cf GenericGeneration, plus policy (choix de la cellule
+                      active, cf POLICIES), mix (pourcentage de NEWEST pour
+                      MIXED) et straight_bias (pourcentage de chances de
+                      continuer tout droit quand c'est possible)
+
+        EXCEPTION :
+            ValueError : si la politique de choix n'existe pas
+        """
+
+        super().__init__("Growing tree", **options)
+
+        self.policy        = options["policy"]        if "policy"        in options else Settings.get("gen.growing_policy", str)
+        self.mix           = options["mix"]           if "mix"           in options else Settings.get("gen.growing_mix", float)
+        self.straight_bias = options["straight_bias"] if "straight_bias" in options else Settings.get("gen.straight_bias", float)
+
+        if self.policy not in self.POLICIES:
+            raise ValueError("Politique de choix non reconnue : " + str(self.policy))
+
+        self.ALGORITHM_NAME += " (" + self.policy + ")"
+
+    def init(self):
+        self.adjacency = self.maze.adjacency
+        # Table des voisines, partagée entre labyrinthes de même taille
+
+        self.visited = bytearray(self.maze.width*self.maze.height)
+
+        self.came_from = bytearray([self.NO_DIRECTION])*(self.maze.width*self.maze.height)
+        # Direction dans laquelle on a avancé pour atteindre chaque cellule,
+        # pour pouvoir continuer tout droit
+
+        self.active = ActiveCells()
+
+        self.new_i = self.maze.cellId(Position.random((0, 0), (self.maze.width-1, self.maze.height-1), self.rng))
+        # La case d'origine est une case aléatoire
+
+        self.visited[self.new_i] = 1
+        self.active.add(self.new_i)
+
+    def selectCell(self) -> int:
+        """
+        Fonction choisissant une cellule active selon la politique
+
+        OUTPUT :
+            int, position de la cellule dans self.active.cells
+        """
+
+        if self.policy == "NEWEST":
+            return self.active.newest()
+        elif self.policy == "OLDEST":
+            return self.active.oldest()
+        elif self.policy == "RANDOM":
+            return self.active.random(self.rng)
+        elif 100*self.rng.random() < self.mix:
+            return self.active.newest()
+        else:
+            return self.active.random(self.rng)
+
+    def applyAlgorith(self):
+        neighbors = self.adjacency.neighbors
+        walls = self.adjacency.walls
+        visited = self.visited
+        active = self.active
+
+        while len(active) != 0:
+            j = self.selectCell()
+            i = active.cells[j]
+
+            free = [d for d in range(4) if neighbors[4*i + d] != -1 and not visited[neighbors[4*i + d]]]
+            # Directions des voisines pas encore visitées
+
+            if len(free) == 0:
+                active.remove(j)
+                continue
+                # Impasse, on passe à une autre cellule dans le même tour
+
+            d = self.came_from[i]
+
+            if d not in free or 100*self.rng.random() >= self.straight_bias:
+                d = free[self.rng.randrange(len(free))]
+            # Tout droit si possible avec une probabilité straight_bias, sinon
+            # une direction libre au hasard
+
+            self.new_i = neighbors[4*i + d]
+
+            self.maze.setWallState(walls[4*i + d], Maze.EMPTY)
+            # On brise le mur
+
+            visited[self.new_i] = 1
+            self.came_from[self.new_i] = d
+            active.add(self.new_i)
+
+            self.edited_wall_count += 1
+            return
+
+        # Labyrinthe d'une seule case
+
+    def drawPath(self):
+        if self.slow:
+            self.maze.setCellState(self.new_i, Maze.YELLOW_CELL)
@@ -5,151 +5,70 @@ Algorithme "Randomized Kruskal's algorithm" (Fusion aléatoire de chemins).
 if __name__ == "__main__":
     raise ImportError("Executez ../main.py")
 
-from environment.union_find import UnionFind
-from environment.stack import Stack
-from environment.position import Position
-from environment.map import Map
-from environment.direction import Direction
+from environment.union_find import IntUnionFind
+from environment.permutation import RandomPermutation
+from environment.maze import Maze
 
 from generation.generic_generation import GenericGeneration
 
-import random
-import math
-
 class Generation(GenericGeneration):
-    def __init__(self):
-        super().__init__("Randomized Kruskal's algorithm")
+    def __init__(self, **options):
+        super().__init__("Randomized Kruskal's algorithm", **options)
 
     def init(self):
-        all_walls = []
-        id_map = []
-
-        for x, y in Map.dimensions:
-            p = Position((x, y))
-
-            id_map.append(p)
-
-            if Map.isCellPosValid(p + Direction.RIGHT):
-                all_walls.append((p, Direction.RIGHT))
+        self.right_wall_count = (self.maze.width-1)*self.maze.height
+        # Les murs intérieurs sont numérotés : d'abord ceux à droite des
+        # cellules, ligne par ligne, puis ceux en dessous (cf applyAlgorith)
 
-            if Map.isCellPosValid(p + Direction.DOWN):
-                all_walls.append((p, Direction.DOWN))
+        self.all_walls = RandomPermutation(self.right_wall_count + self.maze.width*(self.maze.height-1), self.rng)
+        # Ordre aléatoire des murs, tiré au fur et à mesure
 
-        random.shuffle(all_walls)
-        self.all_walls = Stack(*all_walls)
+        self.id_map = IntUnionFind(self.maze.width*self.maze.height)
+        # Ensembles de cellules reliées, cf Maze.cellId
 
-        self.id_map = UnionFind(*id_map)
-
-        self.old_p_wall = None
+        self.old_wall = None
+        self.i1 = None
 
     def applyAlgorith(self):
-        if self.old_p_wall is not None:
-            Map.setWall(self.old_p_wall, Map.EMPTY)
+        if self.old_wall is not None:
+            self.maze.setWallState(self.old_wall, Maze.EMPTY)
 
-        self.p1, dir = self.all_walls.pop()
+        if len(self.all_walls) == 0:
+            self.can_draw = False
+            return
+            # Labyrinthe d'une seule case
 
-        self.p_wall = self.p1 + dir/2
+        n = self.all_walls.pop()
 
-        p2 = self.p1 + dir
+        if n < self.right_wall_count:
+            y, x = divmod(n, self.maze.width-1)
 
-        self.can_draw = False
+            self.i1 = y*self.maze.width + x
+            self.wall = 2*self.i1
+            # Mur à droite de la cellule
 
-        repr_p1 = self.id_map.find(self.p1)
-        repr_p2 = self.id_map.find(p2)
+            i2 = self.i1 + 1
+        else:
+            self.i1 = n - self.right_wall_count
+            self.wall = 2*self.i1 + 1
+            # Mur en dessous de la cellule, qui n'est pas sur la dernière ligne
 
-        if repr_p1 != repr_p2:
-            self.can_draw = True
+            i2 = self.i1 + self.maze.width
 
-            self.id_map.union(self.p1, p2)
+        self.can_draw = self.id_map.union(self.i1, i2)
+        # False si les deux cellules sont déjà reliées
 
-            self.old_p_wall = self.p_wall
+        if self.can_draw:
+            self.old_wall = self.wall
 
             self.edited_wall_count += 1
 
     def drawPath(self):
-        if self.slow:
-            Map.setCell(self.p1, Map.YELLOW_CELL)
+        if self.slow and self.i1 is not None:
+            self.maze.setCellState(self.i1, Maze.YELLOW_CELL)
 
             if self.can_draw:
-                Map.setWall(self.p_wall, Map.RED_WALL)
-
-        if self.finished:
-            Map.setWall(self.old_p_wall, Map.EMPTY)
-
-    @staticmethod
-    def getRandomDirection(p:Position) -> (Direction, None):
-        """
-        Fonction permettant d'obtenir une direction aléatoire valide.
-
-        INPUT :
-            p : Position, une position
-            visited_pos : list liste tuple, la liste des cases déjà visitées
-
-        OUTPUT :
-            res : Direction ou None si aucune direction n'est valide
-        """
-
-        list_dir = Direction.getRandomDirectionList()
-        # On récupère les directions triées aléatoirement
-
-        res = None
-
-        for dir in list_dir:
-            new_p = p + dir
-
-            if Map.isCellPosValid(new_p):
-                # Si la nouvelle case est bien dans le plateau
-
-                """
-                if visited_pos[new_p.x][new_p.y] is None:
-                    # Si cette nouvelle case n'a jamais été visitée
-
-                    if Map.getWall(p + dir/2) == Map.WALL:
-                        # S'il y a bien un mur à briser
-
-                        res = dir
-                """
-
-                if Map.getWall(p + dir/2) == Map.WALL:
-                    # S'il y a bien un mur à briser
-
-                    res = dir
-
-        return res
-
-    @staticmethod
-    def displayIdMapAsText(id_map:list, frame_count:int) -> None:
-        """
-        Procédure affichant la liste des identifiants de façon lisible.
-
-        INPUT :
-            id_map : list list int, liste à 2 dimensions contenant les identifiants
-                     entiers
-
-        OUTPUT :
-            None
-        """
-
-        raise NotImplementedError("Pas mis à jour")
-
-        print("\nTableau des identifiants, frame : ",
-              frame_count,
-              "/",
-              Map.width*Map.height-1,
-              sep='')
-
-        max_len = len(str(Map.width*Map.height))
-        # Pour avoir des identifiants de même taille
-
-        for x, y in Map.dimensions:
-            if y == 0 and x != 0:
-                print()
-
-            s = id_map[x][y].strPos(1)
-
-            while len(s) < max_len:
-                s = '0' + s
-
-            print(s, end=' ')
+                self.maze.setWallState(self.wall, Maze.RED_WALL)
 
-        print()
+        if self.finished and self.old_wall is not None:
+            self.maze.setWallState(self.old_wall, Maze.EMPTY)
@@ -0,0 +1,169 @@
+"""
+Base des algorithmes qui calculent tous les murs d'un coup, sans parcourir
+le labyrinthe : arbre binaire, sidewinder...
+
+Les murs sont calculés avec NumPy s'il est installé, sinon en Python pur
+(beaucoup plus lent). Sans enregistrement de l'animation (cf Maze.recording),
+la grille entière est ensuite écrite d'un seul bloc dans le stockage (cf
+GenericStorage.restore). Sinon, chaque tour écrit une ligne de cellules.
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from abc import abstractmethod
+
+from environment.maze import Maze
+from environment.storage import GenericStorage
+
+from generation.generic_generation import GenericGeneration
+
+import random
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+    # NumPy est optionnel
+
+class PlaneGeneration(GenericGeneration):
+    def __init__(self, ALGORITHM_NAME, **options):
+        """
+        INPUT :
+            ALGORITHM_NAME : str, nom de l'algorithme
+            options : cf GenericGeneration, plus use_numpy (False pour
+                      forcer la version en Python pur)
+        """
+
+        super().__init__(ALGORITHM_NAME, **options)
+
+        self.use_numpy = numpy is not None and (options["use_numpy"] if "use_numpy" in options else True)
+
+    @abstractmethod
+    def carveNumpy(self, rng:'numpy.random.Generator') -> tuple:
+        """
+        Fonction calculant les murs ouverts avec NumPy
+
+        INPUT :
+            rng : numpy.random.Generator, générateur aléatoire
+
+        OUTPUT :
+            tuple (right, down) d'arrays de booléens : right[y, x] (hauteur x
+            largeur-1) si le mur à droite de la cellule (x, y) est ouvert,
+            down[y, x] (hauteur-1 x largeur) si le mur en dessous est ouvert
+        """
+
+        pass
+
+    @abstractmethod
+    def carvePython(self, rng:random.Random) -> tuple:
+        """
+        Fonction calculant les murs ouverts en Python pur
+
+        INPUT :
+            rng : random.Random, générateur aléatoire
+
+        OUTPUT :
+            tuple (right, down) de listes de bytearray, une par ligne de
+            cellules, 1 pour un mur ouvert. Cf PlaneGeneration.carveNumpy
+        """
+
+        pass
+
+    def init(self):
+        if self.use_numpy:
+            self.right, self.down = self.carveNumpy(numpy.random.default_rng(self.rng.getrandbits(64)))
+        else:
+            self.right, self.down = self.carvePython(self.rng)
+
+        self.y = 0
+
+    def applyAlgorith(self):
+        if not self.maze.recording:
+            self.writeGrid()
+            self.edited_wall_count = self.maze.width*self.maze.height - 1
+            # Tous les murs d'un coup, la génération est terminée
+            return
+
+        first_i = self.y*self.maze.width
+
+        for x, opened in enumerate(bytes(self.right[self.y])):
+            if opened:
+                self.maze.setWallState(2*(first_i + x), Maze.EMPTY)
+                self.edited_wall_count += 1
+
+        if self.y != self.maze.height-1:
+            for x, opened in enumerate(bytes(self.down[self.y])):
+                if opened:
+                    self.maze.setWallState(2*(first_i + x) + 1, Maze.EMPTY)
+                    self.edited_wall_count += 1
+
+        self.y += 1
+
+    def writeGrid(self) -> None:
+        """
+        Procédure écrivant toute la grille d'un coup dans le stockage
+        """
+
+        real_width = self.maze.real_width
+
+        if self.use_numpy:
+            buffer = self.maze.map.buffer
+
+            if buffer is None:
+                grid = numpy.empty((self.maze.real_height, real_width), dtype=numpy.uint8)
+            else:
+                grid = numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(self.maze.real_height, real_width)
+                # Écriture directement dans le tampon du stockage, sans copie
+
+            grid[0::2, :] = Maze.WALL
+            grid[:, 0::2] = Maze.WALL
+            grid[1::2, 1::2] = Maze.EMPTY
+            grid[1::2, 2:-1:2] = self.wallStates(self.right)
+            grid[2:-1:2, 1::2] = self.wallStates(self.down)
+
+            if buffer is None:
+                self.maze.map.restore(grid.tobytes())
+
+            return
+
+        states = bytes([Maze.WALL, Maze.EMPTY]) + bytes(254)
+        # Table de conversion : 0 (mur fermé) en WALL, 1 (ouvert) en EMPTY
+
+        grid = bytearray(GenericStorage.initialRow(real_width, False, Maze.WALL, Maze.EMPTY))
+
+        for y in range(self.maze.height):
+            row = bytearray(GenericStorage.initialRow(real_width, True, Maze.WALL, Maze.EMPTY))
+            row[2:-1:2] = self.right[y].translate(states)
+            grid += row
+
+            row = bytearray(GenericStorage.initialRow(real_width, False, Maze.WALL, Maze.EMPTY))
+
+            if y != self.maze.height-1:
+                row[1::2] = self.down[y].translate(states)
+
+            grid += row
+
+        self.maze.map.restore(grid)
+
+    @staticmethod
+    def wallStates(opened:'numpy.ndarray') -> 'numpy.ndarray':
+        """
+        Fonction convertissant des murs ouverts en états de la grille
+
+        INPUT :
+            opened : array de booléens, True pour un mur ouvert
+
+        OUTPUT :
+            array d'uint8, Maze.EMPTY pour un mur ouvert, Maze.WALL sinon
+        """
+
+        return opened.view(numpy.uint8)*numpy.uint8((Maze.EMPTY - Maze.WALL) % 256) + numpy.uint8(Maze.WALL)
+        # Calcul modulo 256, plus rapide qu'un numpy.where ou un masque
+
+    def drawPath(self):
+        if self.slow and self.maze.recording:
+            first_i = (self.y-1)*self.maze.width
+
+            for i in range(first_i, first_i + self.maze.width):
+                self.maze.setCellState(i, Maze.YELLOW_CELL)
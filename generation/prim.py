@@ -0,0 +1,110 @@
+"""
+Algorithme "Randomized Prim's algorithm" (Prim aléatoire).
+
+Le labyrinthe grandit à partir d'une case aléatoire : à chaque tour, une
+case de la frontière (voisine du labyrinthe sans en faire partie) est tirée
+au hasard et reliée à une de ses voisines déjà dans le labyrinthe.
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from environment.maze import Maze
+from environment.position import Position
+
+from generation.generic_generation import GenericGeneration
+
+from array import array
+
+class Generation(GenericGeneration):
+    OUTSIDE  = 0
+    FRONTIER = 1
+    INSIDE   = 2
+    # États d'une cellule, cf self.state
+
+    def __init__(self, **options):
+        super().__init__("Randomized Prim's algorithm", **options)
+
+    def init(self):
+        self.adjacency = self.maze.adjacency
+        # Table des voisines, partagée entre labyrinthes de même taille
+
+        self.state = bytearray(self.maze.width*self.maze.height)
+        # État de chaque cellule : dehors, dans la frontière ou dans le
+        # labyrinthe
+
+        self.frontier = array('i')
+        # Cellules de la frontière, dans le désordre : on en retire une en
+        # mettant la dernière à sa place
+
+        self.new_i = self.maze.cellId(Position.random((0, 0), (self.maze.width-1, self.maze.height-1), self.rng))
+        # La case d'origine est une case aléatoire
+
+        self.added = self.addCell(self.new_i)
+
+    def addCell(self, i:int) -> list:
+        """
+        Fonction ajoutant une cellule au labyrinthe, et ses voisines encore
+        dehors à la frontière
+
+        INPUT :
+            i : int, indice de la cellule
+
+        OUTPUT :
+            list int, indices des cellules ajoutées à la frontière
+        """
+
+        neighbors = self.adjacency.neighbors
+        state = self.state
+
+        state[i] = self.INSIDE
+
+        added = []
+
+        for n in neighbors[4*i : 4*i + 4]:
+            if n != -1 and state[n] == self.OUTSIDE:
+                state[n] = self.FRONTIER
+                added.append(n)
+
+        self.frontier.extend(added)
+
+        return added
+
+    def applyAlgorith(self):
+        frontier = self.frontier
+
+        if len(frontier) == 0:
+            self.added = []
+            return
+            # Labyrinthe d'une seule case
+
+        j = self.rng.randrange(len(frontier))
+        self.new_i = frontier[j]
+
+        frontier[j] = frontier[-1]
+        frontier.pop()
+        # Retrait en O(1) : l'ordre de la frontière n'a pas d'importance
+
+        neighbors = self.adjacency.neighbors
+        walls = self.adjacency.walls
+        state = self.state
+
+        inside = [d for d in range(4) if neighbors[4*self.new_i + d] != -1 and state[neighbors[4*self.new_i + d]] == self.INSIDE]
+        # Directions des voisines déjà dans le labyrinthe, il y en a au moins
+        # une puisque la cellule est dans la frontière
+
+        d = inside[self.rng.randrange(len(inside))]
+
+        self.maze.setWallState(walls[4*self.new_i + d], Maze.EMPTY)
+        # On brise le mur
+
+        self.edited_wall_count += 1
+
+        self.added = self.addCell(self.new_i)
+
+    def drawPath(self):
+        if self.slow:
+            self.maze.setCellState(self.new_i, Maze.YELLOW_CELL)
+
+            for i in self.added:
+                self.maze.setCellState(i, Maze.ORANGE_CELL)
@@ -5,115 +5,107 @@ Algorithme "Recursive backtracker" (Exploration exhaustive).
 if __name__ == "__main__":
     raise ImportError("Executez ../main.py")
 
-from environment.map import *
-from environment.direction import *
-from environment.stack import *
+from environment.maze import Maze
+from environment.direction import Direction
+from environment.position import Position
 
 from generation.generic_generation import GenericGeneration
 
+from array import array
+
 class Generation(GenericGeneration):
-    def __init__(self):
-        super().__init__("Recursive backtracker gen")
+    """
+    En mode lent, chaque tour avance d'une case ou recule d'une case. Sinon,
+    les retours en arrière sont faits d'un coup dans applyAlgorith, qui ne
+    rend la main qu'après avoir brisé un mur : un tour par mur.
+
+    Les deux modes tirent les mêmes nombres aléatoires et donnent donc le
+    même labyrinthe pour une même graine.
+    """
+
+    def __init__(self, **options):
+        super().__init__("Recursive backtracker gen", **options)
 
-    @staticmethod
-    def getRandomDirection(p:Position, visited_pos:list) -> (Direction, None):
+    def getRandomDirection(self, i:int) -> int:
         """
         Fonction permettant d'obtenir une direction aléatoire valide.
 
         INPUT :
-            p : Position, une position
-            visited_pos : list liste tuple, la liste des cases déjà visitées
+            i : int, indice d'une cellule
 
         OUTPUT :
-            res : Direction ou None si aucune direction n'est valide
+            res : int, indice de la direction (cf Direction.id), ou -1 si
+                  aucune direction n'est valide
         """
 
-        list_dir = Direction.getRandomDirectionList()
-        # On récupère les directions triées aléatoirement
+        neighbors = self.adjacency.neighbors
+        visited = self.visited
 
-        res = None
+        res = -1
 
-        for dir in list_dir:
-            new_p = p + dir
+        for dir_id in Direction.getRandomIdList(self.rng):
+            # On parcourt les directions triées aléatoirement. Même sans
+            # direction valide, le mélange est fait : les deux modes tirent
+            # ainsi les mêmes nombres aléatoires
 
-            if Map.isCellPosValid(new_p):
-                # Si la nouvelle case est bien dans le plateau
+            new_i = neighbors[4*i + dir_id]
 
-                if not visited_pos[new_p.x][new_p.y]:
-                    # Si cette nouvelle case n'a jamais été visitée
+            if new_i != -1 and not visited[new_i]:
+                # Si la nouvelle case est dans le plateau et n'a jamais été
+                # visitée. Le mur vers une case jamais visitée n'a pas pu
+                # être brisé
 
-                    if Map.getWall(p + dir/2) == Map.WALL:
-                        # S'il y a bien un mur à briser
-
-                        res = dir
+                res = dir_id
 
         return res
 
-    @staticmethod
-    def createList() -> list:
-        """
-        Fonction permettant de créer la liste des positions visitées.
-
-        INPUT :
-            None
-
-        OUTPUT :
-            visited_pos : list list tuple, tableau à 2 dimensions
-                          des positions visitées
-        """
-
-        visited_pos = []
-
-        for x in range(Map.width):
-            # Création de la grille
-
-            line = []
-
-            for y in range(Map.height):
-                line.append(False)
-
-            visited_pos.append(line)
-
-        return visited_pos
-
     def init(self):
-        self.visited_pos = self.createList()
-        # On crée la liste des positions visitées
+        self.adjacency = self.maze.adjacency
+        # Table des voisines, partagée entre labyrinthes de même taille
 
-        self.old_p = Position.random((0, 0), (Map.width-1, Map.height-1))
+        self.visited = bytearray(self.maze.width*self.maze.height)
+        # Pour chaque indice de cellule, 1 si elle a déjà été visitée
+
+        self.old_i = self.maze.cellId(Position.random((0, 0), (self.maze.width-1, self.maze.height-1), self.rng))
         # La case d'origine est une case aléatoire
 
         if self.slow:
-            Map.setCell(self.old_p, Map.YELLOW_CELL)
+            self.maze.setCellState(self.old_i, Maze.YELLOW_CELL)
 
-        self.visited_pos_list = Stack()
-        self.visited_pos_list.push(self.old_p)
+        self.path = array('i', [self.old_i])
+        # Pile des indices des cellules du chemin courant
 
-        self.visited_pos[self.old_p.x][self.old_p.y] = True
+        self.visited[self.old_i] = 1
 
     def applyAlgorith(self):
-        self.dir = self.getRandomDirection(self.old_p, self.visited_pos)
+        self.dir_id = self.getRandomDirection(self.old_i)
         # On récupère une direction aléatoire
 
-        if self.dir is None:
-            self.old_old_p = Position(self.old_p)
-            self.new_p = self.visited_pos_list.pop()
+        if not self.slow:
+            while self.dir_id == -1 and len(self.path) != 0:
+                self.old_i = self.path.pop()
+                self.dir_id = self.getRandomDirection(self.old_i)
+                # On remonte jusqu'à une case ayant une voisine libre, sans
+                # rendre la main
+
+        if self.dir_id == -1:
+            self.new_i = self.path.pop() if len(self.path) != 0 else self.old_i
             # Si aucune direction n'est libre, on remonte à la dernière position
         else:
             self.edited_wall_count += 1
 
-            Map.setWall(self.old_p+self.dir/2, Map.EMPTY)
-            # On affiche le mur brisé en rouge
+            self.maze.setWallState(self.adjacency.walls[4*self.old_i + self.dir_id], Maze.EMPTY)
+            # On brise le mur
 
-            self.new_p = self.old_p + self.dir
-            self.visited_pos[self.new_p.x][self.new_p.y] = True
-            self.visited_pos_list.push(self.old_p)
-            # On met à jour la liste des positions visitées
+            self.new_i = self.adjacency.neighbors[4*self.old_i + self.dir_id]
+            self.visited[self.new_i] = 1
+            self.path.append(self.old_i)
+            # On met à jour le chemin courant
 
     def drawPath(self):
         if self.slow:
-            Map.setCell(self.new_p, Map.ORANGE_CELL)
-            Map.setCell(self.old_p, Map.YELLOW_CELL)
+            self.maze.setCellState(self.new_i, Maze.ORANGE_CELL)
+            self.maze.setCellState(self.old_i, Maze.YELLOW_CELL)
 
-        self.old_p = Position(self.new_p)
+        self.old_i = self.new_i
         # On met à jour la position
@@ -0,0 +1,130 @@
+"""
+Algorithme "Recursive division" (division récursive).
+
+Contrairement aux autres algorithmes, on part d'un labyrinthe sans murs
+intérieurs et on en ajoute : chaque zone rectangulaire est coupée en deux
+par une ligne droite de murs percée d'un seul passage, puis chaque moitié
+est divisée à son tour, jusqu'à n'avoir plus que des cellules seules.
+
+Les zones restant à diviser sont rangées dans une pile explicite plutôt que
+par des appels récursifs : la profondeur n'est pas limitée par Python.
+
+Animation : il n'y a une frame par division qu'en mode lent (gen.slow). Sinon,
+même si les modifications sont enregistrées, toutes les divisions tombent dans
+une seule frame, entre celle de l'intérieur vidé et celle du départ et de
+l'arrivée : comme pour les autres algorithmes, le labyrinthe apparaît fini.
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from environment.maze import Maze
+
+from generation.generic_generation import GenericGeneration
+
+from array import array
+
+class Generation(GenericGeneration):
+    """
+    Chaque tour divise une zone. Il faut width*height - 1 divisions pour
+    arriver à des cellules seules : edited_wall_count compte les divisions.
+    """
+
+    def __init__(self, **options):
+        super().__init__("Recursive division", **options)
+
+    def init(self):
+        width = self.maze.width
+        height = self.maze.height
+
+        for x in range(width-1):
+            self.maze.setWallLine(x, height, False, Maze.EMPTY)
+
+        for y in range(height-1):
+            self.maze.setWallLine(y*width, width, True, Maze.EMPTY)
+        # Intérieur vide, une ligne de murs à la fois
+
+        self.stack = array('i')
+        # Zones restant à diviser, 4 entiers par zone : x, y, largeur, hauteur
+
+        self.pushZone(0, 0, width, height)
+
+        self.gap_i = None
+
+    def pushZone(self, x:int, y:int, width:int, height:int) -> None:
+        """
+        Procédure ajoutant une zone à diviser, sauf si c'est une seule cellule
+
+        INPUT :
+            x, y : int, position de la cellule en haut à gauche de la zone
+            width, height : int, taille de la zone en cellules
+        """
+
+        if width*height > 1:
+            self.stack.extend((x, y, width, height))
+
+    @staticmethod
+    def wallLine(length:int, gap:int) -> bytearray:
+        """
+        Fonction retournant une ligne de murs percée d'un passage, à écrire
+        d'un seul coup avec Maze.setWallLineStates
+
+        INPUT :
+            length : int, nombre de murs
+            gap : int, position du passage dans la ligne
+
+        OUTPUT :
+            bytearray, type de chaque mur
+        """
+
+        line = bytearray([Maze.WALL])*length
+        line[gap] = Maze.EMPTY
+
+        return line
+
+    def applyAlgorith(self):
+        stack = self.stack
+
+        if len(stack) == 0:
+            return
+            # Labyrinthe d'une seule case
+
+        height = stack.pop()
+        width = stack.pop()
+        y = stack.pop()
+        x = stack.pop()
+
+        if width < height or (width == height and self.rng.getrandbits(1)):
+            # Coupe horizontale, sous la ligne y+cut de la zone, pour garder
+            # des zones à peu près carrées
+
+            cut = self.rng.randrange(height-1)
+            gap = self.rng.randrange(width)
+
+            first_i = (y+cut)*self.maze.width + x
+            self.gap_i = first_i + gap
+
+            self.maze.setWallLineStates(first_i, self.wallLine(width, gap), True)
+            # Toute la ligne de murs d'un coup, passage compris
+
+            self.pushZone(x, y+cut+1, width, height-cut-1)
+            self.pushZone(x, y, width, cut+1)
+        else:
+            # Coupe verticale, à droite de la colonne x+cut de la zone
+
+            cut = self.rng.randrange(width-1)
+            gap = self.rng.randrange(height)
+
+            first_i = y*self.maze.width + x+cut
+            self.gap_i = first_i + gap*self.maze.width
+
+            self.maze.setWallLineStates(first_i, self.wallLine(height, gap), False)
+
+            self.pushZone(x+cut+1, y, width-cut-1, height)
+            self.pushZone(x, y, cut+1, height)
+
+        self.edited_wall_count += 1
+
+    def drawPath(self):
+        if self.slow and self.gap_i is not None:
+            self.maze.setCellState(self.gap_i, Maze.YELLOW_CELL)
@@ -0,0 +1,79 @@
+"""
+Algorithme "Sidewinder".
+
+La première ligne est un couloir. Chaque ligne suivante est découpée en
+segments horizontaux aléatoires, et chaque segment est relié à la ligne du
+dessus par une de ses cellules, tirée au hasard. Cf
+generation/plane_generation.py
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from generation.plane_generation import PlaneGeneration, numpy
+
+class Generation(PlaneGeneration):
+    def __init__(self, **options):
+        super().__init__("Sidewinder", **options)
+
+    def carveNumpy(self, rng):
+        width = self.maze.width
+        height = self.maze.height
+
+        extend = rng.integers(0, 2, size=(height-1, width), dtype=bool)
+        extend[:, -1] = False
+        # Lignes 1 à height-1 : True pour prolonger le segment vers la
+        # droite. Un segment s'arrête toujours en fin de ligne
+
+        right = numpy.ones((height, width-1), dtype=bool)
+        right[1:, :] = extend[:, :-1]
+        # La première ligne est un couloir
+
+        ends = numpy.flatnonzero(~extend)
+        starts = numpy.empty_like(ends)
+        starts[:1] = 0
+        starts[1:] = ends[:-1] + 1
+        # Début et fin de chaque segment, les lignes mises bout à bout. Les
+        # segments ne débordent pas d'une ligne sur l'autre
+
+        lengths = ends - starts + 1
+        chosen = starts + (rng.random(len(ends))*lengths).astype(ends.dtype)
+        # Une cellule au hasard par segment. Plus rapide que rng.integers
+        # avec un tableau de bornes
+
+        down = numpy.zeros((height-1, width), dtype=bool)
+        down.reshape(-1)[chosen] = True
+        # Cette cellule ouvre le mur au-dessus d'elle, c'est-à-dire le mur du
+        # bas de la cellule de la ligne précédente
+
+        return (right, down)
+
+    def carvePython(self, rng):
+        width = self.maze.width
+        height = self.maze.height
+
+        right = [bytearray([1])*(width-1)]
+        # La première ligne est un couloir
+
+        down = []
+
+        for y in range(1, height):
+            row_right = bytearray(width-1)
+            row_up = bytearray(width)
+
+            bits = rng.getrandbits(width)
+            start = 0
+
+            for x in range(width):
+                if x != width-1 and (bits >> x) & 1:
+                    row_right[x] = 1
+                    # On prolonge le segment
+                else:
+                    row_up[rng.randrange(start, x+1)] = 1
+                    start = x+1
+                    # On ferme le segment en le reliant à la ligne du dessus
+
+            right.append(row_right)
+            down.append(row_up)
+
+        return (right, down)
@@ -0,0 +1,266 @@
+"""
+Génération parallèle par tuiles.
+
+La grille est découpée en tuiles, générées chacune comme un labyrinthe
+parfait indépendant (cf generation/eller.py) dans des processus séparés.
+Les tuiles sont ensuite reliées par un arbre couvrant aléatoire : un seul
+mur est ouvert sur la frontière entre deux tuiles voisines de l'arbre, le
+labyrinthe reste donc parfait.
+
+Chaque tuile a son propre flux aléatoire, nommé d'après sa position (cf
+RandomStreams) : le labyrinthe est le même quel que soit le nombre de
+processus.
+"""
+
+if __name__ == "__main__":
+    raise ImportError("Executez ../main.py")
+
+from environment.maze import Maze
+from environment.permutation import RandomPermutation
+from environment.settings import Settings
+from environment.union_find import IntUnionFind
+
+from generation.eller import generateRows
+from generation.generic_generation import GenericGeneration
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import random
+
+WALL_STATES = bytes([Maze.WALL, Maze.EMPTY]) + bytes(254)
+# Table de conversion pour bytes.translate : 0 (mur fermé) en WALL, 1 (ouvert)
+# en EMPTY
+
+def generateTile(task:tuple) -> tuple:
+    """
+    Fonction générant une tuile, exécutée dans un processus séparé
+
+    INPUT :
+        task : tuple (largeur, hauteur, graine du flux de la tuile, cf
+               RandomStreams.seedFor)
+
+    OUTPUT :
+        tuple (right, down) de bytes : pour chaque cellule de la tuile, ligne
+        par ligne, 1 si le mur à droite (ou en dessous) est ouvert. Les murs
+        sur le bord de la tuile sont toujours fermés
+    """
+
+    width, height, seed = task
+
+    right = bytearray()
+    down = bytearray()
+
+    for row_right, row_down in generateRows(width, height, random.Random(seed)):
+        right += row_right
+        right.append(0)
+        down += row_down
+
+    return (bytes(right), bytes(down))
+
+class Generation(GenericGeneration):
+    """
+    Chaque tour écrit une tuile, dans l'ordre, puis le dernier tour ouvre les
+    murs entre les tuiles.
+
+    Au plus 2 tuiles par processus sont en cours à la fois : les résultats en
+    attente ne prennent pas plus de mémoire quand l'écriture est plus lente
+    que la génération.
+    """
+
+    def __init__(self, **options):
+        """
+        INPUT :
+            options : cf GenericGeneration, plus tile_size (taille des tuiles
+                      en cellules) et workers (nombre de processus, 0 pour
+                      un par processeur)
+
+        EXCEPTION :
+            ValueError : si la taille des tuiles ou le nombre de processus est
+                         invalide
+        """
+
+        super().__init__("Tiled generation", **options)
+
+        self.tile_size = options["tile_size"] if "tile_size" in options else Settings.get("gen.tile_size", int)
+        self.workers   = options["workers"]   if "workers"   in options else Settings.get("gen.workers", int)
+
+        if self.tile_size <= 0:
+            raise ValueError("Taille de tuile invalide : " + str(self.tile_size))
+
+        if self.workers < 0:
+            raise ValueError("Nombre de processus invalide : " + str(self.workers))
+
+        if self.workers == 0:
+            self.workers = os.cpu_count() or 1
+
+        self.executor = None
+
+    def start(self, maze:Maze=None):
+        try:
+            super().start(maze)
+        finally:
+            self.closeExecutor()
+            # Même si la génération échoue, les processus sont arrêtés
+
+    def init(self):
+        self.tiles_x = -(-self.maze.width // self.tile_size)
+        self.tiles_y = -(-self.maze.height // self.tile_size)
+        # Nombre de tuiles, celles du bord droit et du bas peuvent être plus
+        # petites
+
+        self.tiles = [(tx, ty) for ty in range(self.tiles_y) for tx in range(self.tiles_x)]
+
+        self.tasks = iter([(self.tileWidth(tx), self.tileHeight(ty), self.streams.seedFor("tile", tx, ty))
+                           for tx, ty in self.tiles])
+        # Chaque processus recrée le flux de sa tuile à partir de sa graine
+
+        self.pending = deque()
+        # Tuiles en cours de génération, dans l'ordre
+
+        if self.workers != 1:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            # spawn plutôt que fork : le programme peut avoir d'autres threads
+            # (affichage, cf environment/pipeline.py), qu'un fork copierait
+            # dans un état incohérent. Les processus importent main.py sans
+            # l'exécuter, cf if __name__ == "__main__"
+
+            for _ in range(2*self.workers):
+                self.submitTile()
+
+        self.tile_index = 0
+
+    def submitTile(self) -> None:
+        """
+        Procédure envoyant la prochaine tuile à générer aux processus, s'il en
+        reste
+        """
+
+        task = next(self.tasks, None)
+
+        if task is not None:
+            self.pending.append(self.executor.submit(generateTile, task))
+
+    def nextTile(self) -> tuple:
+        """
+        Fonction retournant la prochaine tuile générée, dans l'ordre
+
+        OUTPUT :
+            tuple (right, down), cf generateTile
+        """
+
+        if self.executor is None:
+            return generateTile(next(self.tasks))
+
+        future = self.pending.popleft()
+        self.submitTile()
+        # Une tuile sort, une autre entre
+
+        return future.result()
+
+    def closeExecutor(self) -> None:
+        """
+        Procédure arrêtant les processus, s'il y en a
+        """
+
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def tileWidth(self, tx:int) -> int:
+        """
+        Fonction retournant la largeur de la tuile de colonne tx
+        """
+
+        return min(self.tile_size, self.maze.width - tx*self.tile_size)
+
+    def tileHeight(self, ty:int) -> int:
+        """
+        Fonction retournant la hauteur de la tuile de ligne ty
+        """
+
+        return min(self.tile_size, self.maze.height - ty*self.tile_size)
+
+    def applyAlgorith(self):
+        if self.tile_index == len(self.tiles):
+            self.joinTiles()
+            return
+
+        tx, ty = self.tiles[self.tile_index]
+        right, down = self.nextTile()
+
+        self.writeTile(tx, ty, right, down)
+
+        self.tile_index += 1
+
+        if self.tile_index == len(self.tiles):
+            self.closeExecutor()
+
+    def writeTile(self, tx:int, ty:int, right:bytes, down:bytes) -> None:
+        """
+        Procédure ouvrant dans le labyrinthe les murs d'une tuile, une ligne
+        de murs à la fois (cf Maze.setWallLineStates)
+
+        INPUT :
+            tx, ty : int, colonne et ligne de la tuile
+            right, down : bytes, murs ouverts, cf generateTile
+        """
+
+        width = self.tileWidth(tx)
+        height = self.tileHeight(ty)
+        first_i = ty*self.tile_size*self.maze.width + tx*self.tile_size
+
+        self.edited_wall_count += right.count(1) + down.count(1)
+
+        right = right.translate(WALL_STATES)
+        down = down.translate(WALL_STATES)
+
+        for x in range(width-1):
+            self.maze.setWallLineStates(first_i + x, right[x::width], False)
+            # Colonne x de la tuile. Les murs du bord de la tuile restent
+            # fermés
+
+        for y in range(height-1):
+            self.maze.setWallLineStates(first_i + y*self.maze.width, down[y*width : (y+1)*width], True)
+
+    def joinTiles(self) -> None:
+        """
+        Procédure reliant les tuiles par un arbre couvrant aléatoire (cf
+        generation/kruskal.py), en ouvrant un mur par frontière de l'arbre
+        """
+
+        rng = self.streams.stream("joints")
+
+        horizontal_count = (self.tiles_x-1)*self.tiles_y
+        # Frontières entre une tuile et celle à sa droite, puis frontières
+        # entre une tuile et celle en dessous
+
+        joints = RandomPermutation(horizontal_count + self.tiles_x*(self.tiles_y-1), rng)
+        tiles = IntUnionFind(self.tiles_x*self.tiles_y)
+
+        while tiles.count != 1:
+            n = joints.pop()
+
+            if n < horizontal_count:
+                ty, tx = divmod(n, self.tiles_x-1)
+
+                if tiles.union(ty*self.tiles_x + tx, ty*self.tiles_x + tx + 1):
+                    x = (tx+1)*self.tile_size - 1
+                    y = ty*self.tile_size + rng.randrange(self.tileHeight(ty))
+
+                    self.maze.setWallState(2*(y*self.maze.width + x), Maze.EMPTY)
+                    self.edited_wall_count += 1
+            else:
+                t = n - horizontal_count
+                ty, tx = divmod(t, self.tiles_x)
+
+                if tiles.union(t, t + self.tiles_x):
+                    x = tx*self.tile_size + rng.randrange(self.tileWidth(tx))
+                    y = (ty+1)*self.tile_size - 1
+
+                    self.maze.setWallState(2*(y*self.maze.width + x) + 1, Maze.EMPTY)
+                    self.edited_wall_count += 1
+
+    def drawPath(self):
+        pass
@@ -4,81 +4,216 @@ if sys.version_info <= (3, 0):
     sys.stdout.write("Python 2 détecté, fermeture du programme\n")
     sys.exit(1)
 
-from environment.display import Display
-# Gestion de l'affichage fenêtre
-
-from environment.map import Map
+from environment.maze import Maze
 # Plateau de jeu
 
-from environment.settings import Settings
-Settings.__init__()
-# Chargement des paramètres du fichier settings.cfg
+from environment.pipeline import FrameQueue
+# Génération et affichage en parallèle
+
+from environment.random_streams import RandomStreams
+# Aléatoire reproductible
 
-################################################################################
-# Dans cette partie, on va paramétrer l'aléatoire avec une graine.
-# Une même graine donnera toujours le même résultat.
+from environment.replay import ReplayReader, ReplayWriter
+# Enregistrement et lecture des fichiers de rejeu
 
+from environment.settings import Settings
+# Paramètres du fichier settings.cfg
+
+import getopt
 import random
 
-seed = Settings.get("SEED", int)
+def main() -> None:
+    """
+    Lance le programme : génération, résolution puis affichage.
+
+    Dans une fonction, pour que les processus de la génération par tuiles
+    (cf generation/tiled.py) puissent importer ce fichier sans tout relancer
+    """
+
+    Settings.__init__()
+    # Chargement des paramètres du fichier settings.cfg
+
+    try:
+        opts, _ = getopt.getopt(sys.argv[1:], "", ["headless"])
+    except getopt.GetoptError:
+        sys.stdout.write("Usage : python main.py [--headless]\n")
+        sys.exit(1)
+
+    headless = Settings.get("HEADLESS", bool) or ("--headless", "") in opts
+    # Sans affichage : pas de fenêtre, rien n'est enregistré pour l'animation et
+    # seuls les statistiques et les temps sont affichés
+
+    ############################################################################
+    # Dans cette partie, on va paramétrer l'aléatoire avec une graine.
+    # Une même graine donnera toujours le même résultat.
+
+    seed = Settings.get("SEED", int)
+
+    if seed == -1:
+        seed = random.randrange(0, 10**9)
+
+    print("Graine aléatoire : {0:09}".format(seed))
+
+    streams = RandomStreams(seed)
+    # Chaque algorithme tire ses nombres de son propre flux, cf
+    # environment/random_streams.py
+
+    ############################################################################
+    # Importation de l'algorithme de génération
+
+    algo_name = Settings.get("ALGO_GEN", str)
+
+    if algo_name == "RECURSIVE_BACKTRACKER_GEN":
+        from generation.recursive_backtracker_gen import Generation
+    elif algo_name == "KRUSKAL":
+        from generation.kruskal import Generation
+    elif algo_name == "ELLER":
+        from generation.eller import Generation
+    elif algo_name == "PRIM":
+        from generation.prim import Generation
+    elif algo_name == "TILED":
+        from generation.tiled import Generation
+    elif algo_name == "BINARY_TREE":
+        from generation.binary_tree import Generation
+    elif algo_name == "SIDEWINDER":
+        from generation.sidewinder import Generation
+    elif algo_name == "RECURSIVE_DIVISION":
+        from generation.recursive_division import Generation
+    elif algo_name == "GROWING_TREE":
+        from generation.growing_tree import Generation
+    else:
+        raise ValueError("Algorithme non reconnu : " + algo_name)
+
+    ############################################################################
+    # Importation de l'algorithme de résolution
+
+    algo_name = Settings.get("ALGO_RES", str)
+    allow_resolution = True
+
+    if algo_name == "NONE":
+        allow_resolution = False
+    elif algo_name == "RIGHT_HAND":
+        from resolution.right_hand import Resolution
+    elif algo_name == "RECURSIVE_BACKTRACKER_RES":
+        from resolution.recursive_backtracker_res import Resolution
+    else:
+        raise ValueError("Algorithme non reconnu : " + algo_name)
+
+    ############################################################################
+
+    options = {"streams": streams}
+
+    if headless:
+        options["slow"] = False
+        options["verbose"] = False
+        # Pas d'étapes intermédiaires, personne ne les regarde
+
+    gen = Generation(**options)
+
+    if allow_resolution:
+        res = Resolution(**options)
+        res_name = res.ALGORITHM_NAME
+    else:
+        res_name = "None"
+
+    replay_mode = Settings.get("REPLAY", str)
+    replay_file = Settings.get("REPLAY_FILE", str)
+
+    if replay_mode not in ("NONE", "RECORD", "PLAY"):
+        raise ValueError("Mode de rejeu non reconnu : " + replay_mode)
+
+    if headless and replay_mode != "NONE":
+        raise ValueError("Pas de rejeu sans affichage : REPLAY doit valoir NONE")
+
+    load_existing = Settings.get("STORAGE", str) == "MMAP" and Settings.get("STORAGE_LOAD", bool)
+    initial_grid = None
+
+    if replay_mode == "PLAY":
+        maze = Maze.fromReplay(replay_file)
+        # Tout est déjà calculé, l'affichage lira le fichier au fur et à mesure
+
+        gen_name = maze.modified_cells.gen_name
+        res_name = maze.modified_cells.res_name
+    else:
+        gen_name = gen.ALGORITHM_NAME
+
+        if load_existing:
+            maze = Maze.fromFile(Settings.get("STORAGE_FILE", str))
+            initial_grid = maze.map.snapshot()
+            # Le labyrinthe est déjà généré, l'affichage partira de celui-ci
+        else:
+            maze = Maze.fromSettings()
+
+    if headless:
+        maze.recording = False
+
+        if not load_existing:
+            gen.start(maze)
+
+        if allow_resolution:
+            res.start(maze)
 
-if seed == -1:
-    seed = random.randrange(0, 10**9)
+        sys.exit(0)
+        # Tkinter n'est jamais importé
 
-print("Graine aléatoire : {0:09}".format(seed))
+    from environment.display import Display
+    # Gestion de l'affichage fenêtre
 
-random.seed(seed)
+    if replay_mode == "NONE" and Settings.get("PIPELINE", bool):
+        display_maze = Maze(maze.width, maze.height)
+
+        if initial_grid is not None:
+            display_maze.map.restore(initial_grid)
+
+        frames = FrameQueue(Settings.get("PIPELINE_SIZE", int))
+        display_maze.modified_cells = frames
+        # L'affichage a sa propre grille, mise à jour avec les frames produites
 
-################################################################################
-# Importation de l'algorithme de génération
+        Display.__init__(gen_name=gen_name, res_name=res_name, maze=display_maze)
+        # Initialisation du terrain et de la fenêtre
 
-algo_name = Settings.get("ALGO_GEN", str)
+        algorithms = []
 
-if algo_name == "RECURSIVE_BACKTRACKER_GEN":
-    from generation.recursive_backtracker_gen import Generation
-elif algo_name == "KRUSKAL":
-    from generation.kruskal import Generation
-else:
-    raise ValueError("Algorithme non reconnu : " + algo_name)
+        if not load_existing:
+            algorithms.append(gen)
 
-################################################################################
-# Importation de l'algorithme de résolution
+        if allow_resolution:
+            algorithms.append(res)
 
-algo_name = Settings.get("ALGO_RES", str)
-allow_resolution = True
+        frames.start(maze, algorithms)
+        # Génération puis résolution dans un autre thread, pendant l'affichage
 
-if algo_name == "NONE":
-    allow_resolution = False
-elif algo_name == "RIGHT_HAND":
-    from resolution.right_hand import Resolution
-elif algo_name == "RECURSIVE_BACKTRACKER_RES":
-    from resolution.recursive_backtracker_res import Resolution
-else:
-    raise ValueError("Algorithme non reconnu : " + algo_name)
+        Display.run()
+        sys.exit(0)
 
-################################################################################
+    Display.__init__(gen_name=gen_name, res_name=res_name, maze=maze)
+    # Initialisation du terrain et de la fenêtre
 
-gen = Generation()
+    if replay_mode != "PLAY":
+        if replay_mode == "RECORD":
+            writer = ReplayWriter(replay_file, maze.width, maze.height, gen_name, res_name, initial_grid)
+            maze.modified_cells.attach(writer)
+            # Les frames sont écrites dans le fichier au lieu d'être gardées en mémoire
 
-if allow_resolution:
-    res = Resolution()
-    res_name = res.ALGORITHM_NAME
-else:
-    res_name = "None"
+        if not load_existing:
+            gen.start(maze)
+            # Lancement de la génération
 
-Map.__init__()
-Display.__init__(gen_name=gen.ALGORITHM_NAME, res_name=res_name)
-# Initialisation du terrain et de la fenêtre
+        if allow_resolution:
+            res.start(maze)
+            # Lancement de la résolution
 
-gen.start()
-# Lancement de la génération
+        if replay_mode == "RECORD":
+            writer.close()
 
-if allow_resolution:
-    res.start()
-    # Lancement de la résolution
+            maze.replayFrom(ReplayReader(replay_file))
+            # L'affichage relit le fichier enregistré
+        else:
+            maze.resetForDisplay(initial_grid)
+            # On réinitialise la grille
 
-Map.resetAll(save=False)
-# On réinitialise la grille
+    Display.run()
+    # Lancement de l'affichage
 
-Display.run()
-# Lancement de l'affichage
+if __name__ == "__main__":
+    main()
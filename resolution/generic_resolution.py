@@ -1,24 +1,43 @@
 from abc import ABC, abstractmethod
 # Module pour avoir des méthodes abstraites
 
-from environment.map import *
+from environment.map import Map
+from environment.maze import Maze
+from environment.settings import Settings
+
 import time
 
 class GenericResolution(ABC):
     class NoSolutionError(Exception):
         pass
 
-    def __init__(self, ALGORITHM_NAME):
+    def __init__(self, ALGORITHM_NAME, **options):
+        """
+        INPUT :
+            ALGORITHM_NAME : str, nom de l'algorithme
+            options : paramètres à utiliser à la place de ceux de settings.cfg
+                      (slow, verbose), plus streams, obligatoire
+
+        EXCEPTION :
+            ValueError : si les flux aléatoires (streams) ne sont pas donnés
+        """
+
         super().__init__()
 
-        self.slow = Settings.get("res.slow", bool)
+        self.slow    = options["slow"]    if "slow"    in options else Settings.get("res.slow", bool)
+        self.verbose = options["verbose"] if "verbose" in options else True
+        # Si False, seules les statistiques et le temps sont affichés
+
+        if "streams" not in options:
+            raise ValueError("Flux aléatoires manquants (option streams)")
+
+        self.streams = options["streams"]
+        # Flux aléatoires, cf environment/random_streams.py
 
         self.ALGORITHM_NAME = ALGORITHM_NAME
+        self.maze = None
 
         self.happy_end = False
-        self.finished = False
-        self.total_frame_count = 0
-        self.go_forward_frame = 0
 
     @abstractmethod
     def init(self):
@@ -36,11 +55,33 @@ class GenericResolution(ABC):
     def checkIfFinished(self):
         pass
 
-    def start(self):
-        print("Début de la résolution :", self.ALGORITHM_NAME)
+    def start(self, maze:Maze=None):
+        """
+        Lance la résolution
+
+        INPUT :
+            maze : Maze, labyrinthe à résoudre. Par défaut, le labyrinthe
+                   courant Map.current
+        """
+
+        self.maze = Map.current if maze is None else maze
+
+        self.maze.protectStorage()
+        # Les chemins de la résolution ne doivent pas être sauvegardés avec le
+        # labyrinthe généré
+
+        if self.verbose:
+            print("Début de la résolution :", self.ALGORITHM_NAME)
+
+        self.finished = False
+        self.total_frame_count = 0
+        self.go_forward_frame = 0
+
+        self.rng = self.streams.stream("resolution")
+        # Générateur aléatoire de l'algorithme
 
         self.init()
-        Map.syncModifiedCells()
+        self.maze.syncModifiedCells()
 
         time_0 = time.time()
 
@@ -57,7 +98,7 @@ class GenericResolution(ABC):
             self.checkIfFinished()
 
             if self.slow:
-                Map.syncModifiedCells()
+                self.maze.syncModifiedCells()
 
             if no_sol:
                 self.finished = True
@@ -65,31 +106,32 @@ class GenericResolution(ABC):
             self.total_frame_count += 1
 
         if not self.slow:
-            Map.syncModifiedCells()
+            self.maze.syncModifiedCells()
 
         """
-        for x, y in Map.dimensions:
-            if Map.getCell((x, y)) == Map.EMPTY:
-                Map.setCell((x, y), Map.NOT_VISITED)
+        for x, y in self.maze.dimensions:
+            if self.maze.getCell((x, y)) == Maze.EMPTY:
+                self.maze.setCell((x, y), Maze.NOT_VISITED)
 
-        Map.syncModifiedCells()
+        self.maze.syncModifiedCells()
         """
 
         nb_solution_cell = 0
         nb_visited_cell = 0
 
-        for x, y in Map.dimensions:
-            etat = Map.getCell((x, y))
+        for i in range(self.maze.width*self.maze.height):
+            etat = self.maze.cellState(i)
 
-            if etat == Map.SOLUTION_PATH:
+            if etat == Maze.SOLUTION_PATH:
                 nb_solution_cell += 1
-            elif etat == Map.VISITED_PATH:
+            elif etat == Maze.VISITED_PATH:
                 nb_visited_cell += 1
 
         if no_sol:
             print("Résolution mal terminée")
         else:
-            print("Résolution terminée correctement")
+            if self.verbose:
+                print("Résolution terminée correctement")
 
             print("Nombre de tours :", self.total_frame_count)
 
@@ -101,4 +143,5 @@ class GenericResolution(ABC):
             delta_t = int(10 * 1000 * (time.time()-time_0))/10
             print("Temps :", delta_t, "ms")
 
-        print("Fin de la résolution :", self.ALGORITHM_NAME)
+        if self.verbose:
+            print("Fin de la résolution :", self.ALGORITHM_NAME)
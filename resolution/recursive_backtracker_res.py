@@ -7,131 +7,144 @@ if __name__ == "_draw":
 
 from resolution.generic_resolution import GenericResolution
 
-from environment.map import *
-from environment.direction import *
-from environment.stack import *
+from environment.maze import Maze
+from environment.direction import Direction
+from environment.stack import Stack
 import random
 import time
 
 class Resolution(GenericResolution):
-    def __init__(self):
-        super().__init__("Recursive backtracker res")
+    def __init__(self, **options):
+        super().__init__("Recursive backtracker res", **options)
 
     def init(self):
+        self.adjacency = self.maze.adjacency
+        # Table des voisines, partagée entre labyrinthes de même taille
+
         self.visited_pos = self.createList()
         # On crée la liste des positions visitées
 
-        self.old_p = Position(Map.start_pos)
+        self.start_i = self.maze.cellId(self.maze.start_pos)
+        self.goal_i = self.maze.cellId(self.maze.goal_pos)
+
+        self.old_i = self.start_i
 
-        self.new_p = Position(self.old_p)
+        self.new_i = self.old_i
 
         self.visited_pos_list = Stack()
-        self.visited_pos_list.push(self.old_p)
+        self.visited_pos_list.push(self.old_i)
 
-        self.visited_pos[self.old_p.x][self.old_p.y] = True
+        self.visited_pos[self.old_i] = True
 
         self.edited_wall_count = 0
 
     def applyAlgorith(self):
-        self.dir = self.getRandomDirection(self.old_p, self.visited_pos)
+        self.dir_id = self.getRandomDirection(self.old_i, self.visited_pos)
         # On récupère une direction aléatoire
 
-        if self.dir is None:
+        if self.dir_id == -1:
             if len(self.visited_pos_list) == 0:
                 raise GenericResolution.NoSolutionError()
 
-            self.old_p = self.visited_pos_list.pop()
+            self.old_i = self.visited_pos_list.pop()
             # Si aucune direction n'est libre, on remonte à la dernière position
 
             self.go_forward_frame += 1
         else:
             self.edited_wall_count += 1
-            self.new_p = self.old_p + self.dir
-            self.visited_pos[self.new_p.x][self.new_p.y] = True
-            self.visited_pos_list.push(self.old_p)
+            self.new_i = self.adjacency.neighbors[4*self.old_i + self.dir_id]
+            self.visited_pos[self.new_i] = True
+            self.visited_pos_list.push(self.old_i)
             # On met à jour la liste des positions visitées
 
             self.go_forward_frame += 1
 
     def drawPath(self):
+        old_i = self.old_i
+        new_i = self.new_i
+
         if self.slow:
             # Si on prend notre temps pour dessiner à l'écran, on va
             # afficher une case orange à l'ancienne position
 
-            self.etat = Map.getCell(self.old_p)
+            self.etat = self.maze.cellState(old_i)
 
-            Map.setCell(self.old_p, Map.ORANGE_CELL)
+            self.maze.setCellState(old_i, Maze.ORANGE_CELL)
 
         if self.slow:
-            Map.setCell(self.old_p, self.etat)
+            self.maze.setCellState(old_i, self.etat)
             # Maintenant qu'on a affiché la frame, on retire
             # la cellule orange
 
-        if Map.getCell(self.new_p) == Map.EMPTY:
-            Map.setCell(self.new_p, Map.SOLUTION_PATH)
+        if self.maze.cellState(new_i) == Maze.EMPTY:
+            self.maze.setCellState(new_i, Maze.SOLUTION_PATH)
 
-            if self.old_p not in (Map.start_pos, Map.goal_pos):
-                Map.setCell(self.old_p, Map.SOLUTION_PATH)
-        elif Map.getCell(self.old_p) == Map.SOLUTION_PATH or Map.getCell(self.new_p) == Map.SOLUTION_PATH:
-            if Map.getCell(self.new_p) not in (Map.START, Map.GOAL):
-                Map.setCell(self.new_p, Map.VISITED_PATH)
+            if old_i not in (self.start_i, self.goal_i):
+                self.maze.setCellState(old_i, Maze.SOLUTION_PATH)
+        elif self.maze.cellState(old_i) == Maze.SOLUTION_PATH or self.maze.cellState(new_i) == Maze.SOLUTION_PATH:
+            if self.maze.cellState(new_i) not in (Maze.START, Maze.GOAL):
+                self.maze.setCellState(new_i, Maze.VISITED_PATH)
 
-                if self.old_p not in (Map.start_pos, Map.goal_pos):
-                    Map.setCell(self.old_p, Map.VISITED_PATH)
+                if old_i not in (self.start_i, self.goal_i):
+                    self.maze.setCellState(old_i, Maze.VISITED_PATH)
 
     def checkIfFinished(self):
-        if self.old_p == Map.goal_pos or self.new_p == Map.goal_pos:
-            Map.setCell(self.old_p, Map.SOLUTION_PATH)
+        if self.old_i == self.goal_i or self.new_i == self.goal_i:
+            self.maze.setCellState(self.old_i, Maze.SOLUTION_PATH)
             self.finished = True
 
-        if self.dir is not None:
-            self.old_p = Position(self.new_p)
+        if self.dir_id != -1:
+            self.old_i = self.new_i
             # On met à jour la position
 
-            if Map.isWallPosValid(self.new_p+self.dir/2):
-                if Map.getWall(self.new_p+self.dir/2) == Map.EMPTY:
-                    if self.new_p+self.dir == Map.goal_pos:
+            next_i = self.adjacency.neighbors[4*self.new_i + self.dir_id]
+
+            if next_i != -1:
+                if self.maze.wallState(self.adjacency.walls[4*self.new_i + self.dir_id]) == Maze.EMPTY:
+                    if next_i == self.goal_i:
                         self.finished = True
             else:
-                if self.old_p == Map.goal_pos:
+                if self.old_i == self.goal_i:
                     self.finished = True
 
-    @staticmethod
-    def getRandomDirection(p:Position, visited_pos:list) -> (Direction, None):
+    def getRandomDirection(self, i:int, visited_pos:list) -> int:
         """
         Fonction permettant d'obtenir une direction aléatoire valide.
 
         INPUT :
-            p : Position, une position
-            visited_pos : list liste tuple, la liste des cases déjà visitées
+            i : int, indice d'une cellule
+            visited_pos : list bool, pour chaque indice de cellule, si elle a
+                          déjà été visitée
 
         OUTPUT :
-            res : Direction ou None si aucune direction n'est valide
+            res : int, indice de la direction (cf Direction.id), ou -1 si
+                  aucune direction n'est valide
         """
 
-        list_dir = Direction.getRandomDirectionList()
-        # On récupère les directions triées aléatoirement
+        neighbors = self.adjacency.neighbors
+        walls = self.adjacency.walls
+
+        res = -1
 
-        res = None
+        for dir_id in Direction.getRandomIdList(self.rng):
+            # On parcourt les directions triées aléatoirement
 
-        for dir in list_dir:
-            new_p = p + dir
+            new_i = neighbors[4*i + dir_id]
 
-            if Map.isCellPosValid(new_p):
+            if new_i != -1:
                 # Si la nouvelle case est bien dans le plateau
 
-                if not visited_pos[new_p.x][new_p.y]:
+                if not visited_pos[new_i]:
                     # Si cette nouvelle case n'a jamais été visitée
 
-                    if Map.getWall(p + dir/2) == Map.EMPTY:
+                    if self.maze.wallState(walls[4*i + dir_id]) == Maze.EMPTY:
                         # S'il n'y a pas de mur
 
-                        res = dir
+                        res = dir_id
 
         return res
 
-    @staticmethod
-    def createList() -> list:
+    def createList(self) -> list:
         """
         Fonction permettant de créer la liste des positions visitées.
 
@@ -139,20 +152,8 @@ class Resolution(GenericResolution):
             None
 
         OUTPUT :
-            visited_pos : list list tuple, tableau à 2 dimensions
-                          des positions visitées
+            visited_pos : list bool, pour chaque indice de cellule, si elle a
+                          déjà été visitée
         """
 
-        visited_pos = []
-
-        for x in range(Map.width):
-            # Création de la grille
-
-            line = []
-
-            for y in range(Map.height):
-                line.append(False)
-
-            visited_pos.append(line)
-
-        return visited_pos
+        return [False]*(self.maze.width*self.maze.height)
@@ -8,38 +8,47 @@ if __name__ == "__main__":
 
 from resolution.generic_resolution import GenericResolution
 
-from environment.direction import Direction
-from environment.map import Map
-from environment.position import Position
+from environment.maze import Maze
 import random
 import time
 
 class Resolution(GenericResolution):
-    def __init__(self):
-        super().__init__("Right hand rule")
+    def __init__(self, **options):
+        super().__init__("Right hand rule", **options)
 
     def init(self):
-        self.new_p = Position(Map.start_pos)
+        self.start_i = self.maze.cellId(self.maze.start_pos)
+        self.goal_i = self.maze.cellId(self.maze.goal_pos)
+
+        self.new_i = self.start_i
 
         self.dir_id = 0
         self.increment_direction_id = 1
         # Mettre à 3 pour avoir la main gauche
-        self.old_p = Position(self.new_p)
+        self.old_i = self.new_i
 
         self.nb_iter = 0
 
+        self.neighbors = self.maze.adjacency.neighbors
+        self.walls = self.maze.adjacency.walls
+        # Table des voisines, lue une seule fois
+
     def applyAlgorith(self):
-        left_dir  = Direction.all_directions[(self.dir_id + self.increment_direction_id)%4]
-        front_dir = Direction.all_directions[self.dir_id%4]
+        neighbors = self.neighbors
+        walls = self.walls
+
+        left_id  = 4*self.new_i + (self.dir_id + self.increment_direction_id)%4
+        front_id = 4*self.new_i + self.dir_id%4
+        # Cases de la cellule courante dans la table des voisines
 
         self.move_forward = True
 
-        if Map.isWallPosValid(self.new_p + left_dir/2) and Map.getWall(self.new_p + left_dir/2) == Map.EMPTY:
+        if neighbors[left_id] != -1 and self.maze.wallState(walls[left_id]) == Maze.EMPTY:
             # Si le mur de droite est valide et est vide...
 
             self.dir_id += self.increment_direction_id
             # On tourne dans la direction choisie
-        elif not Map.isCellPosValid(self.new_p + front_dir) or Map.getWall(self.new_p + front_dir/2) == Map.WALL:
+        elif neighbors[front_id] == -1 or self.maze.wallState(walls[front_id]) == Maze.WALL:
             # Sinon si la case devant est hors du plateau ou il y a un mur en face...
 
             self.dir_id += (self.increment_direction_id+2)%4
@@ -47,44 +56,43 @@ class Resolution(GenericResolution):
 
             self.move_forward = False
 
-        left_dir  = Direction.all_directions[(self.dir_id + self.increment_direction_id)%4]
-        front_dir = Direction.all_directions[self.dir_id%4]
-        # On recalcule les directions
-
         if self.move_forward:
             # S'il faut avancer on avance
-            self.old_p = Position(self.new_p)
-            self.new_p = self.new_p + front_dir
+            self.old_i = self.new_i
+            self.new_i = neighbors[4*self.new_i + self.dir_id%4]
             self.go_forward_frame += 1
 
         self.nb_iter += 1
 
-        if self.nb_iter == 4*Map.width*Map.height:
+        if self.nb_iter == 4*self.maze.width*self.maze.height:
             raise GenericResolution.NoSolutionError()
 
     def drawPath(self):
+        old_i = self.old_i
+        new_i = self.new_i
+
         if self.slow:
-            self.current_state = Map.getCell(self.new_p)
-            Map.setCell(self.new_p, Map.ORANGE_CELL)
+            self.current_state = self.maze.cellState(new_i)
+            self.maze.setCellState(new_i, Maze.ORANGE_CELL)
 
         if self.slow:
-            Map.setCell(self.new_p, self.current_state)
+            self.maze.setCellState(new_i, self.current_state)
 
         if self.move_forward:
-            if Map.getCell(self.new_p) == Map.EMPTY:
-                Map.setCell(self.new_p, Map.SOLUTION_PATH)
+            if self.maze.cellState(new_i) == Maze.EMPTY:
+                self.maze.setCellState(new_i, Maze.SOLUTION_PATH)
 
-                if self.old_p not in (Map.start_pos, Map.goal_pos):
-                    Map.setCell(self.old_p, Map.SOLUTION_PATH)
-            elif Map.getCell(self.old_p) == Map.SOLUTION_PATH or Map.getCell(self.new_p) == Map.SOLUTION_PATH:
-                if Map.getCell(self.new_p) not in (Map.START, Map.GOAL):
-                    Map.setCell(self.new_p, Map.VISITED_PATH)
+                if old_i not in (self.start_i, self.goal_i):
+                    self.maze.setCellState(old_i, Maze.SOLUTION_PATH)
+            elif self.maze.cellState(old_i) == Maze.SOLUTION_PATH or self.maze.cellState(new_i) == Maze.SOLUTION_PATH:
+                if self.maze.cellState(new_i) not in (Maze.START, Maze.GOAL):
+                    self.maze.setCellState(new_i, Maze.VISITED_PATH)
 
-                    if self.old_p not in (Map.start_pos, Map.goal_pos):
-                        Map.setCell(self.old_p, Map.VISITED_PATH)
+                    if old_i not in (self.start_i, self.goal_i):
+                        self.maze.setCellState(old_i, Maze.VISITED_PATH)
 
     def checkIfFinished(self):
-        if self.new_p == Map.goal_pos:
+        if self.new_i == self.goal_i:
             self.finished = True
 
-            Map.setCell(self.old_p, Map.SOLUTION_PATH)
+            self.maze.setCellState(self.old_i, Maze.SOLUTION_PATH)